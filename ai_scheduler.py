@@ -0,0 +1,105 @@
+"""
+Level-of-detail scheduling of enemy AI updates
+"""
+import time
+from constants import *
+
+TIER_ACTIVE = 'active'
+TIER_DISTANT = 'distant'
+TIER_DORMANT = 'dormant'
+
+
+class AIScheduler:
+    """Decides which sprite enemies run their AI each tick, by distance to the player
+    
+    Enemies within near_distance update every tick. Those within
+    far_distance update about once every interval ticks, catching up with
+    one longer move; a tick runs at most a 1/interval share of them, so
+    their updates spread evenly over the ticks in between. Enemies beyond
+    far_distance are dormant and do not move until the player comes closer.
+    
+    budget caps the distant updates run per tick; enemies left over are
+    the most overdue next tick, so the cost of a tick stays flat however
+    many enemies are far away. budget_ms adds a wall-clock cap as well,
+    which makes runs depend on machine speed. Snapshots keep each enemy's
+    ai_tick, so replays and restored snapshots reproduce exactly as long as
+    budget_ms is unset.
+    """
+    
+    def __init__(self, near_distance=AI_NEAR_DISTANCE, far_distance=AI_FAR_DISTANCE,
+                 interval=AI_DISTANT_INTERVAL, budget=AI_TICK_BUDGET, budget_ms=None):
+        self.near_distance = near_distance
+        self.far_distance = far_distance
+        self.interval = interval
+        self.budget = budget
+        self.budget_ms = budget_ms
+        
+        # Statistics for the last tick
+        self.counts = {TIER_ACTIVE: 0, TIER_DISTANT: 0, TIER_DORMANT: 0}
+        self.updated = 0
+        self.deferred = 0
+        self.update_ms = 0.0
+    
+    def tier(self, enemy, target):
+        """Get the tier an enemy is in for a target position"""
+        dx = enemy.rect.centerx - target.rect.centerx
+        dy = enemy.rect.centery - target.rect.centery
+        distance = dx * dx + dy * dy
+        if distance <= self.near_distance * self.near_distance:
+            return TIER_ACTIVE
+        if distance <= self.far_distance * self.far_distance:
+            return TIER_DISTANT
+        return TIER_DORMANT
+    
+    def update(self, enemies, target, tick, update_enemy):
+        """Run this tick's enemy updates; update_enemy(enemy, ticks) moves one enemy
+        
+        ticks is how many simulation ticks the update stands for. Returns the
+        number of enemies updated.
+        """
+        start = time.perf_counter()
+        interval = self.interval
+        active = dormant = 0
+        due = []
+        for enemy in enemies:
+            if enemy.ai_tick is None:
+                enemy.ai_tick = tick - 1
+            tier = self.tier(enemy, target)
+            if tier == TIER_ACTIVE:
+                update_enemy(enemy, tick - enemy.ai_tick)
+                enemy.ai_tick = tick
+                active += 1
+            elif tier == TIER_DISTANT:
+                if tick - enemy.ai_tick >= interval:
+                    due.append(enemy)
+            else:
+                # Dormant enemies do not build up ticks to catch up on when they wake
+                enemy.ai_tick = tick
+                dormant += 1
+        
+        # A share of the distant tier per tick, most overdue first, so enemies
+        # that went distant together drift apart onto different ticks
+        distant = len(enemies) - active - dormant
+        quota = -(-distant // interval)
+        if self.budget is not None:
+            quota = min(quota, self.budget)
+        due.sort(key=lambda enemy: enemy.ai_tick)
+        deadline = None if self.budget_ms is None else start + self.budget_ms / 1000
+        updated = 0
+        for enemy in due[:quota]:
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+            update_enemy(enemy, tick - enemy.ai_tick)
+            enemy.ai_tick = tick
+            updated += 1
+        
+        self.counts = {TIER_ACTIVE: active, TIER_DISTANT: distant, TIER_DORMANT: dormant}
+        self.updated = active + updated
+        self.deferred = len(due) - updated
+        self.update_ms = (time.perf_counter() - start) * 1000
+        return self.updated
+    
+    def stats(self):
+        """Get per-tier enemy counts and the work done on the last tick"""
+        return dict(self.counts, updated=self.updated, deferred=self.deferred,
+                    update_ms=self.update_ms)
@@ -0,0 +1,212 @@
+"""
+Central asset manager: resolves, loads and caches sprite sheets once
+
+Sheets are decoded at most once per process, can be preloaded from a
+manifest on a background thread, and the pixels of the frames actually
+used are persisted in a cache file that later runs memory-map instead of
+decoding the PNG again.
+
+Cache file layout (little-endian): a HEADER, then per entry an ENTRY record
+followed by its key, then the raw RGBA pixels of every entry.
+"""
+import mmap
+import os
+import struct
+import threading
+
+import pygame
+from constants import *
+
+ASSET_ROOT = os.path.dirname(os.path.abspath(__file__))
+CACHE_PATH = os.path.join(ASSET_ROOT, 'resources', '.cache', 'frames.bin')
+
+MAGIC = b'PGAC'
+VERSION = 1
+# magic, version, entry count
+HEADER = struct.Struct('<4sBI')
+# key length, source mtime (ns), source size, width, height, pixel offset
+ENTRY = struct.Struct('<HqqHHQ')
+
+CHARACTER_SHEET = os.path.join('resources', 'sprites', 'character-spritesheet.png')
+
+# Sheets loaded while the start menu shows: (path, frame size, rows, columns)
+MANIFEST = [
+    (CHARACTER_SHEET, SPRITE_FRAME_SIZE, 4, 9),
+]
+
+
+class AssetManager:
+    """Loads each sprite sheet once, from the disk cache when it is still fresh
+    
+    Sheets are cropped to the rows and columns of frames requested, so only
+    the pixels that are sliced into frames are kept and cached. Surfaces
+    are returned unconverted; callers convert them once a display exists.
+    """
+    
+    def __init__(self, root=ASSET_ROOT, cache_path=CACHE_PATH):
+        self.root = root
+        self.cache_path = cache_path
+        self.lock = threading.Lock()
+        self.sheets = {}  # key -> Surface
+        self.pending = {}  # key -> Event set once an in-flight load finishes
+        self.paths = {}  # path -> whether it exists
+        # Cache file contents: key -> (mtime, size, width, height, RGBA buffer)
+        self.entries = None
+        self.mapped = None  # mmap of the cache file, kept open while its pixels are used
+        self.thread = None
+        self.decoded = 0
+        self.disk_hits = 0
+    
+    def resolve(self, path):
+        """Get the absolute path of an asset relative to the game directory"""
+        return path if os.path.isabs(path) else os.path.join(self.root, path)
+    
+    def exists(self, path):
+        """Check if an asset file exists, asking the file system only once"""
+        path = self.resolve(path)
+        found = self.paths.get(path)
+        if found is None:
+            found = self.paths[path] = os.path.exists(path)
+        return found
+    
+    def load_sheet(self, path, frame_size, rows, columns):
+        """Get the decoded sheet cropped to rows x columns frames, loading it only once
+        
+        A load already running on another thread is waited for, not repeated.
+        """
+        path = self.resolve(path)
+        key = f"{os.path.relpath(path, self.root)}|{frame_size}|{rows}|{columns}"
+        with self.lock:
+            sheet = self.sheets.get(key)
+            if sheet is not None:
+                return sheet
+            event = self.pending.get(key)
+            loading = event is None
+            if loading:
+                event = self.pending[key] = threading.Event()
+        
+        if not loading:
+            event.wait()
+            if key not in self.sheets:
+                raise FileNotFoundError(f"Sprite sheet not found: {path}")
+            return self.sheets[key]
+        
+        try:
+            sheet = self.read_cached(key, path)
+            if sheet is None:
+                sheet = self.decode(key, path, frame_size, rows, columns)
+            with self.lock:
+                self.sheets[key] = sheet
+            return sheet
+        finally:
+            with self.lock:
+                del self.pending[key]
+            event.set()
+    
+    def decode(self, key, path, frame_size, rows, columns):
+        """Decode a sheet from its image file, crop it and add it to the cache file"""
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Sprite sheet not found: {path}")
+        stat = os.stat(path)
+        image = pygame.image.load(path)
+        width = min(image.get_width(), columns * frame_size)
+        height = min(image.get_height(), rows * frame_size)
+        pixels = pygame.image.tobytes(image.subsurface((0, 0, width, height)), 'RGBA')
+        self.decoded += 1
+        
+        with self.lock:
+            self.open_cache()
+            self.entries[key] = (stat.st_mtime_ns, stat.st_size, width, height, pixels)
+            self.write_cache()
+        return pygame.image.frombuffer(pixels, (width, height), 'RGBA')
+    
+    def read_cached(self, key, path):
+        """Get a sheet from the cache file without copying it, or None if absent or stale"""
+        with self.lock:
+            self.open_cache()
+            entry = self.entries.get(key)
+        if entry is None:
+            return None
+        mtime, size, width, height, pixels = entry
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        if (stat.st_mtime_ns, stat.st_size) != (mtime, size):
+            return None
+        self.disk_hits += 1
+        return pygame.image.frombuffer(pixels, (width, height), 'RGBA')
+    
+    def open_cache(self):
+        """Map the cache file and index its entries (once; call with the lock held)"""
+        if self.entries is not None:
+            return
+        self.entries = {}
+        try:
+            with open(self.cache_path, 'rb') as f:
+                self.mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return
+        data = memoryview(self.mapped)
+        try:
+            magic, version, count = HEADER.unpack_from(data)
+            if magic != MAGIC or version != VERSION:
+                return
+            offset = HEADER.size
+            for _ in range(count):
+                key_length, mtime, size, width, height, pixel_offset = ENTRY.unpack_from(data, offset)
+                offset += ENTRY.size
+                key = bytes(data[offset:offset + key_length]).decode()
+                offset += key_length
+                pixels = data[pixel_offset:pixel_offset + width * height * 4]
+                self.entries[key] = (mtime, size, width, height, pixels)
+        except (struct.error, UnicodeDecodeError):
+            # A truncated or corrupt file is ignored and rewritten on the next decode
+            self.entries = {}
+    
+    def write_cache(self):
+        """Rewrite the cache file with every known entry (call with the lock held)"""
+        keys = [key.encode() for key in self.entries]
+        offset = HEADER.size + sum(ENTRY.size + len(key) for key in keys)
+        index = [HEADER.pack(MAGIC, VERSION, len(keys))]
+        blobs = []
+        for key, (mtime, size, width, height, pixels) in zip(keys, self.entries.values()):
+            index.append(ENTRY.pack(len(key), mtime, size, width, height, offset) + key)
+            blobs.append(pixels)
+            offset += width * height * 4
+        
+        # Write a new file and swap it in; maps of the old file stay valid
+        temp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with open(temp_path, 'wb') as f:
+                f.writelines(index + blobs)
+            os.replace(temp_path, self.cache_path)
+        except OSError:
+            # The cache only speeds up startup; a read-only install still works
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+    
+    def preload(self, manifest=MANIFEST):
+        """Load every sheet in a manifest on a background thread and return the thread"""
+        def load_all():
+            for path, frame_size, rows, columns in manifest:
+                if self.exists(path):
+                    self.load_sheet(path, frame_size, rows, columns)
+        
+        self.thread = threading.Thread(target=load_all, name='asset-preload', daemon=True)
+        self.thread.start()
+        return self.thread
+    
+    def loading(self):
+        """Check if a preload is still running in the background"""
+        return self.thread is not None and self.thread.is_alive()
+    
+    def wait(self):
+        """Block until a running preload has finished"""
+        if self.thread is not None:
+            self.thread.join()
+
+
+# Shared by the whole game
+assets = AssetManager()
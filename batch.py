@@ -0,0 +1,131 @@
+"""
+Batch runner that plays many headless games in parallel for balance tuning
+
+Each job is a dict with optional keys:
+    'params'    - overrides of simulation.DEFAULT_PARAMS (e.g. spawn_interval)
+    'seed'      - seed for the random player policy, or the scripted one's first direction
+    'policy'    - 'random' or 'scripted'
+    'max_ticks' - tick limit if the player survives
+Jobs are sharded across a ProcessPoolExecutor with one worker per core and
+each returns a small result record.
+"""
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+from constants import *
+from simulation import Simulation
+from replay import ReplayKeys, KEY_BITS
+
+DEFAULT_MAX_TICKS = 60 * SIM_TICK_RATE  # One minute of game time
+MOVE_BITS = [bit for _, bit in KEY_BITS]
+
+
+class ScriptedPolicy:
+    """Walks a fixed loop of directions, starting at the seed's, shooting at a steady rate"""
+    
+    def __init__(self, seed=0):
+        self.offset = seed % len(MOVE_BITS)
+        self.keys = ReplayKeys()
+    
+    def act(self, sim):
+        """Get (keys, shoot) for the next tick"""
+        self.keys.bits = MOVE_BITS[(sim.ticks // SIM_TICK_RATE + self.offset) % len(MOVE_BITS)]
+        return self.keys, sim.ticks % 15 == 0
+
+
+class RandomPolicy:
+    """Changes to a random direction every half second and shoots at random"""
+    
+    def __init__(self, seed=0):
+        self.rng = random.Random(seed)
+        self.keys = ReplayKeys()
+    
+    def act(self, sim):
+        """Get (keys, shoot) for the next tick"""
+        if sim.ticks % (SIM_TICK_RATE // 2) == 0:
+            self.keys.bits = self.rng.choice(MOVE_BITS + [0])
+        return self.keys, self.rng.random() < 0.1
+
+
+POLICIES = {'random': RandomPolicy, 'scripted': ScriptedPolicy}
+
+
+def run_job(job):
+    """Play one headless game and return its result record"""
+    params = job.get('params', {})
+    seed = job.get('seed', 0)
+    max_ticks = job.get('max_ticks', DEFAULT_MAX_TICKS)
+    policy = POLICIES[job.get('policy', 'random')](seed)
+    sim = Simulation(use_swarm=False, params=params)
+    
+    start = time.perf_counter()
+    while sim.ticks < max_ticks:
+        keys, shoot = policy.act(sim)
+        if sim.tick(keys, shoot):
+            break
+    elapsed = time.perf_counter() - start
+    
+    return {
+        'params': params,
+        'seed': seed,
+        'survived': sim.player.health > 0,
+        'survival_time': sim.ticks / sim.tick_rate,  # seconds of game time
+        'kills': sim.kills,
+        'damage_taken': sim.damage_taken,
+        'generators_destroyed': sim.generators_destroyed,
+        'ticks_per_sec': sim.ticks / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def run_batch(jobs, workers=None):
+    """Run jobs across one process per core and return results in job order"""
+    jobs = list(jobs)
+    workers = workers or os.cpu_count() or 1
+    # A few chunks per worker keeps processes busy without per-job overhead
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run_job, jobs, chunksize=chunksize))
+
+
+def parameter_sweep(grid, seeds, **job_options):
+    """Build one job per combination of grid values and seed
+    
+    grid maps parameter names to lists of values to try.
+    """
+    names = sorted(grid)
+    jobs = []
+    for values in product(*(grid[name] for name in names)):
+        for seed in seeds:
+            jobs.append(dict(job_options, params=dict(zip(names, values)), seed=seed))
+    return jobs
+
+
+def main(argv):
+    """Sweep spawn interval and enemy speed and print averages per setting"""
+    seeds = range(int(argv[0]) if argv else 4)
+    grid = {'spawn_interval': [1500, 3000], 'enemy_speed': [1, 2, 3]}
+    jobs = parameter_sweep(grid, seeds, max_ticks=30 * SIM_TICK_RATE)
+    
+    start = time.perf_counter()
+    results = run_batch(jobs)
+    elapsed = time.perf_counter() - start
+    print(f"Ran {len(results)} games in {elapsed:.1f} s on {os.cpu_count()} cores")
+    
+    print(f"{'spawn_interval':>14} {'enemy_speed':>11} {'survival s':>10} {'kills':>6} "
+          f"{'damage':>7} {'ticks/sec':>10}")
+    for values in product(grid['spawn_interval'], grid['enemy_speed']):
+        params = {'spawn_interval': values[0], 'enemy_speed': values[1]}
+        group = [r for r in results if r['params'] == params]
+        mean = lambda field: sum(r[field] for r in group) / len(group)
+        print(f"{values[0]:>14} {values[1]:>11} {mean('survival_time'):>10.1f} "
+              f"{mean('kills'):>6.1f} {mean('damage_taken'):>7.1f} {mean('ticks_per_sec'):>10,.0f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,82 @@
+"""
+Benchmark per-tick enemy AI cost on a large map: every enemy every tick vs. the AI scheduler
+"""
+import os
+import random
+import time
+
+# Set up for headless runs
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+import pygame
+from constants import *
+from enemy import Enemy
+from game_map import GameMap
+from flow_field import FlowField
+from ai_scheduler import AIScheduler
+
+MAP_SIZE = 160  # tiles per side
+ENEMY_COUNTS = [1000, 5000, 20000]
+TICKS = 60
+FRAME_BUDGET_MS = 1000 / FPS
+
+class Target:
+    """Stand-in for the player, walking slowly to the right"""
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(x, y, 28, 28)
+
+def spawn_enemies(game_map, count, rng):
+    """Place enemies on random floor tiles"""
+    floor = [(x, y) for y in range(game_map.height) for x in range(game_map.width)
+             if not game_map.is_solid(x, y)]
+    enemies = []
+    for _ in range(count):
+        tile_x, tile_y = rng.choice(floor)
+        enemies.append(Enemy(tile_x * TILE_SIZE + 2, tile_y * TILE_SIZE + 2))
+    return enemies
+
+def time_ticks(game_map, enemies, scheduler):
+    """Average and worst milliseconds per tick of enemy AI"""
+    target = Target(game_map.width * TILE_SIZE // 2, game_map.height * TILE_SIZE // 2)
+    field = FlowField(game_map)
+    walls = game_map.walls
+    
+    def update_enemy(enemy, ticks=1):
+        enemy.update(target, walls, game_map, field, ticks=ticks)
+    
+    times = []
+    for tick in range(1, TICKS + 1):
+        target.rect.x += 1
+        field.update(target)  # Shared by both modes, so left out of the timing
+        start = time.perf_counter()
+        if scheduler is None:
+            for enemy in enemies:
+                update_enemy(enemy)
+        else:
+            scheduler.update(enemies, target, tick, update_enemy)
+        times.append((time.perf_counter() - start) * 1000)
+    return sum(times) / len(times), max(times[1:])
+
+def run_benchmark():
+    """Print per-tick AI cost with and without level of detail"""
+    pygame.init()
+    rng = random.Random(1)
+    game_map = GameMap(MAP_SIZE, MAP_SIZE)
+    print(f"{MAP_SIZE}x{MAP_SIZE} tile map, frame budget {FRAME_BUDGET_MS:.1f} ms")
+    print(f"{'enemies':>8} {'all ms/tick':>12} {'worst':>8} {'LOD ms/tick':>12} {'worst':>8} "
+          f"{'active':>7} {'distant':>8} {'dormant':>8}")
+    for count in ENEMY_COUNTS:
+        enemies = spawn_enemies(game_map, count, rng)
+        all_ms, all_worst = time_ticks(game_map, enemies, None)
+        enemies = spawn_enemies(game_map, count, rng)
+        scheduler = AIScheduler()
+        lod_ms, lod_worst = time_ticks(game_map, enemies, scheduler)
+        counts = scheduler.counts
+        print(f"{count:>8} {all_ms:>12.2f} {all_worst:>8.2f} {lod_ms:>12.2f} {lod_worst:>8.2f} "
+              f"{counts['active']:>7} {counts['distant']:>8} {counts['dormant']:>8}")
+    
+    pygame.quit()
+
+if __name__ == "__main__":
+    run_benchmark()
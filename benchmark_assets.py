@@ -0,0 +1,32 @@
+"""
+Benchmark sprite sheet loading: PNG decode vs. the memory-mapped frame cache
+"""
+import os
+import tempfile
+import time
+
+import pygame
+from constants import *
+from assets import AssetManager, CHARACTER_SHEET
+
+def timed_load(cache_path):
+    """Load the character sheet with a fresh manager and return (ms, manager)"""
+    manager = AssetManager(cache_path=cache_path)
+    start = time.perf_counter()
+    manager.load_sheet(CHARACTER_SHEET, SPRITE_FRAME_SIZE, 4, 9)
+    return (time.perf_counter() - start) * 1000, manager
+
+if __name__ == "__main__":
+    pygame.init()
+    with tempfile.TemporaryDirectory() as folder:
+        cache_path = os.path.join(folder, 'frames.bin')
+        cold_ms, _ = timed_load(cache_path)
+        warm_ms, manager = timed_load(cache_path)
+        start = time.perf_counter()
+        manager.load_sheet(CHARACTER_SHEET, SPRITE_FRAME_SIZE, 4, 9)
+        memory_ms = (time.perf_counter() - start) * 1000
+        print(f"PNG decode + cache write: {cold_ms:8.3f} ms")
+        print(f"Memory-mapped cache:      {warm_ms:8.3f} ms ({cold_ms / warm_ms:.0f}x faster)")
+        print(f"Already loaded:           {memory_ms:8.3f} ms")
+        print(f"Cache file: {os.path.getsize(cache_path):,} bytes")
+    pygame.quit()
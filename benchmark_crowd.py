@@ -0,0 +1,89 @@
+"""
+Benchmark crowd separation: the batched grid pass vs. a pairwise loop over every enemy
+"""
+import math
+import os
+import random
+import time
+
+# Set up for headless runs
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+import numpy as np
+import pygame
+from constants import *
+from crowd import CrowdSeparation
+
+ENEMY_COUNTS = [250, 1000, 5000, 20000, 50000]
+PAIRWISE_LIMIT = 1000  # The pairwise loop is too slow to time beyond this
+DENSITY = 0.5  # Enemies per tile of the square they are scattered over
+REPEATS = 5
+FRAME_BUDGET_MS = 1000 / FPS
+
+def pairwise_separation(x, y, radius, strength, max_push):
+    """Separation forces computed pair by pair in plain Python"""
+    push_x = [0.0] * len(x)
+    push_y = [0.0] * len(x)
+    for i in range(len(x)):
+        for j in range(len(x)):
+            dx = x[i] - x[j]
+            dy = y[i] - y[j]
+            distance = math.hypot(dx, dy)
+            if i != j and 0 < distance < radius:
+                force = strength * (radius - distance) / distance
+                push_x[i] += dx * force
+                push_y[i] += dy * force
+    for i in range(len(x)):
+        length = math.hypot(push_x[i], push_y[i])
+        if length > max_push:
+            push_x[i] *= max_push / length
+            push_y[i] *= max_push / length
+    return push_x, push_y
+
+def scatter(count, rng):
+    """Random enemy top-lefts over a square holding count enemies at DENSITY"""
+    side = int(math.sqrt(count / DENSITY)) * TILE_SIZE
+    x = np.array([rng.randrange(side) for _ in range(count)], dtype=np.int32)
+    y = np.array([rng.randrange(side) for _ in range(count)], dtype=np.int32)
+    return x, y
+
+def best_ms(function, *args):
+    """Fastest of REPEATS runs in milliseconds"""
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        function(*args)
+        times.append((time.perf_counter() - start) * 1000)
+    return min(times)
+
+def run_benchmark():
+    """Print separation cost per tick at each crowd size"""
+    pygame.init()
+    rng = random.Random(1)
+    crowd = CrowdSeparation()
+    print(f"{DENSITY} enemies per tile, frame budget {FRAME_BUDGET_MS:.1f} ms")
+    print(f"{'enemies':>8} {'pairwise ms':>12} {'batched ms':>11} {'speedup':>8} {'contacts':>9}")
+    for count in ENEMY_COUNTS:
+        x, y = scatter(count, rng)
+        batched_ms = best_ms(crowd.separate, x, y)
+        if count <= PAIRWISE_LIMIT:
+            args = (x.tolist(), y.tolist(), crowd.radius, crowd.strength, crowd.max_push)
+            pairwise_ms = best_ms(pairwise_separation, *args)
+            pairwise = f"{pairwise_ms:>12.1f}"
+            speedup = f"{pairwise_ms / batched_ms:>7.0f}x"
+        else:
+            pairwise = f"{'-':>12}"
+            speedup = f"{'-':>8}"
+        print(f"{count:>8} {pairwise} {batched_ms:>11.2f} {speedup} {crowd.contacts:>9}")
+    
+    # Worst case: everything spawned on one tile, where each cell read is capped
+    x = np.full(ENEMY_COUNTS[-1], 5 * TILE_SIZE, dtype=np.int32)
+    y = np.full(ENEMY_COUNTS[-1], 5 * TILE_SIZE, dtype=np.int32)
+    stacked_ms = best_ms(crowd.separate, x, y)
+    print(f"{ENEMY_COUNTS[-1]} enemies on one spot: {stacked_ms:.2f} ms ({crowd.pairs} pairs read)")
+    
+    pygame.quit()
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,126 @@
+"""
+Benchmark per-tick enemy AI cost: greedy steering vs. the shared flow field,
+and the cost of keeping the field up to date as walls change on a large map
+"""
+import os
+import random
+import time
+
+# Set up for headless runs
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+import pygame
+from constants import *
+from enemy import Enemy
+from player import Player
+from game_map import GameMap
+from flow_field import FlowField
+
+ENEMY_COUNTS = [100, 1000, 10000]
+TICKS = 10
+LARGE_MAP_SIZE = 500
+WALL_CHANGES = 1000
+
+class Target:
+    """Stand-in for the player on a tile"""
+    def __init__(self, tile_x, tile_y):
+        self.rect = pygame.Rect(tile_x * TILE_SIZE, tile_y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+
+def spawn_enemies(game_map, count, rng):
+    """Place enemies on random floor tiles"""
+    floor = [(x, y) for y in range(game_map.height) for x in range(game_map.width)
+             if not game_map.is_solid(x, y)]
+    enemies = []
+    for _ in range(count):
+        tile_x, tile_y = rng.choice(floor)
+        enemies.append(Enemy(tile_x * TILE_SIZE + 2, tile_y * TILE_SIZE + 2))
+    return enemies
+
+def time_ticks(game_map, player, enemies, flow_field):
+    """Average milliseconds per tick of enemy AI"""
+    walls = game_map.walls
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        if flow_field is not None:
+            flow_field.update(player)
+        for enemy in enemies:
+            enemy.update(player, walls, game_map, flow_field)
+    return (time.perf_counter() - start) * 1000 / TICKS
+
+def run_benchmark():
+    """Print per-tick AI cost for both steering modes"""
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))  # Needed to load the player sprite
+    rng = random.Random(1)
+    game_map = GameMap()
+    player = Player(PLAYER_START_X * TILE_SIZE, PLAYER_START_Y * TILE_SIZE)
+    
+    flow_field = FlowField(game_map)
+    start = time.perf_counter()
+    flow_field.update(player)
+    recompute_ms = (time.perf_counter() - start) * 1000
+    print(f"Flow field recompute ({game_map.width}x{game_map.height} tiles): {recompute_ms:.2f} ms")
+    print()
+    
+    print(f"{'enemies':>8} {'greedy ms/tick':>15} {'flow ms/tick':>13}")
+    for count in ENEMY_COUNTS:
+        enemies = spawn_enemies(game_map, count, rng)
+        greedy_ms = time_ticks(game_map, player, enemies, None)
+        enemies = spawn_enemies(game_map, count, rng)
+        flow_ms = time_ticks(game_map, player, enemies, flow_field)
+        print(f"{count:>8} {greedy_ms:>15.2f} {flow_ms:>13.2f}")
+    print()
+    
+    run_repair_benchmark(rng)
+    pygame.quit()
+
+def run_repair_benchmark(rng):
+    """Print the cost of single-tile wall changes on a large map: repair vs. full search"""
+    size = LARGE_MAP_SIZE
+    game_map = GameMap(size, size)
+    # Scatter walls so paths have to wind around them
+    for _ in range(size * size // 10):
+        game_map.set_tile(rng.randrange(1, size - 1), rng.randrange(1, size - 1), TILE_WALL)
+    target = Target(size // 2, size // 2)
+    game_map.set_tile(size // 2, size // 2, TILE_FLOOR)
+    flow_field = FlowField(game_map)
+    flow_field.update(target)
+    print(f"Flow field search ({size}x{size} tiles): {flow_field.update_ms:.2f} ms")
+    
+    times = []
+    cells = []
+    for _ in range(WALL_CHANGES):
+        tile_x, tile_y = rng.randrange(1, size - 1), rng.randrange(1, size - 1)
+        if (tile_x, tile_y) == flow_field.target_tile:
+            continue
+        tile = TILE_FLOOR if game_map.is_solid(tile_x, tile_y) else TILE_WALL
+        game_map.set_tile(tile_x, tile_y, tile)
+        flow_field.update(target)
+        times.append(flow_field.update_ms)
+        cells.append(flow_field.cells_touched)
+    times.sort()
+    print(f"Single-tile wall changes repaired ({len(times)}): "
+          f"median {times[len(times) // 2]:.3f} ms, 99th percentile {times[len(times) * 99 // 100]:.3f} ms, "
+          f"max {times[-1]:.3f} ms, {sum(cells) / len(cells):.1f} tiles touched on average")
+    
+    while flow_field.stats()['repairing']:
+        flow_field.update(target)
+    
+    start = time.perf_counter()
+    flow_field.recompute()
+    print(f"Full search after the same changes: {(time.perf_counter() - start) * 1000:.2f} ms")
+    
+    # The player stepping onto the next tile starts a search spread over updates
+    target = Target(size // 2 + 1, size // 2)
+    game_map.set_tile(size // 2 + 1, size // 2, TILE_FLOOR)
+    flow_field.update(target)
+    times = [flow_field.update_ms]
+    while flow_field.stats()['rebuilding']:
+        flow_field.update(target)
+        times.append(flow_field.update_ms)
+    print(f"Target moved one tile: rebuilt over {len(times)} updates of "
+          f"{flow_field.rebuild_budget} tiles, max {max(times):.3f} ms per update")
+
+if __name__ == "__main__":
+    run_benchmark()
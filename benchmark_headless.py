@@ -0,0 +1,45 @@
+"""
+Throughput benchmark for the headless simulation core (no display, no rendering)
+"""
+import time
+
+import pygame
+from constants import *
+from simulation import Simulation
+
+TICKS = 5000
+MOVES = [pygame.K_RIGHT, pygame.K_DOWN, pygame.K_LEFT, pygame.K_UP]
+
+class ScriptedKeys:
+    """Holds one arrow key, switching direction every second of game time"""
+    
+    def __init__(self):
+        self.key = MOVES[0]
+    
+    def __getitem__(self, key):
+        return key == self.key
+    
+    def choose(self, tick):
+        self.key = MOVES[(tick // SIM_TICK_RATE) % len(MOVES)]
+
+def run_benchmark(use_swarm=False):
+    """Step the simulation as fast as possible and print ticks per second"""
+    sim = Simulation(use_swarm=use_swarm)
+    keys = ScriptedKeys()
+    
+    start = time.perf_counter()
+    for tick in range(TICKS):
+        keys.choose(tick)
+        if sim.tick(keys, shoot=tick % 15 == 0):
+            sim.reset()
+    elapsed = time.perf_counter() - start
+    
+    mode = "swarm" if use_swarm else "sprites"
+    print(f"{mode:>8}: {TICKS} ticks in {elapsed:.2f} s = {TICKS / elapsed:,.0f} ticks/sec "
+          f"({TICKS / elapsed / SIM_TICK_RATE:.0f}x real time), "
+          f"{len(sim.enemies) + (len(sim.swarm) if sim.swarm is not None else 0)} enemies alive")
+    assert pygame.display.get_surface() is None, "The headless core must not open a display"
+
+if __name__ == "__main__":
+    run_benchmark()
+    run_benchmark(use_swarm=True)
@@ -0,0 +1,105 @@
+"""
+Benchmark path queries on very large dungeons: hierarchical pathfinding vs. plain A*
+"""
+import os
+import random
+import time
+
+# Set up for headless runs
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+import pygame
+from constants import *
+from game_map import GameMap
+from hpa import HierarchicalPathfinder, astar
+
+# (tiles per side, cluster size, queries)
+MAPS = [(1024, 16, 20), (4096, 32, 5)]
+ROOM_SIZE = 24  # Tiles between the walls dividing the dungeon into rooms
+WALL_DENSITY = 0.02  # Fraction of scattered single-tile walls inside rooms
+
+def build_dungeon(size, rng):
+    """Fill a map with rooms joined by one doorway per wall, plus scattered pillars"""
+    game_map = GameMap(size, size)
+    threshold = int(256 * WALL_DENSITY)
+    table = bytes(TILE_WALL if value < threshold else TILE_FLOOR for value in range(256))
+    tiles = bytearray(rng.randbytes(size * size).translate(table))
+    for line in range(0, size, ROOM_SIZE):
+        row = bytearray([TILE_WALL]) * size
+        column = bytearray([TILE_WALL]) * size
+        for room in range(0, size, ROOM_SIZE):
+            door = room + rng.randrange(2, ROOM_SIZE - 2)
+            row[door - 1:door + 2] = bytes(3)
+            door = room + rng.randrange(2, ROOM_SIZE - 2)
+            column[door - 1:door + 2] = bytes(3)
+        tiles[line * size:(line + 1) * size] = row[:size]
+        tiles[line::size] = column[:size]
+    game_map.tiles[:] = tiles
+    return game_map
+
+def random_floor(game_map, rng):
+    """Pick a random open tile index"""
+    while True:
+        index = rng.randrange(len(game_map.tiles))
+        if game_map.tiles[index] != TILE_WALL:
+            return index
+
+def follow(route, start):
+    """Refine every leg of a route; returns its length in tiles"""
+    index = start
+    length = 0
+    while True:
+        index = route.next_tile(index)
+        if index is None:
+            return length
+        length += 1
+
+def run_benchmark():
+    """Print build and query times for each map size"""
+    pygame.init()
+    rng = random.Random(1)
+    print(f"{'map':>10} {'A* ms':>10} {'HPA* ms':>10} {'cached ms':>10} {'+legs ms':>10} {'length':>8}")
+    for size, cluster_size, queries in MAPS:
+        game_map = build_dungeon(size, rng)
+        start = time.perf_counter()
+        pathfinder = HierarchicalPathfinder(game_map, cluster_size)
+        build_ms = (time.perf_counter() - start) * 1000
+        
+        pairs = [(random_floor(game_map, rng), random_floor(game_map, rng)) for _ in range(queries)]
+        astar_ms = hpa_ms = cached_ms = legs_ms = 0.0
+        astar_length = hpa_length = 0
+        for start_tile, goal_tile in pairs:
+            start = time.perf_counter()
+            path = astar(game_map, start_tile, goal_tile)
+            astar_ms += (time.perf_counter() - start) * 1000
+            if path is None:
+                continue
+            astar_length += len(path) - 1
+            
+            start = time.perf_counter()
+            route = pathfinder.find_route(start_tile, goal_tile)
+            hpa_ms += (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            hpa_length += follow(route, start_tile)
+            legs_ms += (time.perf_counter() - start) * 1000
+            
+            # The same query again, as when another enemy there replans toward that cluster
+            start = time.perf_counter()
+            pathfinder.find_route(start_tile, goal_tile)
+            cached_ms += (time.perf_counter() - start) * 1000
+        
+        print(f"{f'{size}x{size}':>10} {astar_ms / queries:>10.1f} {hpa_ms / queries:>10.1f} "
+              f"{cached_ms / queries:>10.2f} {legs_ms / queries:>10.1f} "
+              f"{hpa_length / astar_length:>7.3f}x")
+        print(f"{'':>10} entrance graph built in {build_ms:.0f} ms "
+              f"({len(pathfinder.transitions)} transition tiles, clusters of {cluster_size}), "
+              f"{pathfinder.cache_hits} cache hits")
+    print()
+    print("HPA* ms includes the first search through each cluster; +legs ms is refining the whole")
+    print("route into tiles, which an enemy does one leg at a time as it walks.")
+    
+    pygame.quit()
+
+if __name__ == "__main__":
+    run_benchmark()
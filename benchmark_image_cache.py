@@ -0,0 +1,55 @@
+"""
+Memory report for the shared image cache on a large map
+"""
+import os
+
+# Set up for headless runs
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+import pygame
+import image_cache
+from constants import *
+from wall import Wall
+from generator import Generator
+from enemy import Enemy
+from projectile import Projectile
+
+MAP_SIDE = 300  # tiles
+ENEMIES = 2000
+PROJECTILES = 200
+
+def build_large_map():
+    """Create the sprites of a bordered map with a wall on every third tile"""
+    walls = []
+    for y in range(MAP_SIDE):
+        for x in range(MAP_SIDE):
+            border = x in (0, MAP_SIDE - 1) or y in (0, MAP_SIDE - 1)
+            if border or (x * 7 + y) % 3 == 0:
+                walls.append(Wall(x, y))
+    generators = [Generator(x, y) for x in range(5, MAP_SIDE, 20) for y in range(5, MAP_SIDE, 20)]
+    enemies = [Enemy(i % MAP_SIDE * TILE_SIZE, i // MAP_SIDE * TILE_SIZE) for i in range(ENEMIES)]
+    projectiles = [Projectile(i * 10, 100, (1, 0)) for i in range(PROJECTILES)]
+    return walls, generators, enemies, projectiles
+
+def print_report():
+    """Print pixel memory with shared surfaces vs. one surface per sprite request"""
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    image_cache.clear()
+    sprites = build_large_map()
+    
+    report = image_cache.memory_report()
+    print(f"Map: {MAP_SIDE}x{MAP_SIDE} tiles")
+    print(f"{'kind':>12} {'requests':>10} {'surfaces':>9} {'shared KiB':>11} {'unshared KiB':>13}")
+    for kind, entry in report.items():
+        print(f"{kind:>12} {entry['requests']:>10} {entry['surfaces']:>9} "
+              f"{entry['shared_bytes'] / 1024:>11.1f} {entry['unshared_bytes'] / 1024:>13.1f}")
+    saved = report['total']['unshared_bytes'] - report['total']['shared_bytes']
+    print(f"Saved {saved / (1024 * 1024):.1f} MiB of surface pixels")
+    
+    pygame.quit()
+    return sprites
+
+if __name__ == "__main__":
+    print_report()
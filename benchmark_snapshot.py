@@ -0,0 +1,39 @@
+"""
+Benchmark snapshot and restore of the simulation with a large horde
+"""
+import time
+
+from constants import *
+from simulation import Simulation
+from benchmark_headless import ScriptedKeys
+
+WARMUP_TICKS = 1500
+REPEATS = 200
+
+def run_benchmark(use_swarm=False):
+    """Fill the map with enemies, then time snapshot() and restore()"""
+    # Fast spawning and a near-immortal player build up a few thousand enemies
+    sim = Simulation(use_swarm=use_swarm,
+                     params={'spawn_interval': 16, 'player_health': 10 ** 9})
+    keys = ScriptedKeys()
+    for tick in range(WARMUP_TICKS):
+        keys.choose(tick)
+        sim.tick(keys, shoot=tick % 3 == 0)
+    
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        data = sim.snapshot()
+    snapshot_ms = (time.perf_counter() - start) / REPEATS * 1000
+    
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        sim.restore(data)
+    restore_ms = (time.perf_counter() - start) / REPEATS * 1000
+    
+    mode = "swarm" if use_swarm else "sprites"
+    print(f"{mode:>8}: {sim.enemy_count()} enemies, {len(sim.projectiles)} projectiles, "
+          f"{len(data):,} bytes; snapshot {snapshot_ms:.3f} ms, restore {restore_ms:.3f} ms")
+
+if __name__ == "__main__":
+    run_benchmark()
+    run_benchmark(use_swarm=True)
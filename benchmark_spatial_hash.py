@@ -0,0 +1,71 @@
+"""
+Stress benchmark comparing the spatial hash broadphase against full group scans
+"""
+import os
+import random
+import time
+
+# Set up for headless runs
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+import pygame
+from constants import *
+from enemy import Enemy
+from projectile import Projectile
+from spatial_hash import SpatialHash, spritecollide
+
+ENTITY_COUNTS = [100, 200, 400, 800, 1600, 3200]
+TICKS = 20
+# Enemies per 1000x1000 pixel area; the world grows with the entity count
+DENSITY = 40
+
+def build_scene(enemy_count, rng):
+    """Scatter enemies and projectiles over a world sized for constant density"""
+    side = int((enemy_count / DENSITY) ** 0.5 * 1000)
+    enemies = pygame.sprite.Group()
+    for _ in range(enemy_count):
+        enemies.add(Enemy(rng.randrange(side), rng.randrange(side)))
+    projectiles = [Projectile(rng.randrange(side), rng.randrange(side), (1, 0))
+                   for _ in range(enemy_count // 4)]
+    player = Enemy(side // 2, side // 2)
+    return enemies, projectiles, player
+
+def tick_naive(enemies, projectiles, player):
+    """One tick of collision queries scanning the whole enemy group"""
+    for projectile in projectiles:
+        pygame.sprite.spritecollide(projectile, enemies, False)
+    pygame.sprite.spritecollide(player, enemies, False)
+
+def tick_hashed(enemy_hash, enemies, projectiles, player):
+    """One tick of collision queries through a freshly rebuilt spatial hash"""
+    enemy_hash.rebuild(enemies)
+    for projectile in projectiles:
+        spritecollide(projectile, enemy_hash, False)
+    enemy_hash.spritecollide(player, False)
+
+def time_ticks(tick, *args):
+    """Average milliseconds per call of tick"""
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        tick(*args)
+    return (time.perf_counter() - start) * 1000 / TICKS
+
+def run_benchmark():
+    """Print per-tick cost for both approaches across entity counts"""
+    pygame.init()
+    rng = random.Random(1)
+    enemy_hash = SpatialHash()
+    
+    print(f"{'enemies':>8} {'projectiles':>12} {'naive ms':>10} {'hash ms':>10} {'hash us/entity':>15}")
+    for count in ENTITY_COUNTS:
+        enemies, projectiles, player = build_scene(count, rng)
+        naive_ms = time_ticks(tick_naive, enemies, projectiles, player)
+        hash_ms = time_ticks(tick_hashed, enemy_hash, enemies, projectiles, player)
+        per_entity = hash_ms * 1000 / (count + len(projectiles))
+        print(f"{count:>8} {len(projectiles):>12} {naive_ms:>10.2f} {hash_ms:>10.2f} {per_entity:>15.2f}")
+    
+    pygame.quit()
+
+if __name__ == "__main__":
+    run_benchmark()
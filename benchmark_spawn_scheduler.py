@@ -0,0 +1,79 @@
+"""
+Benchmark generator spawning per tick: a loop over every generator vs. the spawn scheduler
+"""
+import os
+import random
+import time
+
+# Set up for headless runs
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+import pygame
+from constants import *
+from game_map import GameMap
+from generator import Generator
+from spawn_scheduler import SpawnScheduler
+
+GENERATOR_COUNTS = [100, 1000, 10000]
+TICKS = 10 * SIM_TICK_RATE
+INTERVALS = (1000, 6000)  # Range of per-generator spawn intervals (milliseconds)
+
+class SpawnCounter:
+    """Spawn target that only counts, so the timings are the scheduling alone"""
+    def __init__(self):
+        self.count = 0
+    
+    def spawn(self, x, y, speed):
+        self.count += 1
+
+def build_map(count, rng):
+    """A map with count generators on random tiles, each with its own interval and phase"""
+    side = int(count ** 0.5) * 3 + 2
+    game_map = GameMap(side, side)
+    game_map.generators.empty()
+    tiles = rng.sample([(x, y) for y in range(1, side - 1) for x in range(1, side - 1)], count)
+    for tile_x, tile_y in tiles:
+        generator = Generator(tile_x, tile_y)
+        generator.spawn_interval = rng.randrange(*INTERVALS)
+        generator.last_spawn_time = -rng.randrange(generator.spawn_interval)
+        game_map.generators.add(generator)
+    return game_map
+
+def time_ticks(game_map, update):
+    """Milliseconds per tick spent spawning, and the number of spawns"""
+    target = SpawnCounter()
+    tick_ms = 1000 / SIM_TICK_RATE
+    start = time.perf_counter()
+    for tick in range(1, TICKS + 1):
+        update(tick * tick_ms, target)
+    return (time.perf_counter() - start) * 1000 / TICKS, target.count
+
+def run_benchmark():
+    """Print per-tick spawning cost with both approaches"""
+    pygame.init()
+    rng = random.Random(1)
+    print(f"{TICKS} ticks, spawn intervals {INTERVALS[0]}-{INTERVALS[1]} ms")
+    print(f"{'generators':>10} {'loop ms/tick':>13} {'heap ms/tick':>13} {'speedup':>8} {'spawns':>7}")
+    for count in GENERATOR_COUNTS:
+        game_map = build_map(count, rng)
+        generators = game_map.generators.sprites()
+        phases = [generator.last_spawn_time for generator in generators]
+        
+        def loop(current_time, target):
+            for generator in game_map.generators:
+                generator.update(current_time, target)
+        
+        loop_ms, loop_spawns = time_ticks(game_map, loop)
+        for generator, phase in zip(generators, phases):
+            generator.last_spawn_time = phase
+        scheduler = SpawnScheduler(game_map)
+        heap_ms, heap_spawns = time_ticks(game_map, scheduler.update)
+        assert heap_spawns == loop_spawns
+        print(f"{count:>10} {loop_ms:>13.3f} {heap_ms:>13.3f} {loop_ms / heap_ms:>7.1f}x "
+              f"{heap_spawns:>7}")
+    
+    pygame.quit()
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,78 @@
+"""
+Benchmark the NumPy enemy swarm against per-sprite Enemy updates
+"""
+import os
+import random
+import time
+
+# Set up for headless runs
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+import pygame
+from constants import *
+from enemy import Enemy
+from game_map import GameMap
+from flow_field import FlowField
+from swarm import EnemySwarm
+
+ENEMY_COUNTS = [1000, 10000, 50000]
+TICKS = 10
+FRAME_BUDGET_MS = 1000 / FPS
+
+class Target:
+    """Stand-in for the player at a world position"""
+    def __init__(self, x, y):
+        self.rect = pygame.Rect(x, y, 28, 28)
+
+def random_floor_positions(game_map, count, rng):
+    """Pick random top-left positions on floor tiles"""
+    floor = [(x, y) for y in range(game_map.height) for x in range(game_map.width)
+             if not game_map.is_solid(x, y)]
+    positions = []
+    for _ in range(count):
+        tile_x, tile_y = rng.choice(floor)
+        positions.append((tile_x * TILE_SIZE + 2, tile_y * TILE_SIZE + 2))
+    return positions
+
+def time_sprites(game_map, field, target, positions):
+    """Average milliseconds per tick updating one Enemy sprite at a time"""
+    enemies = [Enemy(x, y) for x, y in positions]
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        for enemy in enemies:
+            enemy.update(target, game_map.walls, game_map, field)
+    return (time.perf_counter() - start) * 1000 / TICKS
+
+def time_swarm(game_map, field, target, positions):
+    """Average milliseconds per tick of batched swarm movement and player contact"""
+    swarm = EnemySwarm()
+    for x, y in positions:
+        swarm.spawn(x, y)
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        swarm.update(target, game_map, field)
+        swarm.overlapping(target.rect)
+    return (time.perf_counter() - start) * 1000 / TICKS
+
+def run_benchmark():
+    """Print per-tick enemy update cost for both representations"""
+    pygame.init()
+    rng = random.Random(1)
+    game_map = GameMap()
+    target = Target(PLAYER_START_X * TILE_SIZE, PLAYER_START_Y * TILE_SIZE)
+    field = FlowField(game_map)
+    field.update(target)
+    
+    print(f"Frame budget at {FPS} FPS: {FRAME_BUDGET_MS:.1f} ms")
+    print(f"{'enemies':>8} {'sprites ms/tick':>16} {'swarm ms/tick':>14}")
+    for count in ENEMY_COUNTS:
+        positions = random_floor_positions(game_map, count, rng)
+        sprite_ms = time_sprites(game_map, field, target, positions)
+        swarm_ms = time_swarm(game_map, field, target, positions)
+        print(f"{count:>8} {sprite_ms:>16.2f} {swarm_ms:>14.2f}")
+    
+    pygame.quit()
+
+if __name__ == "__main__":
+    run_benchmark()
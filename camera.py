@@ -9,6 +9,7 @@ class Camera:
     
     def __init__(self, width, height):
         self.camera = pygame.Rect(0, 0, width, height)
+        self.previous = self.camera  # View before the last update, for interpolation
         self.width = width
         self.height = height
         
@@ -16,6 +17,22 @@ class Camera:
         """Apply camera offset to an entity"""
         return entity.rect.move(-self.camera.x, -self.camera.y)
     
+    def view(self, alpha=1.0):
+        """Get the view rect interpolated between the previous and current update"""
+        if alpha >= 1.0 or self.previous.topleft == self.camera.topleft:
+            return self.camera
+        x = round(self.previous.x + (self.camera.x - self.previous.x) * alpha)
+        y = round(self.previous.y + (self.camera.y - self.previous.y) * alpha)
+        return pygame.Rect(x, y, self.camera.width, self.camera.height)
+    
+    def visible(self, sprites, index=None, view=None):
+        """Get the sprites whose rects overlap the view, using a spatial index if given"""
+        if view is None:
+            view = self.camera
+        if index is not None:
+            sprites = index.query(view)
+        return [sprite for sprite in sprites if view.colliderect(sprite.rect)]
+    
     def update(self, target):
         """Update camera position to follow target"""
         # Center camera on target
@@ -26,4 +43,5 @@ class Camera:
         x = max(0, min(x, self.width - SCREEN_WIDTH))
         y = max(0, min(y, self.height - SCREEN_HEIGHT))
         
+        self.previous = self.camera
         self.camera = pygame.Rect(x, y, SCREEN_WIDTH, SCREEN_HEIGHT)
@@ -7,9 +7,23 @@ SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
 
+# Fixed simulation timestep: speeds are in pixels per tick
+SIM_TICK_RATE = 60  # ticks per second
+MAX_CATCH_UP_TICKS = 5  # most ticks run per rendered frame before dropping time
+
 # Tile settings
 TILE_SIZE = 32
 
+# Tile types stored in the map's tile grid
+TILE_FLOOR = 0
+TILE_WALL = 1
+
+# Broadphase cell size for the spatial hash (in pixels)
+SPATIAL_HASH_CELL_SIZE = TILE_SIZE * 2
+
+# Size of each pre-rendered static map chunk (in tiles)
+STATIC_CHUNK_TILES = 16
+
 # Colors
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -27,6 +41,42 @@ ENEMY_SPEED = 2
 PROJECTILE_SPEED = 8
 SPAWN_INTERVAL = 3000  # milliseconds
 
+# Store enemies in the NumPy-backed EnemySwarm instead of one sprite each
+USE_ENEMY_SWARM = False
+
+# Redraw and push only the screen regions that changed while the camera is still
+USE_DIRTY_RECTS = False
+MAX_DIRTY_RECTS = 100  # Beyond this many regions a frame is redrawn in full
+
+# Cache the scene behind the pause and game-over menus as one surface
+FREEZE_MENU_BACKGROUND = False
+
+# Tiles the flow field searches per tick after the player changes tile (None: the whole map
+# at once). Maps up to this size still rebuild within the tick; larger ones spread it out.
+FLOW_FIELD_REBUILD_BUDGET = 2048
+# Tiles the flow field repair may touch per tick after walls change (None: no limit)
+FLOW_FIELD_REPAIR_BUDGET = 128
+
+# Give each sprite enemy its own route from the hierarchical pathfinder (hpa.py) instead
+# of the shared flow field, for maps too large to search whole; clusters are this many tiles square
+USE_HIERARCHICAL_PATHFINDING = False
+HPA_CLUSTER_SIZE = 16
+
+# AI level of detail (ai_scheduler.py): sprite enemies near the player think every tick,
+# distant ones every AI_DISTANT_INTERVAL ticks, and ones beyond AI_FAR_DISTANCE stay dormant
+USE_AI_LOD = False
+AI_NEAR_DISTANCE = 16 * TILE_SIZE  # pixels, enough to cover the screen around the player
+AI_FAR_DISTANCE = 40 * TILE_SIZE  # pixels
+AI_DISTANT_INTERVAL = 4
+AI_TICK_BUDGET = 200  # most distant-enemy updates per tick; the rest wait for the next tick
+
+# Crowd separation (crowd.py): after moving, enemies closer than SEPARATION_RADIUS pixels
+# push apart by SEPARATION_STRENGTH pixels per pixel of overlap, at most SEPARATION_MAX_PUSH per tick
+USE_CROWD_SEPARATION = False
+SEPARATION_RADIUS = TILE_SIZE - 4  # pixels, the enemy size, so only overlapping enemies push
+SEPARATION_STRENGTH = 0.1
+SEPARATION_MAX_PUSH = 2  # pixels, below ENEMY_SPEED so the push never beats the chase
+
 # Map dimensions (in tiles)
 MAP_WIDTH = 40
 MAP_HEIGHT = 30
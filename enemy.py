@@ -3,22 +3,95 @@ Enemy class with pathfinding AI
 """
 import pygame
 from constants import *
+from image_cache import get_surface
+from wall import WallGroup
+from pool import PooledSprite
 
-class Enemy(pygame.sprite.Sprite):
+class Enemy(PooledSprite):
     """An enemy that chases the player"""
     
     def __init__(self, x, y):
         super().__init__()
-        self.image = pygame.Surface((TILE_SIZE - 4, TILE_SIZE - 4))
-        self.image.fill(RED)
+        self.image = get_surface('enemy', (TILE_SIZE - 4, TILE_SIZE - 4), RED)
         self.rect = self.image.get_rect()
+        self.reset(x, y)
+    
+    def reset(self, x, y):
+        """Place the enemy at a position with fresh stats (also used when recycled)"""
         self.rect.x = x
         self.rect.y = y
         self.speed = ENEMY_SPEED
         self.damage = 10  # Damage dealt to player on collision
+        self.route = None  # Route from a HierarchicalPathfinder, planned on demand
+        self.ai_tick = None  # Simulation tick of the last AI update, kept by an AIScheduler
+        
+    def update(self, player, walls, game_map, flow_field=None, pathfinder=None, ticks=1):
+        """Update enemy position to move toward player
+        
+        With a pathfinder the enemy follows its own route; with a flow field
+        it follows the shared shortest path around walls; otherwise (or once
+        it reaches the player's tile) it chases directly. ticks > 1 makes up
+        for updates skipped by an AIScheduler with one longer move, capped
+        below a tile so it cannot pass through a wall.
+        """
+        speed = self.speed
+        if ticks > 1:
+            speed = max(speed, min(speed * ticks, TILE_SIZE - 1))
+        if pathfinder is not None:
+            step = self.route_step(player, pathfinder)
+        elif flow_field is not None:
+            step = flow_field.next_step(self.rect.centerx, self.rect.centery)
+        else:
+            step = None
+        if step is not None:
+            self.follow_step(step, walls, speed)
+            return
+        self.chase(player, walls, speed)
+    
+    def route_step(self, player, pathfinder):
+        """Get the next tile center on the enemy's route to the player, replanning when stale
+        
+        The route is kept while the player stays in the cluster it leads to,
+        so most ticks only follow it; it is planned again once the player
+        leaves that cluster, or when it is used up and the player has moved on.
+        """
+        goal = pathfinder.tile_index(player.rect.centerx, player.rect.centery)
+        route = self.route
+        if (route is None or route.failed
+                or pathfinder.cluster_of(route.goal) != pathfinder.cluster_of(goal)
+                or (route.finished and route.goal != goal)):
+            start = pathfinder.tile_index(self.rect.centerx, self.rect.centery)
+            route = self.route = pathfinder.find_route(start, goal)
+            if route is None:
+                return None
+        step = route.next_step(self.rect.centerx, self.rect.centery)
+        if step is None and route.failed:
+            self.route = None
+        return step
+    
+    def follow_step(self, step, walls, speed=None):
+        """Move toward the center of the next tile on the flow field"""
+        if speed is None:
+            speed = self.speed
+        dx = step[0] - self.rect.centerx
+        dy = step[1] - self.rect.centery
+        move_x = max(-speed, min(speed, dx))
+        move_y = max(-speed, min(speed, dy))
         
-    def update(self, player, walls, game_map):
-        """Update enemy position to move toward player"""
+        if move_x != 0:
+            self.rect.x += move_x
+            if self.check_collision(walls):
+                self.rect.x -= move_x
+        
+        if move_y != 0:
+            self.rect.y += move_y
+            if self.check_collision(walls):
+                self.rect.y -= move_y
+    
+    def chase(self, player, walls, speed=None):
+        """Steer greedily toward the player along the longer axis"""
+        if speed is None:
+            speed = self.speed
         # Calculate direction to player
         dx = player.rect.centerx - self.rect.centerx
         dy = player.rect.centery - self.rect.centery
@@ -27,16 +100,16 @@ class Enemy(pygame.sprite.Sprite):
         if abs(dx) > abs(dy):
             # Move horizontally
             if dx > 0:
-                move_x = min(self.speed, dx)
+                move_x = min(speed, dx)
             else:
-                move_x = max(-self.speed, dx)
+                move_x = max(-speed, dx)
             move_y = 0
         else:
             # Move vertically
             if dy > 0:
-                move_y = min(self.speed, dy)
+                move_y = min(speed, dy)
             else:
-                move_y = max(-self.speed, dy)
+                move_y = max(-speed, dy)
             move_x = 0
         
         # Try to move
@@ -50,9 +123,9 @@ class Enemy(pygame.sprite.Sprite):
                 # If blocked, try vertical
                 if move_y == 0:
                     if dy > 0:
-                        move_y = self.speed
+                        move_y = speed
                     else:
-                        move_y = -self.speed
+                        move_y = -speed
         
         # Try vertical movement
         if move_y != 0:
@@ -62,4 +135,6 @@ class Enemy(pygame.sprite.Sprite):
     
     def check_collision(self, walls):
         """Check if enemy collides with any wall"""
+        if isinstance(walls, WallGroup):
+            return walls.collides_rect(self.rect)
         return pygame.sprite.spritecollideany(self, walls) is not None
@@ -2,9 +2,11 @@
 Animated character class using sprite sheet animations
 """
 import pygame
-from typing import Tuple, List
+from typing import Dict, Tuple, List
 import os
 
+from assets import assets
+
 
 class AnimatedCharacter(pygame.sprite.Sprite):
     """
@@ -24,6 +26,13 @@ class AnimatedCharacter(pygame.sprite.Sprite):
     DIRECTION_DOWN = 2
     DIRECTION_RIGHT = 3
     
+    # Frames per walk cycle in each sheet row
+    FRAMES_PER_ROW = 9
+    
+    # (absolute sheet path, frame size) -> (sheet, animations, converted), shared by
+    # every instance so extra characters cost no decoding and no pixel copies
+    _frame_cache = {}
+    
     def __init__(self, x: int, y: int, sprite_sheet_path: str, 
                  frame_size: int = 64, animation_speed: float = 0.15):
         """
@@ -44,16 +53,8 @@ class AnimatedCharacter(pygame.sprite.Sprite):
         self.current_direction = self.DIRECTION_DOWN  # Default facing down
         self.is_moving = False
         
-        # Load sprite sheet
-        self.sprite_sheet = self._load_sprite_sheet(sprite_sheet_path)
-        
-        # Extract animation frames for each direction
-        self.animations = {
-            self.DIRECTION_UP: self._extract_frames(0, 9),
-            self.DIRECTION_LEFT: self._extract_frames(1, 9),
-            self.DIRECTION_DOWN: self._extract_frames(2, 9),
-            self.DIRECTION_RIGHT: self._extract_frames(3, 9),
-        }
+        # Shared sheet and animation frames for each direction (read-only)
+        self.sprite_sheet, self.animations = self._get_frames(sprite_sheet_path, frame_size)
         
         # Set initial image and rect
         self.image = self.animations[self.current_direction][0]
@@ -61,49 +62,87 @@ class AnimatedCharacter(pygame.sprite.Sprite):
         self.rect.x = x
         self.rect.y = y
     
-    def _load_sprite_sheet(self, path: str) -> pygame.Surface:
+    @classmethod
+    def _get_frames(cls, path: str, frame_size: int) -> Tuple[pygame.Surface, Dict[int, List[pygame.Surface]]]:
         """
-        Load sprite sheet from file.
+        Get the shared sprite sheet and animation frames, loading them on first use.
+        
+        A sheet cached before a display existed is converted (without decoding
+        it again) the first time it is requested once there is one.
         
         Args:
             path: Path to sprite sheet image
+            frame_size: Size of each frame in pixels
             
         Returns:
-            Loaded sprite sheet surface
+            The sprite sheet and a dict of direction -> list of frame subsurfaces
+        """
+        key = (os.path.abspath(path), frame_size)
+        has_display = pygame.display.get_surface() is not None
+        cached = cls._frame_cache.get(key)
+        if cached is not None:
+            sheet, animations, converted = cached
+            if converted or not has_display:
+                return sheet, animations
+            sheet = sheet.convert_alpha()
+        else:
+            sheet = cls._load_sprite_sheet(path, frame_size)
+        
+        animations = {
+            cls.DIRECTION_UP: cls._extract_frames(sheet, frame_size, 0, cls.FRAMES_PER_ROW),
+            cls.DIRECTION_LEFT: cls._extract_frames(sheet, frame_size, 1, cls.FRAMES_PER_ROW),
+            cls.DIRECTION_DOWN: cls._extract_frames(sheet, frame_size, 2, cls.FRAMES_PER_ROW),
+            cls.DIRECTION_RIGHT: cls._extract_frames(sheet, frame_size, 3, cls.FRAMES_PER_ROW),
+        }
+        cls._frame_cache[key] = (sheet, animations, has_display)
+        return sheet, animations
+    
+    @classmethod
+    def clear_frame_cache(cls) -> None:
+        """Drop every cached sprite sheet, e.g. after the files change on disk."""
+        cls._frame_cache.clear()
+    
+    @classmethod
+    def _load_sprite_sheet(cls, path: str, frame_size: int) -> pygame.Surface:
+        """
+        Load sprite sheet through the asset manager, which decodes it only once.
+        
+        Args:
+            path: Path to sprite sheet image
+            frame_size: Size of each frame in pixels
+            
+        Returns:
+            Loaded sprite sheet surface, cropped to the frames used
             
         Raises:
             FileNotFoundError: If sprite sheet file doesn't exist
         """
-        if not os.path.exists(path):
-            raise FileNotFoundError(f"Sprite sheet not found: {path}")
-        
-        sprite_sheet = pygame.image.load(path).convert_alpha()
+        sprite_sheet = assets.load_sheet(os.path.abspath(path), frame_size, 4, cls.FRAMES_PER_ROW)
+        # Converting needs a display; headless simulations keep the decoded format
+        if pygame.display.get_surface() is not None:
+            sprite_sheet = sprite_sheet.convert_alpha()
         return sprite_sheet
     
-    def _extract_frames(self, row: int, num_frames: int) -> List[pygame.Surface]:
+    @staticmethod
+    def _extract_frames(sprite_sheet: pygame.Surface, frame_size: int,
+                        row: int, num_frames: int) -> List[pygame.Surface]:
         """
-        Extract animation frames from a specific row in the sprite sheet.
+        Slice animation frames from a specific row in the sprite sheet.
+        
+        Frames are subsurfaces sharing the sheet's pixels, so no pixels are copied.
         
         Args:
+            sprite_sheet: Sheet to slice
+            frame_size: Size of each frame in pixels
             row: Row number in sprite sheet
             num_frames: Number of frames to extract from the row
             
         Returns:
             List of frame surfaces
         """
-        frames = []
-        y_offset = row * self.frame_size
-        
-        for col in range(num_frames):
-            x_offset = col * self.frame_size
-            
-            # Create a subsurface for this frame
-            frame = pygame.Surface((self.frame_size, self.frame_size), pygame.SRCALPHA)
-            frame.blit(self.sprite_sheet, (0, 0), 
-                      (x_offset, y_offset, self.frame_size, self.frame_size))
-            frames.append(frame)
-        
-        return frames
+        y_offset = row * frame_size
+        return [sprite_sheet.subsurface((col * frame_size, y_offset, frame_size, frame_size))
+                for col in range(num_frames)]
     
     def set_direction(self, dx: int, dy: int) -> None:
         """
@@ -0,0 +1,149 @@
+"""
+Gym-style vectorized environment that runs several games in lockstep
+
+Each instance is a headless Simulation, so agents play by the same Player,
+Enemy, Generator and Projectile rules as the real game. An action is one
+input byte in the replay.py encoding: the KEY_BITS of the arrow keys held
+plus SHOOT_BIT to fire, so 0-31 covers every combination.
+"""
+import numpy as np
+from constants import *
+from simulation import Simulation
+from replay import ReplayKeys, SHOOT_BIT
+
+# Value of a generator's tile in the tile observation (floor and wall use TILE_FLOOR/TILE_WALL)
+OBS_GENERATOR = 2
+# Enemies and projectiles reported per instance, nearest to the player first
+MAX_OBS_ENEMIES = 64
+MAX_OBS_PROJECTILES = 16
+# Reward for each kill, each destroyed generator and each point of damage taken
+KILL_REWARD = 1.0
+GENERATOR_REWARD = 10.0
+DAMAGE_PENALTY = 0.01
+
+
+class VectorEnv:
+    """N game instances stepped together with batched NumPy observations
+    
+    step() returns (observations, rewards, terminated, truncated, infos) in the
+    Gymnasium style. An instance whose player died (terminated) or that reached
+    max_ticks (truncated) is reset straight away, so the observation returned
+    for it is the first of its next episode.
+    
+    Observations are a dict of arrays with a leading instance axis:
+        'tiles'            (N, height, width) uint8 map with generators marked
+        'player'           (N, 3) int32 player center x, y and health
+        'enemies'          (N, MAX_OBS_ENEMIES, 2) int32 centers, padded with -1
+        'enemy_count'      (N,) int32 live enemies (may exceed MAX_OBS_ENEMIES)
+        'projectiles'      (N, MAX_OBS_PROJECTILES, 2) int32 centers, padded with -1
+        'projectile_count' (N,) int32 live projectiles
+    """
+    
+    def __init__(self, num_envs, use_swarm=False, params=None, max_ticks=60 * SIM_TICK_RATE):
+        self.num_envs = num_envs
+        self.max_ticks = max_ticks
+        self.sims = [Simulation(use_swarm=use_swarm, params=params) for _ in range(num_envs)]
+        # Every episode starts from the untouched map, including destroyed generators
+        self.initial_state = self.sims[0].snapshot()
+        self.rng = np.random.default_rng()
+        self.keys = ReplayKeys()
+    
+    def reset(self, seed=None):
+        """Start a new episode in every instance and return the observations
+        
+        seed makes the episodes reproducible; it randomizes when each
+        generator first spawns so instances do not play out identically.
+        """
+        self.rng = np.random.default_rng(seed)
+        for index in range(self.num_envs):
+            self.reset_instance(index)
+        return self.observe()
+    
+    def reset_instance(self, index):
+        """Restore one instance to the start of an episode"""
+        sim = self.sims[index]
+        sim.restore(self.initial_state)
+        for generator in sim.game_map.generators:
+            generator.last_spawn_time = -int(self.rng.integers(generator.spawn_interval))
+        sim.spawn_scheduler.rebuild()
+    
+    def step(self, actions):
+        """Apply one action per instance, advance every game by one tick"""
+        rewards = np.zeros(self.num_envs, dtype=np.float32)
+        terminated = np.zeros(self.num_envs, dtype=bool)
+        truncated = np.zeros(self.num_envs, dtype=bool)
+        infos = []
+        for index, (sim, action) in enumerate(zip(self.sims, actions)):
+            kills = sim.kills
+            generators_destroyed = sim.generators_destroyed
+            damage_taken = sim.damage_taken
+            
+            self.keys.bits = int(action)
+            terminated[index] = sim.tick(self.keys, shoot=bool(action & SHOOT_BIT))
+            truncated[index] = not terminated[index] and sim.ticks >= self.max_ticks
+            
+            rewards[index] = (KILL_REWARD * (sim.kills - kills)
+                              + GENERATOR_REWARD * (sim.generators_destroyed - generators_destroyed)
+                              - DAMAGE_PENALTY * (sim.damage_taken - damage_taken))
+            infos.append({'ticks': sim.ticks, 'kills': sim.kills,
+                          'damage_taken': sim.damage_taken,
+                          'generators_destroyed': sim.generators_destroyed})
+            if terminated[index] or truncated[index]:
+                self.reset_instance(index)
+        return self.observe(), rewards, terminated, truncated, infos
+    
+    def observe(self):
+        """Build the batched observations of every instance"""
+        sims = self.sims
+        game_map = sims[0].game_map
+        n = self.num_envs
+        tiles = np.empty((n, game_map.height, game_map.width), dtype=np.uint8)
+        player = np.empty((n, 3), dtype=np.int32)
+        enemies = np.full((n, MAX_OBS_ENEMIES, 2), -1, dtype=np.int32)
+        projectiles = np.full((n, MAX_OBS_PROJECTILES, 2), -1, dtype=np.int32)
+        enemy_count = np.empty(n, dtype=np.int32)
+        projectile_count = np.empty(n, dtype=np.int32)
+        
+        for index, sim in enumerate(sims):
+            game_map = sim.game_map
+            tiles[index] = np.frombuffer(game_map.tiles, dtype=np.uint8).reshape(
+                game_map.height, game_map.width)
+            for generator in game_map.generators:
+                tiles[index, generator.rect.y // TILE_SIZE, generator.rect.x // TILE_SIZE] = OBS_GENERATOR
+            
+            center = sim.player.rect.center
+            player[index] = (center[0], center[1], sim.player.health)
+            
+            positions = enemy_centers(sim)
+            enemy_count[index] = len(positions)
+            nearest(positions, center, enemies[index])
+            
+            positions = np.array([p.rect.center for p in sim.projectiles],
+                                 dtype=np.int32).reshape(-1, 2)
+            projectile_count[index] = len(positions)
+            nearest(positions, center, projectiles[index])
+        
+        return {'tiles': tiles, 'player': player,
+                'enemies': enemies, 'enemy_count': enemy_count,
+                'projectiles': projectiles, 'projectile_count': projectile_count}
+
+
+def enemy_centers(sim):
+    """Get an (n, 2) array of live enemy centers, from sprites and the swarm"""
+    positions = np.array([enemy.rect.center for enemy in sim.enemies],
+                         dtype=np.int32).reshape(-1, 2)
+    swarm = sim.swarm
+    if swarm is not None:
+        from swarm import ENEMY_SIZE
+        live = np.flatnonzero(swarm.alive[:swarm.size])
+        centers = np.stack([swarm.x[live], swarm.y[live]], axis=1) + ENEMY_SIZE // 2
+        positions = np.concatenate([positions, centers.astype(np.int32)])
+    return positions
+
+
+def nearest(positions, center, out):
+    """Copy the positions closest to center into out, nearest first"""
+    if len(positions):
+        distance = np.abs(positions - center).sum(axis=1)
+        positions = positions[np.argsort(distance, kind='stable')[:len(out)]]
+        out[:len(positions)] = positions
@@ -0,0 +1,323 @@
+"""
+Flow field pathfinding shared by all enemies
+"""
+import time
+from array import array
+from collections import deque
+from heapq import heappush, heappop
+from constants import *
+
+UNREACHABLE = -1
+
+class FlowField:
+    """BFS distance map from the target's tile that every enemy steers by
+    
+    Wall changes are repaired in place: only tiles whose distance or next step
+    depends on the changed tile are touched, at most about repair_budget of
+    them per update. A repair cut short carries over to the next update,
+    and enemies steer by the partly repaired field meanwhile. A
+    move of the target to another tile shifts the distance of nearly every
+    tile, so it is a full search; with rebuild_budget set, that search runs
+    into spare arrays a slice per update and the previous field stays in use
+    until it completes.
+    """
+    
+    def __init__(self, game_map, rebuild_budget=FLOW_FIELD_REBUILD_BUDGET,
+                 repair_budget=FLOW_FIELD_REPAIR_BUDGET):
+        self.game_map = game_map
+        size = game_map.width * game_map.height
+        self.distances = array('i', [UNREACHABLE]) * size
+        # Index of the neighbouring tile one step closer to the target, per tile
+        self.next_tiles = array('i', [UNREACHABLE]) * size
+        self.target_tile = None
+        # Tiles as the field last saw them, and indices reported changed since
+        self.known_tiles = bytearray(game_map.tiles)
+        self.changed_tiles = []
+        self.rebuild_budget = rebuild_budget
+        # (target tile, distances, next tiles, queue) of a search still in progress
+        self.rebuild = None
+        self.repair_budget = repair_budget
+        # (tile index, now solid) of solidity changes still to repair, and the
+        # generator of the repair in progress, resumed by the next update
+        self.pending_repairs = deque()
+        self.repair_work = None
+        
+        # Statistics: totals, and the work done by the last update
+        self.recomputes = 0
+        self.repairs = 0
+        self.cells_touched = 0
+        self.update_ms = 0.0
+        game_map.add_change_listener(self.tile_changed)
+    
+    def tile_changed(self, tile_x, tile_y):
+        """Queue a changed tile for repair at the next update"""
+        if self.game_map.in_bounds(tile_x, tile_y):
+            self.changed_tiles.append(tile_y * self.game_map.width + tile_x)
+    
+    def update(self, target):
+        """Bring the field up to date with the map and target; returns True if it changed"""
+        start = time.perf_counter()
+        tile = (target.rect.centerx // TILE_SIZE, target.rect.centery // TILE_SIZE)
+        self.cells_touched = 0
+        changed = False
+        if self.target_tile is None or (tile != self.target_tile and self.rebuild_budget is None):
+            self.target_tile = tile
+            self.cells_touched = self.recompute()
+            changed = True
+        else:
+            if self.changed_tiles or self.pending_repairs or self.repair_work is not None:
+                touched = self.repair()
+                self.cells_touched += touched
+                changed = touched > 0
+            if tile != self.target_tile or self.rebuild is not None:
+                changed = self.continue_rebuild(tile) or changed
+        self.update_ms = (time.perf_counter() - start) * 1000
+        return changed
+    
+    def stats(self):
+        """Get full searches, incremental repairs and the cost of the last update"""
+        return {
+            'recomputes': self.recomputes,
+            'repairs': self.repairs,
+            'cells_touched': self.cells_touched,
+            'update_ms': self.update_ms,
+            'rebuilding': self.rebuild is not None,
+            'repairing': self.repair_work is not None or len(self.pending_repairs) > 0,
+        }
+    
+    def recompute(self):
+        """Breadth-first search outward from the target tile over non-solid tiles
+        
+        Returns the number of tiles reached.
+        """
+        size = self.game_map.width * self.game_map.height
+        self.distances[:] = array('i', [UNREACHABLE]) * size
+        self.next_tiles[:] = array('i', [UNREACHABLE]) * size
+        self.known_tiles[:] = self.game_map.tiles
+        self.changed_tiles = []
+        self.rebuild = None
+        self.drop_repairs()
+        self.recomputes += 1
+        
+        queue = self.start_search(self.target_tile, self.distances)
+        return self.search(self.distances, self.next_tiles, queue)
+    
+    def start_search(self, tile, distances):
+        """Seed a search at a target tile; returns its queue"""
+        tile_x, tile_y = tile
+        if not self.game_map.in_bounds(tile_x, tile_y):
+            return deque()
+        start = tile_y * self.game_map.width + tile_x
+        distances[start] = 0
+        return deque([start])
+    
+    def search(self, distances, next_tiles, queue, budget=None):
+        """Expand a breadth-first search, at most budget tiles; returns tiles expanded"""
+        game_map = self.game_map
+        width = game_map.width
+        size = width * game_map.height
+        tiles = game_map.tiles
+        expanded = 0
+        while queue and expanded != budget:
+            index = queue.popleft()
+            expanded += 1
+            distance = distances[index] + 1
+            x = index % width
+            for neighbour, valid in ((index - width, index >= width),
+                                     (index + width, index < size - width),
+                                     (index - 1, x > 0),
+                                     (index + 1, x < width - 1)):
+                if (valid and distances[neighbour] == UNREACHABLE
+                        and tiles[neighbour] != TILE_WALL):
+                    distances[neighbour] = distance
+                    next_tiles[neighbour] = index
+                    queue.append(neighbour)
+        return expanded
+    
+    def continue_rebuild(self, tile):
+        """Run one budgeted slice of the search for a new target; returns True when swapped in
+        
+        A search in progress is finished for the tile it started from before
+        the next one starts, so a target that keeps moving cannot starve it.
+        """
+        if self.rebuild is None:
+            size = self.game_map.width * self.game_map.height
+            distances = array('i', [UNREACHABLE]) * size
+            self.rebuild = (tile, distances, array('i', [UNREACHABLE]) * size,
+                            self.start_search(tile, distances))
+        target_tile, distances, next_tiles, queue = self.rebuild
+        self.cells_touched += self.search(distances, next_tiles, queue, self.rebuild_budget)
+        if queue:
+            return False
+        
+        self.target_tile = target_tile
+        self.distances = distances
+        self.next_tiles = next_tiles
+        self.known_tiles[:] = self.game_map.tiles
+        self.rebuild = None
+        self.drop_repairs()
+        self.recomputes += 1
+        return True
+    
+    def neighbours(self, index):
+        """Get the in-bounds tiles next to a tile index, in search order"""
+        width = self.game_map.width
+        x = index % width
+        result = []
+        if index >= width:
+            result.append(index - width)
+        if index < len(self.distances) - width:
+            result.append(index + width)
+        if x > 0:
+            result.append(index - 1)
+        if x < width - 1:
+            result.append(index + 1)
+        return result
+    
+    def repair(self):
+        """Patch the field for every tile whose solidity changed; returns tiles touched
+        
+        Changes that leave a tile as passable as before (a generator placed or
+        destroyed) cost nothing. A search in progress restarts, since it may
+        already have passed the changed tile. Repairs run one after another,
+        stopping once repair_budget tiles are touched; the rest waits for the
+        next call.
+        """
+        tiles = self.game_map.tiles
+        known = self.known_tiles
+        width = self.game_map.width
+        target = self.target_tile[1] * width + self.target_tile[0]
+        changes, self.changed_tiles = self.changed_tiles, []
+        for index in changes:
+            solid = tiles[index] == TILE_WALL
+            was_solid = known[index] == TILE_WALL
+            known[index] = tiles[index]
+            if solid == was_solid:
+                continue
+            self.rebuild = None
+            if index == target:
+                return self.recompute()
+            self.pending_repairs.append((index, solid))
+        
+        budget = self.repair_budget
+        touched = 0
+        while self.repair_work is not None or self.pending_repairs:
+            if self.repair_work is None:
+                index, solid = self.pending_repairs.popleft()
+                if solid != (tiles[index] == TILE_WALL):
+                    # Changed back since; a later entry repairs the tile as it is now
+                    continue
+                self.repairs += 1
+                self.repair_work = self.wall_added(index) if solid else self.wall_removed(index)
+            for _ in self.repair_work:
+                touched += 1
+                if budget is not None and touched >= budget:
+                    return touched
+            self.repair_work = None
+        return touched
+    
+    def drop_repairs(self):
+        """Forget repairs still to do, once a full search has replaced the field"""
+        self.pending_repairs.clear()
+        self.repair_work = None
+    
+    def wall_added(self, index):
+        """Reroute the tiles whose shortest path led through a newly solid tile
+        
+        Tiles are visited down the tree of next steps from the wall, nearest
+        first. One with another neighbour at its old distance minus one keeps
+        its distance and just steps there instead; the others, and everything
+        routed through them, are cleared and searched again from the tiles
+        around them that kept their distance. A generator that yields once per
+        tile visited, so the work can be spread over updates.
+        """
+        distances = self.distances
+        next_tiles = self.next_tiles
+        if distances[index] == UNREACHABLE:
+            return
+        distances[index] = UNREACHABLE
+        next_tiles[index] = UNREACHABLE
+        
+        orphans = deque(n for n in self.neighbours(index) if next_tiles[n] == index)
+        lost = []
+        while orphans:
+            cell = orphans.popleft()
+            yield
+            closer = distances[cell] - 1
+            for neighbour in self.neighbours(cell):
+                # Lost tiles are cleared at once, so they never match
+                if distances[neighbour] == closer:
+                    next_tiles[cell] = neighbour
+                    break
+            else:
+                lost.append(cell)
+                orphans.extend(n for n in self.neighbours(cell) if next_tiles[n] == cell)
+                distances[cell] = UNREACHABLE
+                next_tiles[cell] = UNREACHABLE
+        
+        frontier = []
+        for cell in lost:
+            yield
+            best = UNREACHABLE
+            for neighbour in self.neighbours(cell):
+                distance = distances[neighbour]
+                if distance != UNREACHABLE and (best == UNREACHABLE or distance < best):
+                    best = distance
+                    next_tiles[cell] = neighbour
+            if best != UNREACHABLE:
+                distances[cell] = best + 1
+                heappush(frontier, (best + 1, cell))
+        yield from self.relax(frontier)
+    
+    def wall_removed(self, index):
+        """Give a newly open tile a distance and spread any shortcut it opens (a generator)"""
+        distances = self.distances
+        best = UNREACHABLE
+        for neighbour in self.neighbours(index):
+            distance = distances[neighbour]
+            if distance != UNREACHABLE and (best == UNREACHABLE or distance < best):
+                best = distance
+                self.next_tiles[index] = neighbour
+        if best == UNREACHABLE:
+            return
+        distances[index] = best + 1
+        yield from self.relax([(best + 1, index)])
+    
+    def relax(self, frontier):
+        """Lower distances outward from a heap of (distance, tile), yielding per tile settled"""
+        distances = self.distances
+        next_tiles = self.next_tiles
+        tiles = self.game_map.tiles
+        while frontier:
+            distance, cell = heappop(frontier)
+            if distance != distances[cell]:
+                continue
+            yield
+            step = distance + 1
+            for neighbour in self.neighbours(cell):
+                if (tiles[neighbour] != TILE_WALL and
+                        (distances[neighbour] == UNREACHABLE or distances[neighbour] > step)):
+                    distances[neighbour] = step
+                    next_tiles[neighbour] = cell
+                    heappush(frontier, (step, neighbour))
+    
+    def distance_at(self, x, y):
+        """Get the step distance to the target from world coordinates"""
+        tile_x = x // TILE_SIZE
+        tile_y = y // TILE_SIZE
+        if not self.game_map.in_bounds(tile_x, tile_y):
+            return UNREACHABLE
+        return self.distances[tile_y * self.game_map.width + tile_x]
+    
+    def next_step(self, x, y):
+        """Get the world center of the next tile toward the target, or None"""
+        tile_x = x // TILE_SIZE
+        tile_y = y // TILE_SIZE
+        if not self.game_map.in_bounds(tile_x, tile_y):
+            return None
+        next_index = self.next_tiles[tile_y * self.game_map.width + tile_x]
+        if next_index == UNREACHABLE:
+            return None
+        width = self.game_map.width
+        return ((next_index % width) * TILE_SIZE + TILE_SIZE // 2,
+                (next_index // width) * TILE_SIZE + TILE_SIZE // 2)
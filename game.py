@@ -3,68 +3,181 @@ Main game class
 """
 import pygame
 from constants import *
-from player import Player
-from game_map import GameMap
 from camera import Camera
 from menu import Menu
+from hud import Hud
+from static_layer import StaticLayer
+from simulation import Simulation
+from assets import assets
+
+# (is_paused, is_game_over) of the menu shown in each non-playing state
+MENU_MODES = {
+    STATE_MENU: (False, False),
+    STATE_PAUSED: (True, False),
+    STATE_GAME_OVER: (False, True),
+}
 
 class Game:
     """Main game class that manages the game loop"""
     
-    def __init__(self):
+    def __init__(self, use_swarm=USE_ENEMY_SWARM, tick_rate=SIM_TICK_RATE,
+                 max_catch_up=MAX_CATCH_UP_TICKS, dirty_rects=USE_DIRTY_RECTS,
+                 freeze_menu=FREEZE_MENU_BACKGROUND):
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("pyGauntlet")
         self.clock = pygame.time.Clock()
         self.running = True
         self.state = STATE_MENU
         
+        # Fixed-timestep simulation clock, advanced only while playing
+        self.tick_ms = 1000 / tick_rate
+        self.max_catch_up = max_catch_up
+        self.accumulator = 0.0
+        self.dropped_time = 0.0  # Frame time discarded when rendering fell too far behind
+        
         # Initialize menu
-        self.menu = Menu(self.screen)
+        self.menu = Menu(self.screen, freeze_background=freeze_menu)
+        
+        # HUD widgets, re-rendered only when their values change
+        self.hud = Hud()
+        self.hud.add_widget('health', "Health", (10, 10))
+        
+        # Decode sprite sheets in the background while the start menu shows
+        assets.preload()
         
-        # Initialize game objects
-        self.game_map = GameMap()
-        # Place player at a safe starting position
-        self.player = Player(PLAYER_START_X * TILE_SIZE, PLAYER_START_Y * TILE_SIZE)
-        self.camera = Camera(MAP_WIDTH * TILE_SIZE, MAP_HEIGHT * TILE_SIZE)
+        # Game state and rules live in the display-free simulation core
+        self.sim = Simulation(use_swarm, tick_rate)
+        self.static_layer = StaticLayer(self.sim.game_map)
+        self.camera = self.create_camera()
         
-        # Sprite groups
-        self.enemies = pygame.sprite.Group()
-        self.projectiles = pygame.sprite.Group()
+        # SPACE pressed since the last tick; the shot is fired at the start of the next tick
+        self.shot_pending = False
+        # Optional InputRecorder logging every tick for deterministic replay
+        self.recorder = None
         
-        # Shooting cooldown
-        self.can_shoot = True
-        self.shoot_cooldown = 250  # milliseconds
-        self.last_shot_time = 0
+        # Per-frame culling counters for dynamic sprites
+        self.sprites_drawn = 0
+        self.sprites_culled = 0
+        
+        # Dirty-rect rendering: screen rects of everything dynamic drawn last frame,
+        # and the (state, view position) it was drawn with
+        self.use_dirty_rects = dirty_rects
+        self.dynamic_rects = []
+        self.last_frame = None
+        self.needs_full_redraw = True
+        self.full_redraws = 0
+        self.dirty_redraws = 0
+        self.sim.game_map.add_change_listener(self.map_changed)
+    
+    # Simulation state, exposed for the renderer, scripts and tests
+    @property
+    def sim_time(self):
+        return self.sim.time
+    
+    @property
+    def game_map(self):
+        return self.sim.game_map
+    
+    @property
+    def player(self):
+        return self.sim.player
+    
+    @property
+    def enemies(self):
+        return self.sim.enemies
+    
+    @property
+    def projectiles(self):
+        return self.sim.projectiles
+    
+    @property
+    def swarm(self):
+        return self.sim.swarm
+    
+    @property
+    def flow_field(self):
+        return self.sim.flow_field
+    
+    @property
+    def enemy_pool(self):
+        return self.sim.enemy_pool
+    
+    @property
+    def projectile_pool(self):
+        return self.sim.projectile_pool
+    
+    def create_camera(self):
+        """Create a camera bounded by the map, snapped to the player with nothing to interpolate"""
+        camera = Camera(self.game_map.width * TILE_SIZE, self.game_map.height * TILE_SIZE)
+        camera.update(self.player)
+        camera.previous = camera.camera
+        return camera
     
     def reset_game(self):
         """Reset the game to initial state"""
-        # Reset player to starting position
-        self.player = Player(PLAYER_START_X * TILE_SIZE, PLAYER_START_Y * TILE_SIZE)
+        self.sim.reset()
+        self.shot_pending = False
+        if self.recorder is not None:
+            self.recorder.mark_reset()
         
         # Reset camera
-        self.camera = Camera(MAP_WIDTH * TILE_SIZE, MAP_HEIGHT * TILE_SIZE)
-        
-        # Clear all sprites
-        self.enemies.empty()
-        self.projectiles.empty()
-        
-        # Reset shooting cooldown
-        self.last_shot_time = 0
+        self.camera = self.create_camera()
+        self.needs_full_redraw = True
         
+    def snapshot(self):
+        """Capture the game state for a save or a rollback"""
+        return self.sim.snapshot()
+    
+    def restore(self, data):
+        """Load a state from snapshot() and snap the camera to the player"""
+        self.sim.restore(data)
+        self.shot_pending = False
+        self.camera = self.create_camera()
+        self.needs_full_redraw = True
+    
     def run(self):
-        """Main game loop"""
+        """Main game loop: fixed simulation ticks, rendering interpolated between them"""
+        previous_time = pygame.time.get_ticks()
         while self.running:
             current_time = pygame.time.get_ticks()
+            frame_time = current_time - previous_time
+            previous_time = current_time
             
-            self.handle_events(current_time)
+            self.handle_events(self.sim_time)
             
-            if self.state == STATE_PLAYING:
-                self.update(current_time)
+            self.advance(frame_time)
             
-            self.draw()
+            self.draw(self.interpolation_alpha())
             
             self.clock.tick(FPS)
     
+    def advance(self, frame_time):
+        """Run the fixed ticks that fit in the elapsed time and return how many ran
+        
+        Slow frames are made up with extra ticks (frames are skipped rather than
+        the game slowing down), but at most max_catch_up per call; beyond that
+        the backlog is dropped so simulation cost stays capped.
+        """
+        self.accumulator += frame_time
+        ticks = 0
+        while self.accumulator >= self.tick_ms:
+            if ticks == self.max_catch_up:
+                backlog = self.accumulator - self.accumulator % self.tick_ms
+                self.dropped_time += backlog
+                self.accumulator -= backlog
+                break
+            self.accumulator -= self.tick_ms
+            if self.state == STATE_PLAYING:
+                self.tick()
+            ticks += 1
+        return ticks
+    
+    def interpolation_alpha(self):
+        """Get how far rendering is between the previous and current tick (0-1)"""
+        if self.state != STATE_PLAYING:
+            return 1.0
+        return self.accumulator / self.tick_ms
+    
     def handle_events(self, current_time):
         """Handle input events"""
         for event in pygame.event.get():
@@ -73,95 +186,186 @@ class Game:
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     if self.state == STATE_PLAYING:
-                        self.state = STATE_PAUSED
+                        self.set_state(STATE_PAUSED)
                     elif self.state == STATE_PAUSED:
-                        self.state = STATE_PLAYING
+                        self.set_state(STATE_PLAYING)
                 elif self.state == STATE_PLAYING:
                     if event.key == pygame.K_SPACE:
-                        self.shoot(current_time)
+                        self.shot_pending = True
                 elif self.state in (STATE_MENU, STATE_PAUSED, STATE_GAME_OVER):
                     if self.menu.handle_input(event):
                         if self.state == STATE_GAME_OVER:
                             self.reset_game()
-                        self.state = STATE_PLAYING
+                        self.set_state(STATE_PLAYING)
+    
+    def set_state(self, state):
+        """Switch game state, holding generator spawns while paused"""
+        if state == STATE_PAUSED:
+            self.sim.spawn_scheduler.pause(self.sim.time)
+        elif self.state == STATE_PAUSED:
+            self.sim.spawn_scheduler.resume(self.sim.time)
+        self.state = state
     
     def shoot(self, current_time):
         """Fire a projectile"""
-        if current_time - self.last_shot_time >= self.shoot_cooldown:
-            self.last_shot_time = current_time
-            projectile = self.player.shoot()
-            self.projectiles.add(projectile)
+        self.sim.shoot(current_time)
     
-    def update(self, current_time):
-        """Update game state"""
+    def start_recording(self):
+        """Log input from now on; call before the first tick so replays start fresh"""
+        from replay import InputRecorder
+        self.recorder = InputRecorder(self.sim.tick_rate, start_time=self.sim.time,
+                                      **self.sim.modes())
+        return self.recorder
+    
+    def tick(self):
+        """Run one fixed simulation tick with the live keyboard state"""
         keys = pygame.key.get_pressed()
+        shoot = self.shot_pending
+        self.shot_pending = False
+        if self.recorder is not None:
+            self.recorder.record(keys, shoot)
         
-        # Update player
-        self.player.update(keys, self.game_map.walls)
+        if self.sim.tick(keys, shoot):
+            self.state = STATE_GAME_OVER
         
         # Update camera to follow player
         self.camera.update(self.player)
+    
+    def update(self, current_time):
+        """Update game state by one simulation tick"""
+        keys = pygame.key.get_pressed()
         
-        # Update generators (spawn enemies)
-        for generator in self.game_map.generators:
-            generator.update(current_time, self.enemies)
+        if self.sim.step(current_time, keys):
+            self.state = STATE_GAME_OVER
+        
+        # Update camera to follow player
+        self.camera.update(self.player)
+    
+    def render_position(self, sprite, view, alpha):
+        """Get a sprite's screen position interpolated between the last two ticks"""
+        x, y = sprite.rect.topleft
+        previous = self.sim.previous_positions.get(sprite)
+        if previous is not None and alpha < 1.0:
+            x = round(previous[0] + (x - previous[0]) * alpha)
+            y = round(previous[1] + (y - previous[1]) * alpha)
+        return (x - view.x, y - view.y)
+    
+    def map_changed(self, tile_x, tile_y):
+        """Note that the static layer changed, so the next frame is redrawn in full"""
+        self.needs_full_redraw = True
+    
+    def draw(self, alpha=1.0):
+        """Draw the game, interpolating moving objects by alpha between ticks
         
-        # Update enemies
-        for enemy in self.enemies:
-            enemy.update(self.player, self.game_map.walls, self.game_map)
+        In dirty-rect mode frames that can be patched are left to draw_dirty.
+        """
+        if self.use_dirty_rects and self.draw_dirty(alpha):
+            return
         
-        # Update projectiles
-        for projectile in self.projectiles:
-            projectile.update(self.game_map.walls, self.enemies, self.game_map.generators)
+        # A frozen menu frame already holds the scene, so it is one blit
+        menu_mode = MENU_MODES.get(self.state)
+        if menu_mode is None or self.needs_full_redraw:
+            self.menu.thaw()
+        elif self.menu.draw_frozen(*menu_mode):
+            pygame.display.flip()
+            return
         
-        # Check if player collides with enemy and take damage
-        hit_enemies = pygame.sprite.spritecollide(self.player, self.enemies, True)
-        for enemy in hit_enemies:
-            self.player.take_damage(enemy.damage)
-            # Check for game over
-            if self.player.health <= 0:
-                self.state = STATE_GAME_OVER
-    
-    def draw(self):
-        """Draw the game"""
         self.screen.fill(BLACK)
+        view = None
         
         if self.state == STATE_PLAYING or self.state == STATE_PAUSED or self.state == STATE_GAME_OVER:
-            # Draw walls
-            for wall in self.game_map.walls:
-                self.screen.blit(wall.image, self.camera.apply(wall))
-            
-            # Draw generators
-            for generator in self.game_map.generators:
-                self.screen.blit(generator.image, self.camera.apply(generator))
-            
-            # Draw enemies
-            for enemy in self.enemies:
-                self.screen.blit(enemy.image, self.camera.apply(enemy))
-            
-            # Draw projectiles
-            for projectile in self.projectiles:
-                self.screen.blit(projectile.image, self.camera.apply(projectile))
+            view = self.camera.view(alpha)
             
-            # Draw player
-            self.screen.blit(self.player.image, self.camera.apply(self.player))
+            # Draw walls and generators from the cached static layer
+            self.static_layer.draw(self.screen, view)
             
-            # Draw UI
-            self.draw_ui()
+            # Draw enemies, projectiles, the player and the UI
+            self.draw_dynamic(view, alpha)
         
-        if self.state == STATE_MENU:
-            self.menu.draw(is_paused=False, is_game_over=False)
-        elif self.state == STATE_PAUSED:
-            self.menu.draw(is_paused=True, is_game_over=False)
-        elif self.state == STATE_GAME_OVER:
-            self.menu.draw(is_paused=False, is_game_over=True)
+        if menu_mode is not None:
+            self.menu.draw(*menu_mode)
+            self.menu.freeze(*menu_mode)
         
         pygame.display.flip()
+        self.full_redraws += 1
+        self.last_frame = (self.state, view.topleft if view is not None else None)
+        self.needs_full_redraw = False
     
-    def draw_ui(self):
-        """Draw UI elements"""
-        font = pygame.font.Font(None, 36)
+    def draw_dirty(self, alpha=1.0):
+        """Patch only what changed since the last frame; returns False if a full redraw is needed
+        
+        The regions sprites and the UI covered last frame are restored from the
+        static layer, everything dynamic is drawn again, and only the old and
+        new regions are pushed with display.update. A camera scroll, a state
+        change or a map change falls back to a full redraw. Menus and the
+        paused scene under them do not change, so nothing is redrawn for them.
+        """
+        if self.needs_full_redraw or self.last_frame is None or self.last_frame[0] != self.state:
+            return False
+        if self.state != STATE_PLAYING:
+            return True
+        view = self.camera.view(alpha)
+        if view.topleft != self.last_frame[1]:
+            return False
+        # Too many regions last frame or this one (the player and the UI add two)
+        # cost more to patch one by one than to redraw
+        culled = self.cull(view)
+        drawing = len(culled[0]) + (len(culled[1]) if culled[1] is not None else 0) + 2
+        if max(len(self.dynamic_rects), drawing) > MAX_DIRTY_RECTS:
+            return False
+        
+        screen = self.screen
+        old_rects = self.dynamic_rects
+        for rect in old_rects:
+            screen.fill(BLACK, rect)
+            self.static_layer.draw_area(screen, view, rect)
         
-        # Draw player health
-        health_text = font.render(f"Health: {self.player.health}", True, WHITE)
-        self.screen.blit(health_text, (10, 10))
+        self.draw_dynamic(view, alpha, culled)
+        pygame.display.update(old_rects + self.dynamic_rects)
+        self.dirty_redraws += 1
+        return True
+    
+    def draw_dynamic(self, view, alpha=1.0, culled=None):
+        """Draw visible sprites, the player and the UI, remembering where they went"""
+        rects = self.draw_visible_sprites(view, alpha, culled)
+        rects.append(self.screen.blit(self.player.image, self.render_position(self.player, view, alpha)))
+        rects.append(self.draw_ui())
+        self.dynamic_rects = rects
+    
+    def cull(self, view):
+        """Get the enemies and projectiles inside a view, and the visible swarm slots (or None)"""
+        enemy_index = self.sim.enemy_hash if self.sim.enemy_hash_synced else None
+        visible = self.camera.visible(self.enemies, enemy_index, view)
+        visible.extend(self.camera.visible(self.projectiles, view=view))
+        slots = self.swarm.visible(view) if self.swarm is not None else None
+        return visible, slots
+    
+    def draw_visible_sprites(self, view, alpha=1.0, culled=None):
+        """Cull enemies and projectiles against the view and blit the visible ones
+        
+        culled is the result of cull(view) when the caller already has it.
+        Returns the screen rects drawn in dirty-rect mode, otherwise an empty list.
+        """
+        visible, slots = culled if culled is not None else self.cull(view)
+        total = len(self.enemies) + len(self.projectiles)
+        rects = [] if self.use_dirty_rects else None
+        
+        swarm_drawn = 0
+        if self.swarm is not None:
+            swarm_drawn = self.swarm.draw(self.screen, view, alpha, rects, slots)
+            total += len(self.swarm)
+        
+        drawn = self.screen.blits([(sprite.image, self.render_position(sprite, view, alpha))
+                                   for sprite in visible], doreturn=rects is not None)
+        
+        self.sprites_drawn = len(visible) + swarm_drawn
+        self.sprites_culled = total - self.sprites_drawn
+        if rects is None:
+            return []
+        rects.extend(drawn)
+        return rects
+    
+    def draw_ui(self):
+        """Draw UI elements and return the screen rect they cover"""
+        self.hud.set('health', self.player.health)
+        return self.hud.draw(self.screen)
@@ -1,19 +1,22 @@
 """
 Game map class
 """
-import pygame
 from constants import *
-from wall import Wall
-from generator import Generator
+from wall import Wall, WallGroup
+from generator import Generator, GeneratorGroup
 
 class GameMap:
     """Manages the game map layout"""
     
-    def __init__(self):
-        self.width = MAP_WIDTH
-        self.height = MAP_HEIGHT
-        self.walls = pygame.sprite.Group()
-        self.generators = pygame.sprite.Group()
+    def __init__(self, width=MAP_WIDTH, height=MAP_HEIGHT):
+        self.width = width
+        self.height = height
+        # One byte per tile, row-major, so tile lookups never scan the wall sprites
+        self.tiles = bytearray(self.width * self.height)
+        # Callbacks taking (tile_x, tile_y), run whenever a tile's contents change
+        self.change_listeners = []
+        self.walls = WallGroup(self)
+        self.generators = GeneratorGroup(self)
         self.create_map()
     
     def create_map(self):
@@ -27,35 +30,105 @@ class GameMap:
             self.walls.add(Wall(0, y))
             self.walls.add(Wall(self.width - 1, y))
         
-        # Add some interior walls to create rooms/corridors
+        # Add some interior walls to create rooms/corridors, placed in proportion
+        # to the map size (the original 40x30 layout at the default size)
+        width, height = self.width, self.height
         # Horizontal walls
-        for x in range(10, 20):
-            self.walls.add(Wall(x, 10))
-            self.walls.add(Wall(x, 20))
+        for x in range(width // 4, width // 2):
+            self.add_interior_wall(x, height // 3)
+            self.add_interior_wall(x, 2 * height // 3)
         
-        for x in range(25, 35):
-            self.walls.add(Wall(x, 15))
+        for x in range(5 * width // 8, 7 * width // 8):
+            self.add_interior_wall(x, height // 2)
         
         # Vertical walls
-        for y in range(5, 15):
-            self.walls.add(Wall(20, y))
+        for y in range(height // 6, height // 2):
+            self.add_interior_wall(width // 2, y)
         
-        for y in range(18, 25):
-            self.walls.add(Wall(30, y))
+        for y in range(3 * height // 5, 5 * height // 6):
+            self.add_interior_wall(3 * width // 4, y)
         
         # Add generators in corners and middle areas
-        self.generators.add(Generator(5, 5))
-        self.generators.add(Generator(35, 5))
-        self.generators.add(Generator(5, 25))
-        self.generators.add(Generator(35, 25))
+        corners = ((5, 5), (width - 5, 5), (5, height - 5), (width - 5, height - 5))
+        for x, y in dict.fromkeys(corners):  # Small maps can repeat a corner
+            if 0 < x < width - 1 and 0 < y < height - 1 and not self.is_solid(x, y):
+                self.generators.add(Generator(x, y))
+    
+    def add_interior_wall(self, tile_x, tile_y):
+        """Add a wall tile unless it falls on or outside the border"""
+        if 0 < tile_x < self.width - 1 and 0 < tile_y < self.height - 1:
+            self.walls.add(Wall(tile_x, tile_y))
+    
+    def in_bounds(self, tile_x, tile_y):
+        """Check if tile coordinates lie inside the map"""
+        return 0 <= tile_x < self.width and 0 <= tile_y < self.height
+    
+    def add_change_listener(self, listener):
+        """Register a callback run with (tile_x, tile_y) when a tile changes"""
+        self.change_listeners.append(listener)
+    
+    def tile_changed(self, tile_x, tile_y):
+        """Notify listeners that the contents of a tile changed"""
+        for listener in self.change_listeners:
+            listener(tile_x, tile_y)
+    
+    def set_tile(self, tile_x, tile_y, tile_type):
+        """Set the tile type at tile coordinates"""
+        if self.in_bounds(tile_x, tile_y):
+            index = tile_y * self.width + tile_x
+            if self.tiles[index] != tile_type:
+                self.tiles[index] = tile_type
+                self.tile_changed(tile_x, tile_y)
+    
+    def get_tile(self, tile_x, tile_y):
+        """Get the tile type at tile coordinates (floor outside the map)"""
+        if self.in_bounds(tile_x, tile_y):
+            return self.tiles[tile_y * self.width + tile_x]
+        return TILE_FLOOR
     
     def get_tile_at(self, x, y):
         """Get tile type at world coordinates"""
-        tile_x = x // TILE_SIZE
-        tile_y = y // TILE_SIZE
-        
-        for wall in self.walls:
-            if wall.rect.x // TILE_SIZE == tile_x and wall.rect.y // TILE_SIZE == tile_y:
-                return 'wall'
-        
+        if self.get_tile(x // TILE_SIZE, y // TILE_SIZE) == TILE_WALL:
+            return 'wall'
         return 'floor'
+    
+    def is_solid(self, tile_x, tile_y):
+        """Check if the tile at tile coordinates blocks movement"""
+        return self.get_tile(tile_x, tile_y) == TILE_WALL
+    
+    def is_solid_at(self, x, y):
+        """Check if the tile at world coordinates blocks movement"""
+        return self.is_solid(x // TILE_SIZE, y // TILE_SIZE)
+    
+    def _tile_span(self, rect):
+        """Get the clamped range of tiles a rect overlaps"""
+        left = max(rect.left // TILE_SIZE, 0)
+        top = max(rect.top // TILE_SIZE, 0)
+        right = min((rect.right - 1) // TILE_SIZE, self.width - 1)
+        bottom = min((rect.bottom - 1) // TILE_SIZE, self.height - 1)
+        return left, top, right, bottom
+    
+    def solid_tiles_in_rect(self, rect):
+        """Get the (tile_x, tile_y) of every solid tile overlapping a world rect"""
+        left, top, right, bottom = self._tile_span(rect)
+        tiles = self.tiles
+        width = self.width
+        solid = []
+        for tile_y in range(top, bottom + 1):
+            row = tile_y * width
+            for tile_x in range(left, right + 1):
+                if tiles[row + tile_x] == TILE_WALL:
+                    solid.append((tile_x, tile_y))
+        return solid
+    
+    def rect_hits_solid(self, rect):
+        """Check if a world rect overlaps any solid tile"""
+        left, top, right, bottom = self._tile_span(rect)
+        tiles = self.tiles
+        width = self.width
+        for tile_y in range(top, bottom + 1):
+            row = tile_y * width
+            for tile_x in range(left, right + 1):
+                if tiles[row + tile_x] == TILE_WALL:
+                    return True
+        return False
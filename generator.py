@@ -3,6 +3,7 @@ Enemy generator/spawner class
 """
 import pygame
 from constants import *
+from image_cache import get_surface
 from enemy import Enemy
 
 class Generator(pygame.sprite.Sprite):
@@ -10,13 +11,13 @@ class Generator(pygame.sprite.Sprite):
     
     def __init__(self, x, y):
         super().__init__()
-        self.image = pygame.Surface((TILE_SIZE, TILE_SIZE))
-        self.image.fill(PURPLE)
+        self.image = get_surface('generator', (TILE_SIZE, TILE_SIZE), PURPLE)
         self.rect = self.image.get_rect()
         self.rect.x = x * TILE_SIZE
         self.rect.y = y * TILE_SIZE
         self.last_spawn_time = 0
         self.spawn_interval = SPAWN_INTERVAL
+        self.enemy_speed = ENEMY_SPEED  # Speed given to each spawned enemy
         self.health = 3  # Takes 3 hits to destroy
         
     def take_damage(self):
@@ -25,10 +26,43 @@ class Generator(pygame.sprite.Sprite):
         if self.health <= 0:
             self.kill()
     
-    def update(self, current_time, enemies):
-        """Spawn enemies at intervals"""
-        if current_time - self.last_spawn_time >= self.spawn_interval:
-            self.last_spawn_time = current_time
-            # Spawn enemy at generator location
-            enemy = Enemy(self.rect.x, self.rect.y)
+    def next_spawn_time(self):
+        """Get the clock time at which the next enemy is due"""
+        return self.last_spawn_time + self.spawn_interval
+    
+    def update(self, current_time, enemies, pool=None):
+        """Spawn enemies at intervals into a sprite group or an EnemySwarm
+        
+        Sprite enemies are recycled from pool when one is given. Returns True
+        if an enemy was spawned.
+        """
+        if current_time - self.last_spawn_time < self.spawn_interval:
+            return False
+        self.last_spawn_time = current_time
+        # Spawn enemy at generator location
+        if isinstance(enemies, pygame.sprite.AbstractGroup):
+            if pool is not None:
+                enemy = pool.acquire(self.rect.x, self.rect.y)
+            else:
+                enemy = Enemy(self.rect.x, self.rect.y)
+            enemy.speed = self.enemy_speed
             enemies.add(enemy)
+        else:
+            enemies.spawn(self.rect.x, self.rect.y, self.enemy_speed)
+        return True
+
+
+class GeneratorGroup(pygame.sprite.Group):
+    """Sprite group of generators that reports placements and removals to the map"""
+    
+    def __init__(self, game_map):
+        super().__init__()
+        self.game_map = game_map
+    
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.game_map.tile_changed(sprite.rect.x // TILE_SIZE, sprite.rect.y // TILE_SIZE)
+    
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.game_map.tile_changed(sprite.rect.x // TILE_SIZE, sprite.rect.y // TILE_SIZE)
@@ -0,0 +1,415 @@
+"""
+Hierarchical pathfinding (HPA*) for very large maps
+"""
+from collections import deque
+from heapq import heappush, heappop
+from constants import *
+
+# Border openings at least this wide get a transition at each end instead of one in the middle
+MAX_ENTRANCE_WIDTH = 6
+# In-cluster distance maps kept between queries before the cache is emptied
+DISTANCE_CACHE_SIZE = 4096
+# Tile byte -> ASCII bit, for turning a row of tiles into an int of open tiles
+OPEN_BITS = bytes(ord('0') if value == TILE_WALL else ord('1') for value in range(256))
+
+
+def astar(game_map, start, goal, bounds=None):
+    """A* over tiles between two tile indices, inside (left, top, right, bottom) if given
+    
+    Returns the tile indices from start to goal inclusive, or None if there
+    is no path.
+    """
+    width = game_map.width
+    tiles = game_map.tiles
+    if bounds is None:
+        bounds = (0, 0, width - 1, game_map.height - 1)
+    left, top, right, bottom = bounds
+    goal_x = goal % width
+    goal_y = goal // width
+    costs = {start: 0}
+    parents = {start: None}
+    heap = [(0, 0, start)]
+    while heap:
+        _, depth, index = heappop(heap)
+        if index == goal:
+            path = []
+            while index is not None:
+                path.append(index)
+                index = parents[index]
+            path.reverse()
+            return path
+        cost = -depth
+        if cost != costs[index]:
+            continue
+        x = index % width
+        y = index // width
+        step = cost + 1
+        # Ties on f go to the deepest tile, which keeps open grids from flooding
+        for neighbour, valid in ((index - width, y > top), (index + width, y < bottom),
+                                 (index - 1, x > left), (index + 1, x < right)):
+            if valid and tiles[neighbour] != TILE_WALL and step < costs.get(neighbour, step + 1):
+                costs[neighbour] = step
+                parents[neighbour] = index
+                estimate = abs(neighbour % width - goal_x) + abs(neighbour // width - goal_y)
+                heappush(heap, (step + estimate, -step, neighbour))
+    return None
+
+
+class Route:
+    """Waypoints from HierarchicalPathfinder.find_route, refined into tiles one leg at a time"""
+    
+    def __init__(self, pathfinder, waypoints, first_leg=None):
+        self.pathfinder = pathfinder
+        self.waypoints = waypoints
+        self.goal = waypoints[-1]
+        self.next_waypoint = 1
+        # Tiles still to visit on the current leg
+        self.leg = deque(first_leg[1:]) if first_leg else deque()
+        if first_leg:
+            self.next_waypoint = len(waypoints)
+        self.failed = False
+    
+    @property
+    def finished(self):
+        return not self.leg and self.next_waypoint >= len(self.waypoints)
+    
+    def next_tile(self, index):
+        """Get the next tile index to move to from a tile, or None at the goal or on failure"""
+        leg = self.leg
+        while True:
+            while leg and leg[0] == index:
+                leg.popleft()
+            if leg:
+                return leg[0]
+            if self.next_waypoint >= len(self.waypoints):
+                return None
+            # Refine only the next leg, from where the last one ended
+            start = self.waypoints[self.next_waypoint - 1]
+            end = self.waypoints[self.next_waypoint]
+            self.next_waypoint += 1
+            tiles = self.pathfinder.refine(start, end)
+            if tiles is None:
+                self.failed = True
+                return None
+            leg.extend(tiles[1:])
+    
+    def next_step(self, x, y):
+        """Get the world center of the next tile on the route from world coordinates, or None"""
+        width = self.pathfinder.game_map.width
+        index = self.next_tile((y // TILE_SIZE) * width + x // TILE_SIZE)
+        if index is None:
+            return None
+        return ((index % width) * TILE_SIZE + TILE_SIZE // 2,
+                (index // width) * TILE_SIZE + TILE_SIZE // 2)
+
+
+class HierarchicalPathfinder:
+    """HPA* over square clusters of tiles joined by an abstract graph of their entrances
+    
+    Each border between two clusters is scanned once for openings, and each
+    opening becomes a pair of transition tiles, one per side. The shortest
+    paths between the transitions inside a cluster are found the first time
+    a search reaches it. A query links the start and goal into this graph
+    with one small search each and runs A* over clusters rather than tiles;
+    the route found is cached per (start cluster, goal cluster) pair and
+    turned into tiles one leg at a time as it is followed.
+    """
+    
+    def __init__(self, game_map, cluster_size=HPA_CLUSTER_SIZE):
+        self.game_map = game_map
+        self.cluster_size = cluster_size
+        self.clusters_x = -(-game_map.width // cluster_size)
+        self.clusters_y = -(-game_map.height // cluster_size)
+        # (cluster_x, cluster_y, axis) -> [(tile, tile across), ...] for the border
+        # with the next cluster to the right (axis 0) or below (axis 1)
+        self.borders = {}
+        self.transitions = {}  # tile -> tiles across a border from it
+        self.intra_edges = {}  # cluster -> {tile: [(tile, cost), ...]}, filled on first use
+        self.path_cache = {}  # (start cluster, goal cluster) -> waypoints between them
+        self.cluster_masks = {}  # cluster -> (open tile bits, row stride)
+        self.distance_cache = {}  # tile -> {transition: distance} within its cluster
+        self.dirty_clusters = set()
+        # Tile types as of the last change seen, to tell passability changes from other notifications
+        self.known_tiles = bytearray(game_map.tiles)
+        
+        # Statistics
+        self.queries = 0
+        self.cache_hits = 0
+        self.nodes_expanded = 0
+        
+        for cluster_y in range(self.clusters_y):
+            for cluster_x in range(self.clusters_x):
+                self.build_border(cluster_x, cluster_y, 0)
+                self.build_border(cluster_x, cluster_y, 1)
+        game_map.add_change_listener(self.tile_changed)
+    
+    def tile_changed(self, tile_x, tile_y):
+        """Mark the cluster holding a tile for rebuilding at the next query if its solidity changed
+        
+        Generators placed or destroyed notify the map too, but leave every
+        tile as passable as before, so they keep every cached route.
+        """
+        index = tile_y * self.game_map.width + tile_x
+        tile = self.game_map.tiles[index]
+        was_solid = self.known_tiles[index] == TILE_WALL
+        self.known_tiles[index] = tile
+        if (tile == TILE_WALL) != was_solid:
+            self.dirty_clusters.add((tile_x // self.cluster_size, tile_y // self.cluster_size))
+    
+    def refresh(self):
+        """Rebuild the borders of clusters that changed and drop the cached paths touching them"""
+        if not self.dirty_clusters:
+            return
+        affected = set()
+        for cluster_x, cluster_y in self.dirty_clusters:
+            self.build_border(cluster_x, cluster_y, 0)
+            self.build_border(cluster_x, cluster_y, 1)
+            self.build_border(cluster_x - 1, cluster_y, 0)
+            self.build_border(cluster_x, cluster_y - 1, 1)
+            for cluster in ((cluster_x, cluster_y), (cluster_x - 1, cluster_y), (cluster_x + 1, cluster_y),
+                            (cluster_x, cluster_y - 1), (cluster_x, cluster_y + 1)):
+                self.intra_edges.pop(cluster, None)
+                affected.add(cluster)
+            self.cluster_masks.pop((cluster_x, cluster_y), None)
+        self.dirty_clusters.clear()
+        
+        # The changed clusters and their neighbours have new transitions on their
+        # shared borders; paths and distances elsewhere are still valid
+        cluster_of = self.cluster_of
+        self.path_cache = {key: waypoints for key, waypoints in self.path_cache.items()
+                           if key[0] not in affected and key[1] not in affected
+                           and not any(cluster_of(tile) in affected for tile in waypoints)}
+        self.distance_cache = {tile: distances for tile, distances in self.distance_cache.items()
+                               if cluster_of(tile) not in affected}
+    
+    def build_border(self, cluster_x, cluster_y, axis):
+        """Find the transitions across one cluster border, replacing any found before"""
+        key = (cluster_x, cluster_y, axis)
+        for tile, across in self.borders.pop(key, ()):
+            self.unlink(tile, across)
+            self.unlink(across, tile)
+        if cluster_x < 0 or cluster_y < 0:
+            return
+        
+        size = self.cluster_size
+        width = self.game_map.width
+        height = self.game_map.height
+        if axis == 0:
+            if cluster_x + 1 >= self.clusters_x:
+                return
+            x = (cluster_x + 1) * size - 1
+            first = cluster_y * size * width + x
+            count = min(size, height - cluster_y * size)
+            along, offset = width, 1
+        else:
+            if cluster_y + 1 >= self.clusters_y:
+                return
+            y = (cluster_y + 1) * size - 1
+            first = y * width + cluster_x * size
+            count = min(size, width - cluster_x * size)
+            along, offset = 1, width
+        
+        tiles = self.game_map.tiles
+        pairs = []
+        run = []
+        for step in range(count + 1):
+            tile = first + step * along
+            if (step < count and tiles[tile] != TILE_WALL
+                    and tiles[tile + offset] != TILE_WALL):
+                run.append(tile)
+                continue
+            if run:
+                if len(run) < MAX_ENTRANCE_WIDTH:
+                    chosen = (run[len(run) // 2],)
+                else:
+                    chosen = (run[0], run[-1])
+                pairs.extend((tile, tile + offset) for tile in chosen)
+                run = []
+        
+        self.borders[key] = pairs
+        for tile, across in pairs:
+            self.transitions.setdefault(tile, []).append(across)
+            self.transitions.setdefault(across, []).append(tile)
+    
+    def unlink(self, tile, across):
+        """Remove one transition from a tile"""
+        links = self.transitions[tile]
+        links.remove(across)
+        if not links:
+            del self.transitions[tile]
+    
+    def cluster_of(self, index):
+        """Get the (cluster_x, cluster_y) holding a tile index"""
+        width = self.game_map.width
+        return ((index % width) // self.cluster_size, (index // width) // self.cluster_size)
+    
+    def cluster_bounds(self, cluster):
+        """Get the (left, top, right, bottom) tiles of a cluster"""
+        size = self.cluster_size
+        left = cluster[0] * size
+        top = cluster[1] * size
+        return (left, top, min(left + size, self.game_map.width) - 1,
+                min(top + size, self.game_map.height) - 1)
+    
+    def cluster_nodes(self, cluster):
+        """Get the transition tiles inside a cluster"""
+        cluster_x, cluster_y = cluster
+        borders = self.borders
+        nodes = [tile for tile, _ in borders.get((cluster_x, cluster_y, 0), ())]
+        nodes.extend(tile for tile, _ in borders.get((cluster_x, cluster_y, 1), ()))
+        nodes.extend(across for _, across in borders.get((cluster_x - 1, cluster_y, 0), ()))
+        nodes.extend(across for _, across in borders.get((cluster_x, cluster_y - 1, 1), ()))
+        return list(dict.fromkeys(nodes))
+    
+    def open_mask(self, cluster):
+        """Get a cluster's open tiles as a bitmask, one row per stride bits, and the stride
+        
+        Each row has a spare zero bit at its end, so shifting the mask by one
+        never carries a tile into the next row.
+        """
+        mask = self.cluster_masks.get(cluster)
+        if mask is None:
+            left, top, right, bottom = self.cluster_bounds(cluster)
+            width = self.game_map.width
+            tiles = self.game_map.tiles
+            stride = right - left + 2
+            bits = 0
+            for row in range(bottom - top + 1):
+                start = (top + row) * width + left
+                # Reversed so the leftmost tile becomes the lowest bit
+                row_bits = tiles[start:start + stride - 1].translate(OPEN_BITS)[::-1]
+                bits |= int(row_bits, 2) << (row * stride)
+            mask = self.cluster_masks[cluster] = (bits, stride)
+        return mask
+    
+    def transition_distances(self, start):
+        """Get the step distance from a tile to each transition it reaches without leaving its cluster
+        
+        The search is breadth-first over the cluster's bitmask, a whole ring
+        of tiles per step, and stops once every transition has been reached.
+        """
+        distances = self.distance_cache.get(start)
+        if distances is not None:
+            return distances
+        if len(self.distance_cache) >= DISTANCE_CACHE_SIZE:
+            self.distance_cache.clear()
+        
+        width = self.game_map.width
+        cluster = self.cluster_of(start)
+        left, top, _, _ = self.cluster_bounds(cluster)
+        open_bits, stride = self.open_mask(cluster)
+        targets = {}
+        for node in self.cluster_nodes(cluster):
+            targets[1 << ((node // width - top) * stride + node % width - left)] = node
+        remaining = sum(targets)
+        
+        distances = {}
+        frontier = visited = 1 << ((start // width - top) * stride + start % width - left)
+        distance = 0
+        while frontier and remaining:
+            reached = frontier & remaining
+            if reached:
+                remaining ^= reached
+                for bit, node in targets.items():
+                    if reached & bit:
+                        distances[node] = distance
+            frontier = ((frontier << 1) | (frontier >> 1) | (frontier << stride)
+                        | (frontier >> stride)) & open_bits & ~visited
+            visited |= frontier
+            distance += 1
+        self.distance_cache[start] = distances
+        return distances
+    
+    def cluster_edges(self, cluster):
+        """Get the abstract edges between the transitions of a cluster, finding them on first use"""
+        edges = self.intra_edges.get(cluster)
+        if edges is None:
+            nodes = self.cluster_nodes(cluster)
+            edges = {}
+            for node in nodes:
+                distances = self.transition_distances(node)
+                edges[node] = [(other, distances[other]) for other in nodes
+                               if other != node and other in distances]
+            self.intra_edges[cluster] = edges
+        return edges
+    
+    def tile_index(self, x, y):
+        """Get the tile index at world coordinates"""
+        return (y // TILE_SIZE) * self.game_map.width + x // TILE_SIZE
+    
+    def find_route(self, start, goal):
+        """Plan a Route between two tile indices, or None if the goal cannot be reached"""
+        self.refresh()
+        self.queries += 1
+        tiles = self.game_map.tiles
+        if tiles[start] == TILE_WALL or tiles[goal] == TILE_WALL:
+            return None
+        start_cluster = self.cluster_of(start)
+        goal_cluster = self.cluster_of(goal)
+        if start_cluster == goal_cluster:
+            path = astar(self.game_map, start, goal, self.cluster_bounds(start_cluster))
+            if path is not None:
+                return Route(self, [start, goal], path)
+        
+        start_distances = self.transition_distances(start)
+        goal_distances = self.transition_distances(goal)
+        cached = self.path_cache.get((start_cluster, goal_cluster))
+        if cached and cached[0] in start_distances and cached[-1] in goal_distances:
+            self.cache_hits += 1
+            return Route(self, [start] + cached + [goal])
+        
+        waypoints = self.search(start, goal, start_distances, goal_distances)
+        if waypoints is None:
+            return None
+        if len(waypoints) > 2:
+            self.path_cache[(start_cluster, goal_cluster)] = waypoints[1:-1]
+        return Route(self, waypoints)
+    
+    def search(self, start, goal, start_distances, goal_distances):
+        """A* over the abstract graph with the start and goal linked in; returns waypoints"""
+        width = self.game_map.width
+        goal_x = goal % width
+        goal_y = goal // width
+        start_cluster = self.cluster_of(start)
+        goal_cluster = self.cluster_of(goal)
+        costs = {start: 0}
+        parents = {start: None}
+        heap = [(0, 0, start)]
+        while heap:
+            _, cost, node = heappop(heap)
+            if node == goal:
+                waypoints = []
+                while node is not None:
+                    waypoints.append(node)
+                    node = parents[node]
+                waypoints.reverse()
+                return waypoints
+            if cost != costs[node]:
+                continue
+            self.nodes_expanded += 1
+            
+            cluster = self.cluster_of(node)
+            if node == start:
+                links = [(other, start_distances[other]) for other in self.cluster_nodes(start_cluster)
+                         if other != start and other in start_distances]
+            else:
+                links = list(self.cluster_edges(cluster).get(node, ()))
+            links.extend((across, 1) for across in self.transitions.get(node, ()))
+            if cluster == goal_cluster and node in goal_distances:
+                links.append((goal, goal_distances[node]))
+            
+            for other, length in links:
+                step = cost + length
+                if step < costs.get(other, step + 1):
+                    costs[other] = step
+                    parents[other] = node
+                    estimate = abs(other % width - goal_x) + abs(other // width - goal_y)
+                    heappush(heap, (step + estimate, step, other))
+        return None
+    
+    def refine(self, start, end):
+        """Get the tiles of one leg between consecutive waypoints, or None if it is blocked"""
+        self.refresh()
+        if self.transitions.get(start) and end in self.transitions[start]:
+            return [start, end]
+        return astar(self.game_map, start, end, self.cluster_bounds(self.cluster_of(start)))
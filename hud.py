@@ -0,0 +1,72 @@
+"""
+Heads-up display composed from cached text widgets
+"""
+import pygame
+from constants import *
+
+HUD_FONT_SIZE = 36
+TEXT_CACHE_SIZE = 64  # Rendered texts kept per widget
+
+
+class HudWidget:
+    """One line of HUD text showing a value, such as "Health: 1000" """
+    
+    def __init__(self, label, position, color=WHITE):
+        self.label = label
+        self.position = position
+        self.color = color
+        self.value = None
+        # value -> rendered Surface, oldest first
+        self.cache = {}
+    
+    def render(self, font):
+        """Get the text surface for the current value, rendering it only if not cached"""
+        surface = self.cache.get(self.value)
+        if surface is None:
+            if len(self.cache) >= TEXT_CACHE_SIZE:
+                del self.cache[next(iter(self.cache))]
+            surface = self.cache[self.value] = font.render(f"{self.label}: {self.value}",
+                                                           True, self.color)
+        return surface
+
+
+class Hud:
+    """Named widgets drawn from one surface that is recomposed only when a value changes"""
+    
+    def __init__(self, font_size=HUD_FONT_SIZE):
+        self.font = pygame.font.Font(None, font_size)
+        self.widgets = {}
+        self.surface = None
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.compositions = 0
+    
+    def add_widget(self, name, label, position, color=WHITE):
+        """Add a line of text at a screen position, shown once its value is set"""
+        self.widgets[name] = HudWidget(label, position, color)
+        self.surface = None
+    
+    def set(self, name, value):
+        """Update a widget's value; the HUD is recomposed only if it changed"""
+        widget = self.widgets[name]
+        if widget.value != value:
+            widget.value = value
+            self.surface = None
+    
+    def compose(self):
+        """Render every widget into one surface covering all of them"""
+        parts = [(widget.render(self.font), widget.position)
+                 for widget in self.widgets.values() if widget.value is not None]
+        rects = [text.get_rect(topleft=position) for text, position in parts]
+        self.rect = rects[0].unionall(rects[1:]) if rects else pygame.Rect(0, 0, 0, 0)
+        self.surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        for text, position in parts:
+            self.surface.blit(text, (position[0] - self.rect.x, position[1] - self.rect.y))
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha()
+        self.compositions += 1
+    
+    def draw(self, screen):
+        """Blit the HUD and return the screen rect it covers"""
+        if self.surface is None:
+            self.compose()
+        return screen.blit(self.surface, self.rect)
@@ -0,0 +1,68 @@
+"""
+Shared surface cache for plain colored sprite images
+"""
+import pygame
+
+# (kind, size, color, flags) -> shared Surface
+_surfaces = {}
+# Keys whose surface has been converted to the display format
+_converted = set()
+# (kind, size, color, flags) -> number of get_surface calls since clear(), never decremented
+_requests = {}
+
+def get_surface(kind, size, color, flags=0):
+    """Get the one shared surface for a sprite kind, filling and converting it once
+    
+    The returned surface is shared by every caller, so it must not be drawn on.
+    """
+    key = (kind, size, color, flags)
+    _requests[key] = _requests.get(key, 0) + 1
+    surface = _surfaces.get(key)
+    if surface is None:
+        surface = pygame.Surface(size, flags)
+        surface.fill(color)
+        _surfaces[key] = surface
+    
+    # Surfaces made before the display existed are converted on first use afterwards
+    if key not in _converted and pygame.display.get_surface() is not None:
+        if flags & pygame.SRCALPHA:
+            surface = surface.convert_alpha()
+        else:
+            surface = surface.convert()
+        _surfaces[key] = surface
+        _converted.add(key)
+    return surface
+
+def clear():
+    """Drop every cached surface and request count"""
+    _surfaces.clear()
+    _converted.clear()
+    _requests.clear()
+
+def memory_report():
+    """Compare pixel memory of the shared surfaces with one surface per request
+    
+    Requests are cumulative get_surface calls since clear(), so with pooled
+    or respawned sprites they exceed the live sprites, and unshared_bytes is
+    what uncached sprites would have allocated, not what they would hold now.
+    Returns a dict keyed by kind with 'requests', 'surfaces', 'shared_bytes'
+    and 'unshared_bytes', plus a 'total' entry summing them.
+    """
+    report = {}
+    for key, surface in _surfaces.items():
+        kind = key[0]
+        requests = _requests.get(key, 0)
+        surface_bytes = surface.get_pitch() * surface.get_height()
+        entry = report.setdefault(kind, {'requests': 0, 'surfaces': 0,
+                                         'shared_bytes': 0, 'unshared_bytes': 0})
+        entry['requests'] += requests
+        entry['surfaces'] += 1
+        entry['shared_bytes'] += surface_bytes
+        entry['unshared_bytes'] += surface_bytes * requests
+    
+    total = {'requests': 0, 'surfaces': 0, 'shared_bytes': 0, 'unshared_bytes': 0}
+    for entry in report.values():
+        for field in total:
+            total[field] += entry[field]
+    report['total'] = total
+    return report
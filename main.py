@@ -2,15 +2,35 @@
 pyGauntlet - A Gauntlet II-inspired game
 Main entry point for the game
 """
+import sys
 import pygame
 from game import Game
 
-def main():
-    """Initialize and run the game"""
+def main(argv=()):
+    """Initialize and run the game
+    
+    Pass --record FILE to save the session's input for replay.py.
+    """
+    record_path = None
+    if '--record' in argv:
+        index = argv.index('--record') + 1
+        if index >= len(argv) or argv[index].startswith('--'):
+            print("usage: python main.py [--record FILE]")
+            return 1
+        record_path = argv[index]
+    
     pygame.init()
     game = Game()
-    game.run()
+    if record_path:
+        game.start_recording()
+    try:
+        game.run()
+    finally:
+        # Keep the input up to a crash, so it can be replayed
+        if record_path:
+            game.recorder.save(record_path)
     pygame.quit()
+    return 0
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main(sys.argv[1:]))
@@ -5,21 +5,37 @@ import pygame
 from constants import *
 
 class Menu:
-    """Game menu for start and pause screens"""
+    """Game menu for start and pause screens
     
-    def __init__(self, screen):
+    The overlay and text surfaces are rendered once per screen size and
+    menu state, selected option included. With freeze_background the
+    whole menu frame, scene included, is cached too, so a paused game
+    costs one blit per frame.
+    """
+    
+    def __init__(self, screen, freeze_background=False):
         self.screen = screen
         self.font_title = pygame.font.Font(None, 72)
         self.font_option = pygame.font.Font(None, 48)
         self.selected_index = 0
+        self.freeze_background = freeze_background
         
-    def draw(self, is_paused=False, is_game_over=False):
-        """Draw the menu"""
-        # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
+        # Cached surfaces, dropped by invalidate()
+        self.size = None
+        self.overlay = None
+        self.texts = {}  # (is_paused, is_game_over, selected_index) -> [(surface, rect)]
+        self.frozen = None  # (key, copy of the screen) when freeze_background is on
+    
+    def invalidate(self):
+        """Drop every cached surface so the next draw renders them again"""
+        self.size = self.screen.get_size()
+        self.overlay = None
+        self.texts = {}
+        self.frozen = None
+    
+    def render_texts(self, is_paused, is_game_over):
+        """Render the title and option for a menu state, centered on the screen"""
+        width, height = self.size
         
         # Title
         if is_game_over:
@@ -30,8 +46,7 @@ class Menu:
             title_color = YELLOW
         
         title_surface = self.font_title.render(title_text, True, title_color)
-        title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3))
-        self.screen.blit(title_surface, title_rect)
+        title_rect = title_surface.get_rect(center=(width // 2, height // 3))
         
         # Menu option
         if is_paused:
@@ -41,8 +56,46 @@ class Menu:
         
         option_color = GREEN if self.selected_index == 0 else WHITE
         option_surface = self.font_option.render(option_text, True, option_color)
-        option_rect = option_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        self.screen.blit(option_surface, option_rect)
+        option_rect = option_surface.get_rect(center=(width // 2, height // 2))
+        return [(title_surface, title_rect), (option_surface, option_rect)]
+    
+    def draw(self, is_paused=False, is_game_over=False):
+        """Draw the menu over whatever is on the screen"""
+        if self.screen.get_size() != self.size:
+            self.invalidate()
+        
+        # Semi-transparent overlay
+        if self.overlay is None:
+            self.overlay = pygame.Surface(self.size)
+            self.overlay.set_alpha(200)
+            self.overlay.fill(BLACK)
+        self.screen.blit(self.overlay, (0, 0))
+        
+        key = (is_paused, is_game_over, self.selected_index)
+        texts = self.texts.get(key)
+        if texts is None:
+            texts = self.texts[key] = self.render_texts(is_paused, is_game_over)
+        self.screen.blits(texts, doreturn=False)
+    
+    def freeze(self, is_paused=False, is_game_over=False):
+        """Cache the screen, scene and menu together, if freeze_background is on"""
+        if self.freeze_background:
+            key = (is_paused, is_game_over, self.selected_index, self.screen.get_size())
+            self.frozen = (key, self.screen.copy())
+    
+    def draw_frozen(self, is_paused=False, is_game_over=False):
+        """Blit the frozen frame for a menu state; returns False if there is none"""
+        if self.frozen is None:
+            return False
+        key, surface = self.frozen
+        if key != (is_paused, is_game_over, self.selected_index, self.screen.get_size()):
+            return False
+        self.screen.blit(surface, (0, 0))
+        return True
+    
+    def thaw(self):
+        """Forget the frozen frame once the scene behind the menu changes"""
+        self.frozen = None
         
     def handle_input(self, event):
         """Handle menu input and return True if selection was made"""
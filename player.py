@@ -2,9 +2,10 @@
 Player character class
 """
 import pygame
-import os
 from constants import *
+from wall import WallGroup
 from entities.character import AnimatedCharacter
+from assets import assets, CHARACTER_SHEET
 
 class Player(pygame.sprite.Sprite):
     """Warrior character controlled by the player"""
@@ -13,22 +14,21 @@ class Player(pygame.sprite.Sprite):
         super().__init__()
         
         # Try to load animated sprite, fallback to colored square if not available
-        sprite_path = os.path.join('resources', 'sprites', 'character-spritesheet.png')
-        if os.path.exists(sprite_path):
-            self.animated_char = AnimatedCharacter(x, y, sprite_path, 
-                                                   SPRITE_FRAME_SIZE, ANIMATION_SPEED)
-            self.image = self.animated_char.image
-            self.rect = self.animated_char.rect
+        self.sprite_path = assets.resolve(CHARACTER_SHEET)
+        self._animated_char = None
+        if assets.exists(self.sprite_path):
+            # The sheet is loaded on first use (see animated_char), so a preload still
+            # running does not block construction; the rect already has the frame size
+            self.rect = pygame.Rect(x, y, SPRITE_FRAME_SIZE, SPRITE_FRAME_SIZE)
             self.has_animation = True
         else:
             # Fallback to simple colored square
-            self.image = pygame.Surface((TILE_SIZE - 4, TILE_SIZE - 4))
-            self.image.fill(BLUE)
-            self.rect = self.image.get_rect()
+            self._image = pygame.Surface((TILE_SIZE - 4, TILE_SIZE - 4))
+            self._image.fill(BLUE)
+            self.rect = self._image.get_rect()
             self.rect.x = x
             self.rect.y = y
             self.has_animation = False
-            self.animated_char = None
         
         self.speed = PLAYER_SPEED
         self.last_direction = (0, -1)  # Up by default
@@ -75,14 +75,33 @@ class Player(pygame.sprite.Sprite):
         if self.has_animation:
             self.animated_char.rect = self.rect  # Sync position
             self.animated_char.update_animation()
-            self.image = self.animated_char.image
+    
+    @property
+    def animated_char(self):
+        """The AnimatedCharacter, created on first use (waiting for a sheet still preloading)"""
+        if self._animated_char is None and self.has_animation:
+            self._animated_char = AnimatedCharacter(self.rect.x, self.rect.y, self.sprite_path,
+                                                    SPRITE_FRAME_SIZE, ANIMATION_SPEED)
+            self._animated_char.rect = self.rect
+        return self._animated_char
+    
+    @property
+    def image(self):
+        """The current animation frame, or the colored square without a sprite sheet"""
+        if self.has_animation:
+            return self.animated_char.image
+        return self._image
     
     def check_collision(self, walls):
         """Check if player collides with any wall"""
+        if isinstance(walls, WallGroup):
+            return walls.collides_rect(self.rect)
         return pygame.sprite.spritecollideany(self, walls) is not None
     
-    def shoot(self):
-        """Create and return a projectile"""
+    def shoot(self, pool=None):
+        """Create and return a projectile, recycled from a pool if given"""
+        if pool is not None:
+            return pool.acquire(self.rect.centerx, self.rect.centery, self.last_direction)
         from projectile import Projectile
         return Projectile(
             self.rect.centerx,
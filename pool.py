@@ -0,0 +1,57 @@
+"""
+Object pools that recycle killed sprites
+"""
+import pygame
+
+class PooledSprite(pygame.sprite.Sprite):
+    """Sprite that hands itself back to the pool that created it when killed"""
+    
+    pool = None
+    
+    def kill(self):
+        """Remove from all groups and return to the owning pool, if any"""
+        was_alive = self.alive()
+        super().kill()
+        # Only release once, even if kill() is called on an already dead sprite
+        if was_alive and self.pool is not None:
+            self.pool.release(self)
+
+
+class SpritePool:
+    """Recycles killed sprites of one class instead of allocating new ones
+    
+    Pooled classes must provide reset(*args) taking the same arguments as
+    their constructor and restoring all per-instance state.
+    """
+    
+    def __init__(self, sprite_class):
+        self.sprite_class = sprite_class
+        self.free = []
+        self.hits = 0
+        self.misses = 0
+    
+    def acquire(self, *args):
+        """Get a reset sprite from the pool, creating one if the pool is empty"""
+        if self.free:
+            sprite = self.free.pop()
+            sprite.reset(*args)
+            self.hits += 1
+        else:
+            sprite = self.sprite_class(*args)
+            sprite.pool = self
+            self.misses += 1
+        return sprite
+    
+    def release(self, sprite):
+        """Return a dead sprite to the pool"""
+        self.free.append(sprite)
+    
+    def stats(self):
+        """Get hit/miss counts, the hit rate and the number of idle sprites"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'free': len(self.free),
+        }
@@ -1,51 +1,78 @@
 """
 Projectile class for player attacks
 """
-import pygame
 from constants import *
+from image_cache import get_surface
+from wall import WallGroup
+from sweep import first_solid_time, sweep_collide
+from pool import PooledSprite
 
-class Projectile(pygame.sprite.Sprite):
+class Projectile(PooledSprite):
     """A projectile fired by the player"""
     
     def __init__(self, x, y, direction):
         super().__init__()
-        self.image = pygame.Surface((8, 8))
-        self.image.fill(YELLOW)
+        self.image = get_surface('projectile', (8, 8), YELLOW)
         self.rect = self.image.get_rect()
+        self.reset(x, y, direction)
+    
+    def reset(self, x, y, direction):
+        """Launch the projectile from a position (also used when recycled)"""
         self.rect.center = (x, y)
         self.direction = direction
         self.speed = PROJECTILE_SPEED
         self.hit_generators = set()  # Track which generators have been hit
         
     def update(self, walls, enemies, generators=None):
-        """Update projectile position"""
-        # Move in direction
-        self.rect.x += self.direction[0] * self.speed
-        self.rect.y += self.direction[1] * self.speed
+        """Move the projectile, stopping at the first wall, generator or enemy on its path
         
-        # Check if hit wall
-        if pygame.sprite.spritecollideany(self, walls):
-            self.kill()
-            return
+        The whole segment travelled this tick is swept (see sweep.py), so
+        nothing is skipped however fast the projectile is. enemies and
+        generators may be sprite groups or SpatialHash broadphases, and
+        enemies may also be an EnemySwarm.
+        """
+        dx = self.direction[0] * self.speed
+        dy = self.direction[1] * self.speed
+        
+        # When the projectile first touches each kind of obstacle, as a fraction of the move;
+        # ties go to walls, then generators, then enemies
+        if isinstance(walls, WallGroup):
+            hit_time = first_solid_time(walls.game_map, self.rect, dx, dy)
+        else:
+            hit_time = sweep_collide(self.rect, dx, dy, walls)[0]
+        until = 1.0 if hit_time is None else hit_time
         
-        # Check if hit generator (damages generator and destroys projectile)
+        # Generators each take damage only once per projectile
+        generator = None
         if generators:
-            hit_generators = pygame.sprite.spritecollide(self, generators, False)
-            for generator in hit_generators:
-                # Only damage each generator once per projectile
-                if generator not in self.hit_generators:
-                    generator.take_damage()
-                    self.hit_generators.add(generator)
-                    self.kill()
-                    return
-        
-        # Check if hit enemy
-        hit_enemies = pygame.sprite.spritecollide(self, enemies, True)
+            generator_time, hit_generators = sweep_collide(self.rect, dx, dy, generators, until,
+                                                           exclude=self.hit_generators)
+            if hit_generators:
+                until = hit_time = generator_time
+                generator = hit_generators[0]
+        
+        # Enemies reached before any wall or generator are destroyed
+        enemy_time, hit_enemies = sweep_collide(self.rect, dx, dy, enemies, until, dokill=True)
         if hit_enemies:
+            hit_time = enemy_time
+            generator = None
+        
+        if hit_time is not None:
+            self.rect.move_ip(round(dx * hit_time), round(dy * hit_time))
+            if generator is not None:
+                generator.take_damage()
+                self.hit_generators.add(generator)
             self.kill()
             return
         
+        self.rect.move_ip(dx, dy)
+        
         # Check if out of bounds
-        if (self.rect.x < 0 or self.rect.x > MAP_WIDTH * TILE_SIZE or
-            self.rect.y < 0 or self.rect.y > MAP_HEIGHT * TILE_SIZE):
+        if isinstance(walls, WallGroup):
+            width = walls.game_map.width * TILE_SIZE
+            height = walls.game_map.height * TILE_SIZE
+        else:
+            width = MAP_WIDTH * TILE_SIZE
+            height = MAP_HEIGHT * TILE_SIZE
+        if self.rect.x < 0 or self.rect.x > width or self.rect.y < 0 or self.rect.y > height:
             self.kill()
@@ -0,0 +1,153 @@
+"""
+Deterministic input recording and replay of simulation sessions
+
+A recording is a small header followed by one byte per simulation tick
+holding the arrow keys, whether SPACE fired before the tick, and whether
+the game was reset. The tick clock is implied by the tick rate, so
+replaying the bytes into a fresh Simulation reproduces the session exactly.
+"""
+import struct
+import sys
+import time
+
+import pygame
+from constants import *
+from simulation import Simulation
+
+MAGIC = b'PGRC'
+VERSION = 1
+# magic, version, flags, tick rate, simulation clock at the first tick
+HEADER = struct.Struct('<4sBBHd')
+
+# Bits of each per-tick input byte
+KEY_BITS = ((pygame.K_LEFT, 1), (pygame.K_RIGHT, 2), (pygame.K_UP, 4), (pygame.K_DOWN, 8))
+SHOOT_BIT = 16
+RESET_BIT = 32
+
+
+class ReplayKeys:
+    """Key state decoded from one recorded input byte"""
+    
+    def __init__(self, bits=0):
+        self.bits = bits
+    
+    def __getitem__(self, key):
+        for code, bit in KEY_BITS:
+            if key == code:
+                return bool(self.bits & bit)
+        return False
+
+
+class InputRecorder:
+    """Logs the per-tick input of a session that starts from a fresh Simulation"""
+    
+    def __init__(self, tick_rate=SIM_TICK_RATE, use_swarm=False, start_time=0.0,
+                 use_hpa=False, use_ai_lod=False, use_separation=False):
+        self.tick_rate = tick_rate
+        self.modes = {'use_swarm': use_swarm, 'use_hpa': use_hpa, 'use_ai_lod': use_ai_lod,
+                      'use_separation': use_separation}
+        self.start_time = start_time
+        self.inputs = bytearray()
+        self.pending_reset = False
+    
+    def __len__(self):
+        return len(self.inputs)
+    
+    def mark_reset(self):
+        """Note that the game is reset before the next recorded tick"""
+        self.pending_reset = True
+    
+    def record(self, keys, shoot=False):
+        """Log the input for one tick"""
+        bits = 0
+        for code, bit in KEY_BITS:
+            if keys[code]:
+                bits |= bit
+        if shoot:
+            bits |= SHOOT_BIT
+        if self.pending_reset:
+            bits |= RESET_BIT
+            self.pending_reset = False
+        self.inputs.append(bits)
+    
+    def to_bytes(self):
+        """Encode the header and inputs"""
+        flags = sum(bit for name, bit in Simulation.MODE_FLAGS if self.modes[name])
+        return HEADER.pack(MAGIC, VERSION, flags, self.tick_rate, self.start_time) + bytes(self.inputs)
+    
+    def save(self, path):
+        """Write the recording to a file"""
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+
+class InputReplayer:
+    """Drives a Simulation from a recording, at real speed or as fast as possible"""
+    
+    def __init__(self, data):
+        magic, version, flags, tick_rate, start_time = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a pyGauntlet input recording")
+        self.tick_rate = tick_rate
+        self.modes = {name: bool(flags & bit) for name, bit in Simulation.MODE_FLAGS}
+        self.start_time = start_time
+        self.inputs = bytes(data[HEADER.size:])
+    
+    @classmethod
+    def load(cls, path):
+        """Read a recording from a file"""
+        with open(path, 'rb') as f:
+            return cls(f.read())
+    
+    def __len__(self):
+        return len(self.inputs)
+    
+    def create_simulation(self):
+        """Build the fresh Simulation the recording started from"""
+        sim = Simulation(tick_rate=self.tick_rate, **self.modes)
+        sim.time = self.start_time
+        return sim
+    
+    def play(self, sim=None, realtime=False, on_tick=None):
+        """Replay every tick into sim (a fresh one by default) and return it
+        
+        on_tick, if given, is called with the simulation after each tick.
+        """
+        if sim is None:
+            sim = self.create_simulation()
+        elif sim.modes() != self.modes:
+            raise ValueError(f"Recording made with {self.modes}, simulation uses {sim.modes()}")
+        keys = ReplayKeys()
+        tick_seconds = 1 / self.tick_rate
+        start = time.perf_counter()
+        for index, bits in enumerate(self.inputs):
+            if bits & RESET_BIT:
+                sim.reset()
+            keys.bits = bits
+            sim.tick(keys, shoot=bool(bits & SHOOT_BIT))
+            if on_tick is not None:
+                on_tick(sim)
+            if realtime:
+                delay = start + (index + 1) * tick_seconds - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+        return sim
+
+
+def main(argv):
+    """Replay a recording headless and report throughput: replay.py FILE [--realtime]"""
+    if not argv:
+        print("usage: python replay.py RECORDING [--realtime]")
+        return 1
+    replayer = InputReplayer.load(argv[0])
+    start = time.perf_counter()
+    sim = replayer.play(realtime='--realtime' in argv[1:])
+    elapsed = time.perf_counter() - start
+    print(f"Replayed {len(replayer)} ticks in {elapsed:.2f} s "
+          f"({len(replayer) / elapsed:,.0f} ticks/sec)")
+    print(f"Player health: {sim.player.health}, position: {sim.player.rect.topleft}")
+    print(f"Enemies alive: {len(sim.enemies)}, projectiles: {len(sim.projectiles)}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
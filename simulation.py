@@ -0,0 +1,251 @@
+"""
+Display-free simulation core that runs the game rules tick by tick
+"""
+import pygame
+from constants import *
+from player import Player
+from game_map import GameMap
+from spatial_hash import SpatialHash
+from flow_field import FlowField
+from hpa import HierarchicalPathfinder
+from ai_scheduler import AIScheduler
+from spawn_scheduler import SpawnScheduler
+from pool import SpritePool
+from enemy import Enemy
+from projectile import Projectile
+from snapshot import take_snapshot, restore_snapshot
+
+class NoKeys:
+    """Key state with nothing pressed, for ticks without player input"""
+    
+    def __getitem__(self, key):
+        return False
+
+
+# Tunable rules a Simulation can override per instance, with their defaults
+DEFAULT_PARAMS = {
+    'spawn_interval': SPAWN_INTERVAL,  # milliseconds between spawns per generator
+    'enemy_speed': ENEMY_SPEED,
+    'generator_health': 3,
+    'player_health': 1000,
+    'shoot_cooldown': 250,  # milliseconds
+}
+
+
+class Simulation:
+    """Game state and per-tick rules, with no display, fonts or event handling
+    
+    Game wraps this with rendering and input; headless tools can step it directly.
+    params overrides entries of DEFAULT_PARAMS for this instance only, leaving
+    the module-level constants untouched. use_hpa gives sprite enemies their
+    own routes from the hierarchical pathfinder instead of the flow field,
+    use_ai_lod updates distant sprite enemies less often (ai_scheduler.py),
+    and use_separation pushes overlapping enemies apart after they move (crowd.py).
+    """
+    
+    def __init__(self, use_swarm=USE_ENEMY_SWARM, tick_rate=SIM_TICK_RATE, params=None,
+                 use_hpa=USE_HIERARCHICAL_PATHFINDING, use_ai_lod=USE_AI_LOD,
+                 use_separation=USE_CROWD_SEPARATION):
+        unknown = set(params or ()) - set(DEFAULT_PARAMS)
+        if unknown:
+            raise ValueError(f"Unknown simulation parameters: {sorted(unknown)}")
+        self.params = dict(DEFAULT_PARAMS, **(params or {}))
+        
+        self.tick_rate = tick_rate
+        self.tick_ms = 1000 / tick_rate
+        self.time = 0.0  # Simulation clock used by tick()
+        self.ticks = 0
+        
+        self.game_map = GameMap()
+        for generator in self.game_map.generators:
+            generator.spawn_interval = self.params['spawn_interval']
+            generator.enemy_speed = self.params['enemy_speed']
+            generator.health = self.params['generator_health']
+        # Wakes only the generators due to spawn on each tick
+        self.spawn_scheduler = SpawnScheduler(self.game_map)
+        # Optional per-enemy routes for sprite enemies (the swarm keeps the flow field)
+        self.pathfinder = HierarchicalPathfinder(self.game_map) if use_hpa else None
+        # The shared flow field, built only when something follows it, since it
+        # queues every map change until its next update
+        self.flow_field = None
+        if self.pathfinder is None or use_swarm:
+            self.flow_field = FlowField(self.game_map)
+        # Optional level of detail that thins out AI updates for distant enemies
+        self.ai_scheduler = AIScheduler() if use_ai_lod else None
+        # Place player at a safe starting position
+        self.player = self.create_player()
+        
+        # Running totals for balance tuning
+        self.kills = 0
+        self.damage_taken = 0
+        self.generators_destroyed = 0
+        
+        # Sprite groups
+        self.enemies = pygame.sprite.Group()
+        self.projectiles = pygame.sprite.Group()
+        
+        # Pools that recycle killed enemies and projectiles
+        self.enemy_pool = SpritePool(Enemy)
+        self.projectile_pool = SpritePool(Projectile)
+        
+        # Optional array-backed store that replaces enemy sprites for huge hordes
+        self.swarm = None
+        if use_swarm:
+            from swarm import EnemySwarm
+            self.swarm = EnemySwarm()
+        
+        # Optional batched separation so enemies chasing the player do not stack up
+        self.crowd = None
+        if use_separation:
+            from crowd import CrowdSeparation
+            self.crowd = CrowdSeparation()
+        
+        # Broadphases rebuilt once per tick for projectile and player collisions
+        self.enemy_hash = SpatialHash()
+        self.generator_hash = SpatialHash()
+        # Only trusted for culling once step has rebuilt it from current positions
+        self.enemy_hash_synced = False
+        
+        # Sprite -> top-left before the current tick, for render interpolation
+        self.previous_positions = {}
+        
+        # Shooting cooldown
+        self.can_shoot = True
+        self.shoot_cooldown = self.params['shoot_cooldown']
+        # The simulation clock starts at zero, so allow a shot on the very first tick
+        self.last_shot_time = -self.shoot_cooldown
+    
+    def create_player(self):
+        """Create the player at the starting position with the configured health"""
+        player = Player(PLAYER_START_X * TILE_SIZE, PLAYER_START_Y * TILE_SIZE)
+        player.health = self.params['player_health']
+        return player
+    
+    def reset(self):
+        """Reset the player, enemies and projectiles (the map is kept)"""
+        # Reset player to starting position
+        self.player = self.create_player()
+        
+        # Clear all sprites, returning pooled ones to their pools
+        for sprite in self.enemies.sprites() + self.projectiles.sprites():
+            sprite.kill()
+        if self.swarm is not None:
+            self.swarm.clear()
+        self.enemy_hash.clear()
+        self.enemy_hash_synced = False
+        self.previous_positions = {}
+        
+        # Reset shooting cooldown
+        self.last_shot_time = -self.shoot_cooldown
+    
+    def snapshot(self):
+        """Encode the current state as compact bytes (see snapshot.py)"""
+        return take_snapshot(self)
+    
+    def restore(self, data):
+        """Return to a state captured by snapshot() on a simulation of the same map"""
+        restore_snapshot(self, data)
+        self.spawn_scheduler.rebuild()
+    
+    # Header flag bit of each mode in modes(), shared by snapshot and replay files
+    MODE_FLAGS = (('use_swarm', 1), ('use_hpa', 2), ('use_ai_lod', 4), ('use_separation', 8))
+    
+    def modes(self):
+        """The optional behaviours that change enemy movement, as constructor keywords"""
+        return {'use_swarm': self.swarm is not None, 'use_hpa': self.pathfinder is not None,
+                'use_ai_lod': self.ai_scheduler is not None,
+                'use_separation': self.crowd is not None}
+    
+    def enemy_count(self):
+        """Get the number of live enemies, sprites and swarm together"""
+        if self.swarm is None:
+            return len(self.enemies)
+        return len(self.enemies) + len(self.swarm)
+    
+    def shoot(self, current_time):
+        """Fire a projectile if the cooldown has passed"""
+        if current_time - self.last_shot_time >= self.shoot_cooldown:
+            self.last_shot_time = current_time
+            projectile = self.player.shoot(self.projectile_pool)
+            self.projectiles.add(projectile)
+    
+    def tick(self, keys=None, shoot=False):
+        """Advance the simulation clock by one tick and step; returns True if the player died
+        
+        A shot is fired at the current clock before advancing, as when SPACE
+        is pressed between two ticks.
+        """
+        if shoot:
+            self.shoot(self.time)
+        self.time += self.tick_ms
+        return self.step(self.time, keys if keys is not None else NoKeys())
+    
+    def step(self, current_time, keys):
+        """Run one tick of game rules; returns True if the player died this tick"""
+        self.ticks += 1
+        
+        # Remember where everything was so rendering can interpolate
+        self.store_previous_positions()
+        
+        # Update player
+        self.player.update(keys, self.game_map.walls)
+        
+        # Spawn enemies from the generators that are due
+        spawn_target = self.enemies if self.swarm is None else self.swarm
+        self.spawn_scheduler.update(current_time, spawn_target, self.enemy_pool)
+        
+        # Update enemies along the shared flow field (recomputed only when the player changes tile)
+        # or, with the hierarchical pathfinder, along their own routes
+        if self.flow_field is not None:
+            self.flow_field.update(self.player)
+        if self.ai_scheduler is None:
+            for enemy in self.enemies:
+                self.update_enemy(enemy)
+        else:
+            self.ai_scheduler.update(self.enemies, self.player, self.ticks, self.update_enemy)
+        if self.swarm is not None:
+            self.swarm.update(self.player, self.game_map, self.flow_field)
+        if self.crowd is not None:
+            self.crowd.apply(self.enemies, self.game_map)
+            if self.swarm is not None:
+                self.crowd.apply_swarm(self.swarm, self.game_map)
+        
+        # Rebuild broadphases now that everything has moved
+        self.enemy_hash.rebuild(self.enemies)
+        self.enemy_hash_synced = True
+        self.generator_hash.rebuild(self.game_map.generators)
+        
+        # Update projectiles
+        enemy_targets = self.enemy_hash if self.swarm is None else self.swarm
+        enemies_before = self.enemy_count()
+        generators_before = len(self.game_map.generators)
+        for projectile in self.projectiles:
+            projectile.update(self.game_map.walls, enemy_targets, self.generator_hash)
+        self.kills += enemies_before - self.enemy_count()
+        self.generators_destroyed += generators_before - len(self.game_map.generators)
+        
+        # Check if player collides with enemy and take damage
+        damage_taken = [enemy.damage for enemy in self.enemy_hash.spritecollide(self.player, True)]
+        if self.swarm is not None:
+            damage_taken.extend(self.swarm.collide_player(self.player))
+        player_died = False
+        for damage in damage_taken:
+            self.damage_taken += damage
+            self.player.take_damage(damage)
+            # Check for game over
+            if self.player.health <= 0:
+                player_died = True
+        return player_died
+    
+    def update_enemy(self, enemy, ticks=1):
+        """Run one sprite enemy's AI, standing in for ticks ticks of movement"""
+        enemy.update(self.player, self.game_map.walls, self.game_map, self.flow_field,
+                     self.pathfinder, ticks)
+    
+    def store_previous_positions(self):
+        """Record every moving sprite's position before a tick"""
+        positions = {sprite: sprite.rect.topleft for sprite in self.enemies}
+        for projectile in self.projectiles:
+            positions[projectile] = projectile.rect.topleft
+        positions[self.player] = self.player.rect.topleft
+        self.previous_positions = positions
@@ -0,0 +1,209 @@
+"""
+Compact binary snapshots of simulation state for save games and rollback
+
+A snapshot holds only game state: the clocks and counters, the player,
+every live generator, enemy and projectile, and which generators each
+projectile has already hit. Images, groups, pools and the map layout are
+not stored; a snapshot is restored into a Simulation built with the same
+map, reusing its existing sprites wherever it can.
+
+With use_hpa, restores are not exact: enemy routes and the pathfinder's
+route and distance caches are not saved, so restored enemies plan new
+routes that can differ from the ones they had, and the game drifts from
+the original. Rollback only reproduces the original without use_hpa.
+
+Layout (little-endian): a HEADER, one GENERATOR record per generator, then
+int32 arrays of enemies (x, y, speed, damage, and for sprite enemies the
+ticks since their last AI update), projectiles (x, y, direction x,
+direction y, speed) and (projectile, generator) hit pairs.
+"""
+import struct
+
+from constants import *
+from generator import Generator
+
+MAGIC = b'PGSN'
+VERSION = 2
+# magic, version, flags, map width and height, clock, ticks, last shot time,
+# kills, damage taken, generators destroyed, player x, y, health, direction,
+# then the generator, enemy, projectile and hit pair counts
+HEADER = struct.Struct('<4sBBHHdIdIIIiiibbIIII')
+# x, y, health, last spawn time, spawn interval, enemy speed
+GENERATOR = struct.Struct('<iiidii')
+# x, y, speed, damage, ticks since the last AI update
+ENEMY = struct.Struct('<5i')
+ENEMY_FIELDS = 5
+SWARM_FIELDS = 4
+PROJECTILE_FIELDS = 5
+
+
+def pack_ints(values):
+    """Encode a flat list of ints as little-endian int32"""
+    return struct.pack(f'<{len(values)}i', *values)
+
+
+def take_snapshot(sim):
+    """Encode the state of a Simulation as bytes"""
+    generators = list(sim.game_map.generators)
+    generator_index = {generator: index for index, generator in enumerate(generators)}
+    
+    if sim.swarm is None:
+        enemy_data = _pack_enemies(sim.enemies.sprites(), sim.ticks)
+        enemy_count = len(sim.enemies)
+    else:
+        enemy_data, enemy_count = sim.swarm.pack_state()
+    
+    projectile_values = []
+    hits = []
+    for index, projectile in enumerate(sim.projectiles):
+        rect = projectile.rect
+        direction = projectile.direction
+        projectile_values += (rect.x, rect.y, direction[0], direction[1], projectile.speed)
+        for generator in projectile.hit_generators:
+            # Generators destroyed since the hit can never be hit again, so are dropped
+            if generator in generator_index:
+                hits += (index, generator_index[generator])
+    
+    player = sim.player
+    modes = sim.modes()
+    flags = sum(bit for name, bit in sim.MODE_FLAGS if modes[name])
+    parts = [HEADER.pack(MAGIC, VERSION, flags, sim.game_map.width, sim.game_map.height,
+                         sim.time, sim.ticks, sim.last_shot_time,
+                         sim.kills, sim.damage_taken, sim.generators_destroyed,
+                         player.rect.x, player.rect.y, player.health,
+                         player.last_direction[0], player.last_direction[1],
+                         len(generators), enemy_count, len(sim.projectiles), len(hits) // 2)]
+    parts += [GENERATOR.pack(g.rect.x, g.rect.y, g.health, g.last_spawn_time,
+                             g.spawn_interval, g.enemy_speed) for g in generators]
+    parts += [enemy_data, pack_ints(projectile_values), pack_ints(hits)]
+    return b''.join(parts)
+
+
+def restore_snapshot(sim, data):
+    """Put a Simulation back into the state encoded by take_snapshot"""
+    (magic, version, flags, width, height, sim.time, sim.ticks, sim.last_shot_time,
+     sim.kills, sim.damage_taken, sim.generators_destroyed,
+     player_x, player_y, player_health, direction_x, direction_y,
+     generator_count, enemy_count, projectile_count, hit_count) = _unpack_header(sim, data)
+    offset = HEADER.size
+    
+    player = sim.player
+    player.rect.topleft = (player_x, player_y)
+    player.health = player_health
+    player.last_direction = (direction_x, direction_y)
+    
+    generators = _restore_generators(sim, data, offset, generator_count)
+    offset += GENERATOR.size * generator_count
+    
+    if sim.swarm is None:
+        values = struct.unpack_from(f'<{enemy_count * ENEMY_FIELDS}i', data, offset)
+        enemies = _restore_sprites(sim.enemies, sim.enemy_pool, enemy_count, (0, 0))
+        _set_enemies(enemies, values, sim.ticks)
+        if sim.pathfinder is not None:
+            # Routes are not saved; enemies plan new ones, so use_hpa restores are not exact
+            for enemy in enemies:
+                enemy.route = None
+        offset += 4 * ENEMY_FIELDS * enemy_count
+    else:
+        sim.swarm.unpack_state(data, offset, enemy_count)
+        offset += 4 * SWARM_FIELDS * enemy_count
+    
+    values = struct.unpack_from(f'<{projectile_count * PROJECTILE_FIELDS}i', data, offset)
+    projectiles = _restore_sprites(sim.projectiles, sim.projectile_pool, projectile_count,
+                                   (0, 0, (0, -1)))
+    for index, projectile in enumerate(projectiles):
+        _set_projectile(projectile, values, index * PROJECTILE_FIELDS)
+    offset += 4 * PROJECTILE_FIELDS * projectile_count
+    
+    hits = struct.unpack_from(f'<{hit_count * 2}i', data, offset)
+    for index in range(0, len(hits), 2):
+        projectiles[hits[index]].hit_generators.add(generators[hits[index + 1]])
+    
+    # Derived state is rebuilt on the next step
+    sim.enemy_hash.clear()
+    sim.enemy_hash_synced = False
+    sim.previous_positions = {}
+
+
+def _unpack_header(sim, data):
+    """Decode and check the header against the simulation it is restored into"""
+    header = HEADER.unpack_from(data)
+    magic, version, flags, width, height = header[:5]
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not a pyGauntlet snapshot")
+    if (width, height) != (sim.game_map.width, sim.game_map.height):
+        raise ValueError(f"Snapshot is for a {width}x{height} map")
+    modes = sim.modes()
+    for name, bit in sim.MODE_FLAGS:
+        if bool(flags & bit) != modes[name]:
+            raise ValueError(f"Snapshot and simulation disagree on {name}")
+    return header
+
+
+def _restore_generators(sim, data, offset, count):
+    """Bring the map's generators back to the snapshot, in snapshot order
+    
+    Generators are matched by position; destroyed ones are recreated. The group
+    is only rebuilt when membership or order differ, since that marks tiles
+    changed for the flow field and static layer.
+    """
+    group = sim.game_map.generators
+    existing = {generator.rect.topleft: generator for generator in group}
+    generators = []
+    for x, y, health, last_spawn_time, spawn_interval, enemy_speed in \
+            GENERATOR.iter_unpack(data[offset:offset + GENERATOR.size * count]):
+        generator = existing.get((x, y))
+        if generator is None:
+            generator = Generator(x // TILE_SIZE, y // TILE_SIZE)
+        generator.health = health
+        generator.last_spawn_time = last_spawn_time
+        generator.spawn_interval = spawn_interval
+        generator.enemy_speed = enemy_speed
+        generators.append(generator)
+    
+    if group.sprites() != generators:
+        group.empty()
+        group.add(*generators)
+    return generators
+
+
+def _restore_sprites(group, pool, count, spawn_args):
+    """Reuse a group's sprites in order for count records, killing or acquiring the rest"""
+    sprites = group.sprites()
+    for sprite in sprites[count:]:
+        sprite.kill()
+    del sprites[count:]
+    for _ in range(len(sprites), count):
+        sprite = pool.acquire(*spawn_args)
+        group.add(sprite)
+        sprites.append(sprite)
+    return sprites
+
+
+def _pack_enemies(enemies, ticks):
+    """Encode sprite enemies as ENEMY records, one Struct.pack call each"""
+    pack = ENEMY.pack
+    # An enemy the AI scheduler has not seen yet behaves as if updated this tick
+    return b''.join([pack(enemy.rect.x, enemy.rect.y, enemy.speed, enemy.damage,
+                          0 if enemy.ai_tick is None else ticks - enemy.ai_tick)
+                     for enemy in enemies])
+
+
+def _set_enemies(enemies, values, ticks):
+    """Set the fields written by _pack_enemies on sprites in record order"""
+    for enemy, x, y, speed, damage, ai_age in zip(
+            enemies, values[0::ENEMY_FIELDS], values[1::ENEMY_FIELDS], values[2::ENEMY_FIELDS],
+            values[3::ENEMY_FIELDS], values[4::ENEMY_FIELDS]):
+        rect = enemy.rect
+        rect.x = x
+        rect.y = y
+        enemy.speed = speed
+        enemy.damage = damage
+        enemy.ai_tick = ticks - ai_age
+
+
+def _set_projectile(projectile, values, i):
+    projectile.rect.topleft = (values[i], values[i + 1])
+    projectile.direction = (values[i + 2], values[i + 3])
+    projectile.speed = values[i + 4]
+    projectile.hit_generators = set()
@@ -0,0 +1,96 @@
+"""
+Uniform spatial hash used as a collision broadphase
+"""
+import pygame
+from constants import *
+from sweep import swept_cells, sweep_sprites
+
+class SpatialHash:
+    """Buckets sprites by the grid cells their rects overlap"""
+    
+    def __init__(self, cell_size=SPATIAL_HASH_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.count = 0
+    
+    def __len__(self):
+        return self.count
+    
+    def _cell_span(self, rect):
+        """Get the range of cells a rect overlaps"""
+        size = self.cell_size
+        return (rect.left // size, rect.top // size,
+                (rect.right - 1) // size, (rect.bottom - 1) // size)
+    
+    def clear(self):
+        """Remove every sprite from the hash"""
+        self.cells.clear()
+        self.count = 0
+    
+    def insert(self, sprite):
+        """Add a sprite to every cell its rect overlaps"""
+        cells = self.cells
+        left, top, right, bottom = self._cell_span(sprite.rect)
+        for cell_y in range(top, bottom + 1):
+            for cell_x in range(left, right + 1):
+                bucket = cells.get((cell_x, cell_y))
+                if bucket is None:
+                    cells[(cell_x, cell_y)] = [sprite]
+                else:
+                    bucket.append(sprite)
+        self.count += 1
+    
+    def rebuild(self, sprites):
+        """Clear the hash and insert all sprites (call once per tick)"""
+        self.clear()
+        for sprite in sprites:
+            self.insert(sprite)
+    
+    def query(self, rect):
+        """Get the live sprites sharing a cell with a rect (broadphase candidates)"""
+        cells = self.cells
+        left, top, right, bottom = self._cell_span(rect)
+        if left == right and top == bottom:
+            bucket = cells.get((left, top), ())
+            return [sprite for sprite in bucket if sprite.alive()]
+        
+        found = {}
+        for cell_y in range(top, bottom + 1):
+            for cell_x in range(left, right + 1):
+                for sprite in cells.get((cell_x, cell_y), ()):
+                    found[sprite] = None
+        return [sprite for sprite in found if sprite.alive()]
+    
+    def query_swept(self, rect, dx, dy):
+        """Get the live sprites in the cells a rect crosses while moving by (dx, dy)"""
+        if rect.width > self.cell_size or rect.height > self.cell_size:
+            return self.query(rect.union(rect.move(dx, dy)))
+        cells = self.cells
+        found = {}
+        for cell in swept_cells(rect, dx, dy, self.cell_size):
+            for sprite in cells.get(cell, ()):
+                found[sprite] = None
+        return [sprite for sprite in found if sprite.alive()]
+    
+    def sweep(self, rect, dx, dy, until=1.0, dokill=False, exclude=()):
+        """Find the sprites a moving rect touches first, like sweep.sweep_sprites"""
+        return sweep_sprites(self.query_swept(rect, dx, dy), rect, dx, dy, until, dokill, exclude)
+    
+    def spritecollide(self, sprite, dokill=False):
+        """Find sprites whose rects overlap a sprite, like pygame.sprite.spritecollide"""
+        rect = sprite.rect
+        collided = [other for other in self.query(rect) if rect.colliderect(other.rect)]
+        if dokill:
+            for other in collided:
+                other.kill()
+        return collided
+
+
+def spritecollide(sprite, group, dokill=False):
+    """Collide a sprite against a sprite group or anything with a spritecollide method
+    
+    That covers SpatialHash broadphases and the array-backed EnemySwarm.
+    """
+    if isinstance(group, pygame.sprite.AbstractGroup):
+        return pygame.sprite.spritecollide(sprite, group, dokill)
+    return group.spritecollide(sprite, dokill)
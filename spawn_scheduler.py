@@ -0,0 +1,148 @@
+"""
+Event-driven scheduling of generator spawns
+"""
+import heapq
+import itertools
+import time
+from constants import *
+
+# Slack when popping due generators, so float rounding of the clock never delays a spawn;
+# Generator.update still makes the exact call
+TIME_EPSILON = 1e-6
+
+
+class SpawnScheduler:
+    """Min-heap of generators keyed by next spawn time, so a tick only touches due ones
+    
+    Each live generator has one heap entry [due time, order, sequence,
+    generator]; order is the generator's place in the map's generator
+    group, so generators due on the same tick spawn in the same order as a
+    loop over the group would, and sequence keeps entries comparable.
+    Destroyed generators are dropped when their entry comes up. Generators
+    added to the map are picked up through the map's change listeners.
+    
+    Generator fields are the source of truth: after changing
+    last_spawn_time or spawn_interval directly (restoring a snapshot),
+    call rebuild(), or use set_interval() for one generator.
+    """
+    
+    def __init__(self, game_map):
+        self.game_map = game_map
+        self.heap = []
+        self.entries = {}  # generator -> its live heap entry; older entries are stale
+        self.next_order = 0
+        self.sequence = itertools.count()
+        self.map_changed = False
+        self.paused_at = None
+        game_map.add_change_listener(self.tile_changed)
+        
+        # Statistics for the last tick
+        self.popped = 0  # Heap entries taken, including stale and destroyed ones
+        self.spawned = 0
+        self.update_ms = 0.0
+        
+        self.rebuild()
+    
+    def tile_changed(self, tile_x, tile_y):
+        """Map change listener: a generator may have been placed"""
+        self.map_changed = True
+    
+    def rebuild(self):
+        """Schedule every generator on the map afresh from its own fields"""
+        self.heap = []
+        self.entries = {}
+        self.next_order = 0
+        for generator in self.game_map.generators:
+            self.schedule(generator, self.next_order)
+            self.next_order += 1
+        self.map_changed = False
+    
+    def schedule(self, generator, order):
+        """Push a generator's entry for its next spawn time"""
+        entry = [generator.next_spawn_time(), order, next(self.sequence), generator]
+        self.entries[generator] = entry
+        heapq.heappush(self.heap, entry)
+    
+    def add_new_generators(self):
+        """Schedule generators placed on the map since the last tick"""
+        for generator in self.game_map.generators:
+            if generator not in self.entries:
+                self.schedule(generator, self.next_order)
+                self.next_order += 1
+        self.map_changed = False
+    
+    def set_interval(self, generator, spawn_interval):
+        """Change one generator's spawn interval; its old entry goes stale"""
+        generator.spawn_interval = spawn_interval
+        if generator in self.entries:
+            self.schedule(generator, self.entries[generator][1])
+    
+    def pause(self, current_time):
+        """Stop spawning; resume() pushes every due time back by the paused span
+        
+        Only needed for clocks that keep running while paused. Game passes the
+        simulation clock, which stops in STATE_PAUSED, so the span is zero
+        there and pausing just holds spawns from any stray step.
+        """
+        if self.paused_at is None:
+            self.paused_at = current_time
+    
+    def resume(self, current_time):
+        """Continue spawning after pause(), as if the clock had stopped meanwhile"""
+        if self.paused_at is None:
+            return
+        elapsed = current_time - self.paused_at
+        self.paused_at = None
+        if elapsed == 0:
+            return
+        # Shifting every key by the same amount keeps the heap ordered
+        for entry in self.heap:
+            entry[0] += elapsed
+        for generator in self.entries:
+            generator.last_spawn_time += elapsed
+    
+    @property
+    def paused(self):
+        return self.paused_at is not None
+    
+    def update(self, current_time, enemies, pool=None):
+        """Spawn from every generator due by current_time; returns how many spawned"""
+        start = time.perf_counter()
+        self.popped = 0
+        self.spawned = 0
+        if self.paused_at is not None:
+            self.update_ms = (time.perf_counter() - start) * 1000
+            return 0
+        if self.map_changed:
+            self.add_new_generators()
+        
+        group = self.game_map.generators
+        heap = self.heap
+        due = []
+        while heap and heap[0][0] <= current_time + TIME_EPSILON:
+            entry = heapq.heappop(heap)
+            self.popped += 1
+            generator = entry[3]
+            if self.entries.get(generator) is not entry:
+                continue  # Superseded by a later entry for the same generator
+            if not group.has(generator):
+                del self.entries[generator]  # Destroyed since it was scheduled
+                continue
+            due.append(entry)
+        
+        due.sort(key=lambda entry: entry[1])
+        for entry in due:
+            generator = entry[3]
+            if generator.update(current_time, enemies, pool):
+                self.spawned += 1
+                self.schedule(generator, entry[1])
+            else:
+                # Within TIME_EPSILON but not yet due; keep the entry for a later tick
+                heapq.heappush(heap, entry)
+        self.update_ms = (time.perf_counter() - start) * 1000
+        return self.spawned
+    
+    def stats(self):
+        """Get the scheduled generator count and the work done on the last tick"""
+        return {'generators': len(self.entries), 'heap': len(self.heap), 'popped': self.popped,
+                'spawned': self.spawned, 'update_ms': self.update_ms}
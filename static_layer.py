@@ -0,0 +1,97 @@
+"""
+Pre-rendered static map layer drawn in cached chunks
+"""
+import pygame
+from constants import *
+
+class StaticLayer:
+    """Caches walls and generators in chunk surfaces and blits only visible chunks"""
+    
+    def __init__(self, game_map, chunk_tiles=STATIC_CHUNK_TILES):
+        self.game_map = game_map
+        self.chunk_tiles = chunk_tiles
+        self.chunk_size = chunk_tiles * TILE_SIZE
+        # (chunk_x, chunk_y) -> Surface, or None for a chunk with nothing static in it
+        self.chunks = {}
+        self.chunks_rendered = 0
+        game_map.add_change_listener(self.invalidate_tile)
+    
+    def invalidate_tile(self, tile_x, tile_y):
+        """Drop the cached chunk containing a tile"""
+        self.chunks.pop((tile_x // self.chunk_tiles, tile_y // self.chunk_tiles), None)
+    
+    def invalidate(self):
+        """Drop every cached chunk"""
+        self.chunks.clear()
+    
+    def render_chunk(self, chunk_x, chunk_y):
+        """Render the walls and generators of one chunk into a new surface"""
+        game_map = self.game_map
+        tile_left = chunk_x * self.chunk_tiles
+        tile_top = chunk_y * self.chunk_tiles
+        tile_right = min(tile_left + self.chunk_tiles, game_map.width)
+        tile_bottom = min(tile_top + self.chunk_tiles, game_map.height)
+        chunk_rect = pygame.Rect(tile_left * TILE_SIZE, tile_top * TILE_SIZE,
+                                 (tile_right - tile_left) * TILE_SIZE,
+                                 (tile_bottom - tile_top) * TILE_SIZE)
+        
+        sprites = []
+        for tile_y in range(tile_top, tile_bottom):
+            for tile_x in range(tile_left, tile_right):
+                if game_map.is_solid(tile_x, tile_y):
+                    sprites.extend(game_map.walls.walls_at(tile_x, tile_y))
+        sprites.extend(generator for generator in game_map.generators
+                       if chunk_rect.colliderect(generator.rect))
+        
+        self.chunks_rendered += 1
+        if not sprites:
+            return None
+        
+        surface = pygame.Surface(chunk_rect.size)
+        surface.fill(BLACK)
+        for sprite in sprites:
+            surface.blit(sprite.image, (sprite.rect.x - chunk_rect.x, sprite.rect.y - chunk_rect.y))
+        return surface
+    
+    def draw(self, screen, view):
+        """Blit the chunks overlapping a camera view rect"""
+        size = self.chunk_size
+        max_chunk_x = (self.game_map.width - 1) // self.chunk_tiles
+        max_chunk_y = (self.game_map.height - 1) // self.chunk_tiles
+        left = max(view.left // size, 0)
+        top = max(view.top // size, 0)
+        right = min((view.right - 1) // size, max_chunk_x)
+        bottom = min((view.bottom - 1) // size, max_chunk_y)
+        
+        for chunk_y in range(top, bottom + 1):
+            for chunk_x in range(left, right + 1):
+                surface = self.chunk(chunk_x, chunk_y)
+                if surface is not None:
+                    screen.blit(surface, (chunk_x * size - view.x, chunk_y * size - view.y))
+    
+    def draw_area(self, screen, view, rect):
+        """Blit only the parts of chunks under a screen rect, for patching one region"""
+        size = self.chunk_size
+        area = rect.move(view.x, view.y)  # In world coordinates
+        max_chunk_x = (self.game_map.width - 1) // self.chunk_tiles
+        max_chunk_y = (self.game_map.height - 1) // self.chunk_tiles
+        left = max(area.left // size, 0)
+        top = max(area.top // size, 0)
+        right = min((area.right - 1) // size, max_chunk_x)
+        bottom = min((area.bottom - 1) // size, max_chunk_y)
+        
+        for chunk_y in range(top, bottom + 1):
+            for chunk_x in range(left, right + 1):
+                surface = self.chunk(chunk_x, chunk_y)
+                if surface is not None:
+                    part = area.clip(pygame.Rect(chunk_x * size, chunk_y * size, size, size))
+                    screen.blit(surface, (part.x - view.x, part.y - view.y),
+                                part.move(-chunk_x * size, -chunk_y * size))
+    
+    def chunk(self, chunk_x, chunk_y):
+        """Get a chunk's cached surface (None if it is empty), rendering it on first use"""
+        key = (chunk_x, chunk_y)
+        if key in self.chunks:
+            return self.chunks[key]
+        surface = self.chunks[key] = self.render_chunk(chunk_x, chunk_y)
+        return surface
@@ -0,0 +1,241 @@
+"""
+Array-backed enemy swarm updated with batched NumPy operations
+"""
+import numpy as np
+from constants import *
+from image_cache import get_surface
+
+ENEMY_SIZE = TILE_SIZE - 4
+ENEMY_DAMAGE = 10
+
+def hits_wall(tiles, x, y):
+    """Check enemy rects at top-lefts x, y against a 2D tile grid (rects span at most 2x2 tiles)"""
+    height, width = tiles.shape
+    left = x // TILE_SIZE
+    top = y // TILE_SIZE
+    right = (x + ENEMY_SIZE - 1) // TILE_SIZE
+    bottom = (y + ENEMY_SIZE - 1) // TILE_SIZE
+    hit = np.zeros(len(x), dtype=bool)
+    for tile_x in (left, right):
+        for tile_y in (top, bottom):
+            # Tiles outside the map are not solid, matching GameMap.is_solid
+            inside = (tile_x >= 0) & (tile_x < width) & (tile_y >= 0) & (tile_y < height)
+            solid = tiles[np.clip(tile_y, 0, height - 1), np.clip(tile_x, 0, width - 1)] == TILE_WALL
+            hit |= inside & solid
+    return hit
+
+class EnemySwarm:
+    """Structure-of-arrays enemy store for very large hordes
+    
+    Each enemy is a slot in parallel arrays (x, y, speed, damage, alive)
+    instead of a Sprite with its own Surface. Movement follows the same
+    rules as Enemy.update and every enemy is drawn with one shared image.
+    """
+    
+    def __init__(self, capacity=256):
+        self.size = 0  # High-water mark of used slots
+        self.free_slots = []
+        self.x = np.zeros(capacity, dtype=np.int32)
+        self.y = np.zeros(capacity, dtype=np.int32)
+        # Positions before the last update, for render interpolation
+        self.previous_x = np.zeros(capacity, dtype=np.int32)
+        self.previous_y = np.zeros(capacity, dtype=np.int32)
+        self.speed = np.zeros(capacity, dtype=np.int32)
+        self.damage = np.zeros(capacity, dtype=np.int32)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.image = get_surface('enemy', (ENEMY_SIZE, ENEMY_SIZE), RED)
+    
+    def __len__(self):
+        return int(np.count_nonzero(self.alive[:self.size]))
+    
+    def _grow(self):
+        """Double the capacity of every array"""
+        capacity = len(self.x) * 2
+        for name in ('x', 'y', 'previous_x', 'previous_y', 'speed', 'damage', 'alive'):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+    
+    def spawn(self, x, y, speed=ENEMY_SPEED, damage=ENEMY_DAMAGE):
+        """Add an enemy with its top-left corner at world coordinates and return its slot"""
+        if self.free_slots:
+            slot = self.free_slots.pop()
+        else:
+            if self.size == len(self.x):
+                self._grow()
+            slot = self.size
+            self.size += 1
+        self.x[slot] = self.previous_x[slot] = x
+        self.y[slot] = self.previous_y[slot] = y
+        self.speed[slot] = speed
+        self.damage[slot] = damage
+        self.alive[slot] = True
+        return slot
+    
+    def kill(self, slots):
+        """Remove the enemies in the given slots"""
+        slots = np.atleast_1d(slots)
+        slots = slots[self.alive[slots]]
+        self.alive[slots] = False
+        self.free_slots.extend(slots.tolist())
+    
+    def clear(self):
+        """Remove every enemy"""
+        self.alive[:] = False
+        self.size = 0
+        self.free_slots = []
+    
+    def pack_state(self):
+        """Encode live enemies as little-endian int32 rows of (x, y, speed, damage)
+        
+        Returns the bytes and the number of enemies, for snapshot.py.
+        """
+        live = np.flatnonzero(self.alive[:self.size])
+        rows = np.stack([self.x[live], self.y[live], self.speed[live], self.damage[live]], axis=1)
+        return rows.astype('<i4').tobytes(), len(live)
+    
+    def unpack_state(self, data, offset, count):
+        """Replace every enemy with count rows written by pack_state"""
+        rows = np.frombuffer(data, dtype='<i4', count=count * 4, offset=offset).reshape(count, 4)
+        self.clear()
+        while len(self.x) < count:
+            self._grow()
+        self.x[:count] = self.previous_x[:count] = rows[:, 0]
+        self.y[:count] = self.previous_y[:count] = rows[:, 1]
+        self.speed[:count] = rows[:, 2]
+        self.damage[:count] = rows[:, 3]
+        self.alive[:count] = True
+        self.size = count
+    
+    def overlapping(self, rect):
+        """Get the slots of live enemies whose rects overlap a rect"""
+        n = self.size
+        x = self.x[:n]
+        y = self.y[:n]
+        hit = (self.alive[:n] & (x < rect.right) & (x + ENEMY_SIZE > rect.left)
+               & (y < rect.bottom) & (y + ENEMY_SIZE > rect.top))
+        return np.flatnonzero(hit)
+    
+    def spritecollide(self, sprite, dokill=False):
+        """Get the slots of enemies touching a sprite, like pygame.sprite.spritecollide"""
+        slots = self.overlapping(sprite.rect)
+        if dokill and len(slots):
+            self.kill(slots)
+        return list(slots)
+    
+    def sweep(self, rect, dx, dy, until=1.0, dokill=False, exclude=()):
+        """Find the enemies a rect moving by (dx, dy) touches first, like sweep.sweep_sprites
+        
+        Returns (t, slots) or (None, []); exclude is accepted for symmetry and ignored.
+        """
+        n = self.size
+        entry = np.zeros(n)
+        exit = np.full(n, float(until))
+        for start, end, move, other_start in ((rect.left, rect.right, dx, self.x[:n]),
+                                              (rect.top, rect.bottom, dy, self.y[:n])):
+            other_end = other_start + ENEMY_SIZE
+            if move == 0:
+                exit[(end <= other_start) | (start >= other_end)] = -1.0
+            else:
+                t0 = (other_start - end) / move
+                t1 = (other_end - start) / move
+                entry = np.maximum(entry, np.minimum(t0, t1))
+                exit = np.minimum(exit, np.maximum(t0, t1))
+        hit = self.alive[:n] & (entry < exit)
+        if not hit.any():
+            return None, []
+        first = entry[hit].min()
+        slots = np.flatnonzero(hit & (entry == first))
+        if dokill:
+            self.kill(slots)
+        return float(first), list(slots)
+    
+    def update(self, player, game_map, flow_field=None):
+        """Move every live enemy toward the player and resolve walls in one batch"""
+        n = self.size
+        if n == 0:
+            return
+        self.previous_x[:n] = self.x[:n]
+        self.previous_y[:n] = self.y[:n]
+        live = np.flatnonzero(self.alive[:n])
+        x = self.x[live]
+        y = self.y[live]
+        speed = self.speed[live]
+        tiles = np.frombuffer(game_map.tiles, dtype=np.uint8).reshape(game_map.height, game_map.width)
+        
+        center_x = x + ENEMY_SIZE // 2
+        center_y = y + ENEMY_SIZE // 2
+        dx = player.rect.centerx - center_x
+        dy = player.rect.centery - center_y
+        
+        # Greedy chase along the longer axis, as in Enemy.chase
+        horizontal = np.abs(dx) > np.abs(dy)
+        move_x = np.where(horizontal, np.clip(dx, -speed, speed), 0)
+        move_y = np.where(horizontal, 0, np.clip(dy, -speed, speed))
+        following = np.zeros(len(live), dtype=bool)
+        
+        if flow_field is not None:
+            # Enemies with a next tile step toward its center, as in Enemy.follow_step
+            tile_x = center_x // TILE_SIZE
+            tile_y = center_y // TILE_SIZE
+            inside = (tile_x >= 0) & (tile_x < game_map.width) & (tile_y >= 0) & (tile_y < game_map.height)
+            index = np.where(inside, tile_y * game_map.width + tile_x, 0)
+            next_tiles = np.frombuffer(flow_field.next_tiles, dtype=np.int32)
+            next_index = np.where(inside, next_tiles[index], -1)
+            following = next_index >= 0
+            step_x = (next_index % game_map.width) * TILE_SIZE + TILE_SIZE // 2
+            step_y = (next_index // game_map.width) * TILE_SIZE + TILE_SIZE // 2
+            move_x = np.where(following, np.clip(step_x - center_x, -speed, speed), move_x)
+            move_y = np.where(following, np.clip(step_y - center_y, -speed, speed), move_y)
+        
+        new_x = x + move_x
+        blocked_x = (move_x != 0) & hits_wall(tiles, new_x, y)
+        x = np.where(blocked_x, x, new_x)
+        # A greedy enemy blocked horizontally tries to slide vertically instead
+        slide = blocked_x & ~following & (move_y == 0)
+        move_y = np.where(slide, np.where(dy > 0, speed, -speed), move_y)
+        
+        new_y = y + move_y
+        blocked_y = (move_y != 0) & hits_wall(tiles, x, new_y)
+        y = np.where(blocked_y, y, new_y)
+        
+        self.x[live] = x
+        self.y[live] = y
+    
+    def collide_player(self, player):
+        """Kill enemies touching the player and return the damage each one deals"""
+        slots = self.overlapping(player.rect)
+        damage = [int(value) for value in self.damage[slots]]
+        if len(slots):
+            self.kill(slots)
+        return damage
+    
+    def visible(self, view):
+        """Get the slots of live enemies inside a camera view rect"""
+        return self.overlapping(view)
+    
+    def draw(self, screen, view, alpha=1.0, rects=None, slots=None):
+        """Stamp the shared enemy image for every visible enemy and return how many
+        
+        Positions are interpolated between the previous and current update by alpha.
+        rects, if a list, is extended with the screen rects drawn. slots are the
+        visible slots when the caller already culled them.
+        """
+        if slots is None:
+            slots = self.visible(view)
+        xs = self.x[slots]
+        ys = self.y[slots]
+        if alpha < 1.0:
+            previous_x = self.previous_x[slots]
+            previous_y = self.previous_y[slots]
+            xs = np.rint(previous_x + (xs - previous_x) * alpha).astype(np.int32)
+            ys = np.rint(previous_y + (ys - previous_y) * alpha).astype(np.int32)
+        xs = (xs - view.x).tolist()
+        ys = (ys - view.y).tolist()
+        image = self.image
+        drawn = screen.blits([(image, position) for position in zip(xs, ys)],
+                             doreturn=rects is not None)
+        if rects is not None:
+            rects.extend(drawn)
+        return len(slots)
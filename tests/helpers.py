@@ -0,0 +1,16 @@
+"""
+Shared stand-ins for the tests
+"""
+import pygame
+from constants import *
+
+
+class Target:
+    """Stand-in for the player at a world position, for anything that only reads its rect"""
+    def __init__(self, x, y, size=28):
+        self.rect = pygame.Rect(x, y, size, size)
+    
+    @classmethod
+    def on_tile(cls, tile_x, tile_y):
+        """A target standing on a tile, like the player placed at tile coordinates"""
+        return cls(tile_x * TILE_SIZE + 2, tile_y * TILE_SIZE + 2)
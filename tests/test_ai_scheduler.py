@@ -0,0 +1,97 @@
+"""
+Test level-of-detail scheduling of enemy AI
+"""
+import pygame
+import os
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+from constants import *
+from enemy import Enemy
+from game_map import GameMap
+from ai_scheduler import AIScheduler, TIER_ACTIVE, TIER_DISTANT, TIER_DORMANT
+from simulation import Simulation
+from helpers import Target
+
+
+def test_tiers_by_distance():
+    """Test that near enemies update every tick, distant ones in turns and dormant ones never"""
+    pygame.init()
+    target = Target(10 * TILE_SIZE, 10 * TILE_SIZE)
+    scheduler = AIScheduler(near_distance=10 * TILE_SIZE, far_distance=60 * TILE_SIZE,
+                            interval=4, budget=None)
+    near = Enemy(15 * TILE_SIZE, 10 * TILE_SIZE)
+    distant = [Enemy(40 * TILE_SIZE, 3 * TILE_SIZE + y * 8) for y in range(40)]
+    dormant = Enemy(150 * TILE_SIZE, 10 * TILE_SIZE)
+    enemies = [near] + distant + [dormant]
+    assert scheduler.tier(near, target) == TIER_ACTIVE
+    assert scheduler.tier(dormant, target) == TIER_DORMANT
+    
+    updates = {}
+    def update_enemy(enemy, ticks=1):
+        updates[enemy] = updates.get(enemy, 0) + ticks
+    
+    per_tick = []
+    for tick in range(1, 41):
+        scheduler.update(enemies, target, tick, update_enemy)
+        per_tick.append(scheduler.updated)
+    assert scheduler.counts == {TIER_ACTIVE: 1, TIER_DISTANT: 40, TIER_DORMANT: 1}
+    assert updates[near] == 40 and dormant not in updates
+    assert all(36 <= updates[enemy] <= 40 for enemy in distant), "Skipped ticks are made up"
+    assert max(per_tick[4:]) == 1 + 10, "A tick runs at most a quarter of the distant tier"
+    print(f"✓ Tiers: {scheduler.stats()}")
+    pygame.quit()
+
+
+def test_catch_up_moves_as_far():
+    """Test that a distant enemy covers about the ground of one updated every tick"""
+    pygame.init()
+    game_map = GameMap(200, 20)
+    target = Target(10 * TILE_SIZE, 10 * TILE_SIZE)
+    scheduler = AIScheduler(near_distance=TILE_SIZE, interval=4, budget=None)
+    scheduled = Enemy(40 * TILE_SIZE, 10 * TILE_SIZE)
+    every_tick = Enemy(40 * TILE_SIZE, 10 * TILE_SIZE)
+    
+    def update_enemy(enemy, ticks=1):
+        enemy.update(target, game_map.walls, game_map, ticks=ticks)
+    
+    for tick in range(1, 41):
+        scheduler.update([scheduled], target, tick, update_enemy)
+        update_enemy(every_tick)
+    gap = abs(scheduled.rect.x - every_tick.rect.x)
+    assert gap <= 4 * ENEMY_SPEED, f"Scheduled enemy fell {gap} pixels behind"
+    print(f"✓ Distant enemy within {gap} pixels of one updated every tick")
+    pygame.quit()
+
+
+def test_budget_defers_and_simulation_runs():
+    """Test the per-tick budget and a simulation with level of detail on"""
+    pygame.init()
+    target = Target(0, 0)
+    scheduler = AIScheduler(near_distance=10, far_distance=100000, interval=1, budget=5)
+    enemies = [Enemy(1000 + i, 1000) for i in range(20)]
+    scheduler.update(enemies, target, 1, lambda enemy, ticks=1: None)
+    assert scheduler.updated == 5 and scheduler.deferred == 15
+    
+    sim = Simulation(use_ai_lod=True, params={'spawn_interval': 200})
+    for _ in range(300):
+        sim.tick()
+    assert sim.enemy_count() > 0
+    assert sum(sim.ai_scheduler.counts.values()) == len(sim.enemies)
+    print(f"✓ Budget defers updates; simulation tiers: {sim.ai_scheduler.counts}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    print('='*60)
+    print('Testing AI Scheduler')
+    print('='*60)
+    print()
+    
+    test_tiers_by_distance()
+    test_catch_up_moves_as_far()
+    test_budget_defers_and_simulation_runs()
+    
+    print()
+    print('='*60)
+    print('All AI scheduler tests passed!')
+    print('='*60)
@@ -0,0 +1,112 @@
+"""
+Test the asset manager and its memory-mapped frame cache
+"""
+import pygame
+import os
+import shutil
+import tempfile
+import threading
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+from constants import *
+from assets import AssetManager, CHARACTER_SHEET, ASSET_ROOT, assets
+from player import Player
+from simulation import NoKeys
+
+
+def test_disk_cache_skips_decoding():
+    """Test that a second run maps the cached frames instead of decoding the image"""
+    pygame.init()
+    with tempfile.TemporaryDirectory() as folder:
+        cache_path = os.path.join(folder, 'frames.bin')
+        cold = AssetManager(cache_path=cache_path)
+        sheet = cold.load_sheet(CHARACTER_SHEET, SPRITE_FRAME_SIZE, 4, 9)
+        assert sheet.get_size() == (9 * SPRITE_FRAME_SIZE, 4 * SPRITE_FRAME_SIZE)
+        assert cold.load_sheet(CHARACTER_SHEET, SPRITE_FRAME_SIZE, 4, 9) is sheet
+        assert cold.decoded == 1 and os.path.exists(cache_path)
+        
+        warm = AssetManager(cache_path=cache_path)
+        cached = warm.load_sheet(CHARACTER_SHEET, SPRITE_FRAME_SIZE, 4, 9)
+        assert warm.decoded == 0 and warm.disk_hits == 1
+        assert pygame.image.tobytes(cached, 'RGBA') == pygame.image.tobytes(sheet, 'RGBA')
+        del cached
+    print("✓ Cached frames are memory-mapped on the next run")
+    pygame.quit()
+
+
+def test_stale_cache_is_refreshed():
+    """Test that changing the source image invalidates its cache entry"""
+    pygame.init()
+    with tempfile.TemporaryDirectory() as folder:
+        source = os.path.join(folder, 'sheet.png')
+        shutil.copy(os.path.join(ASSET_ROOT, CHARACTER_SHEET), source)
+        cache_path = os.path.join(folder, 'frames.bin')
+        AssetManager(cache_path=cache_path).load_sheet(source, SPRITE_FRAME_SIZE, 4, 9)
+        
+        stat = os.stat(source)
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        manager = AssetManager(cache_path=cache_path)
+        manager.load_sheet(source, SPRITE_FRAME_SIZE, 4, 9)
+        assert manager.decoded == 1 and manager.disk_hits == 0
+        
+        try:
+            manager.load_sheet(os.path.join(folder, 'missing.png'), SPRITE_FRAME_SIZE, 4, 9)
+        except FileNotFoundError:
+            pass
+        else:
+            assert False, "Expected FileNotFoundError"
+    print("✓ Stale entries are decoded again and missing files raise")
+    pygame.quit()
+
+
+def test_preload_shares_in_flight_load():
+    """Test that a request during a background preload waits instead of decoding twice"""
+    pygame.init()
+    with tempfile.TemporaryDirectory() as folder:
+        manager = AssetManager(cache_path=os.path.join(folder, 'frames.bin'))
+        manager.preload()
+        sheet = manager.load_sheet(CHARACTER_SHEET, SPRITE_FRAME_SIZE, 4, 9)
+        manager.wait()
+        assert manager.decoded == 1
+        assert manager.load_sheet(CHARACTER_SHEET, SPRITE_FRAME_SIZE, 4, 9) is sheet
+        assert manager.exists(CHARACTER_SHEET) and not manager.exists('nothing.png')
+    print("✓ Preloading and a concurrent request decode the sheet once")
+    pygame.quit()
+
+
+def test_player_during_preload_draws_animated_frames():
+    """Test that a player made during a preload does not block, yet always draws its sheet"""
+    pygame.init()
+    release = threading.Event()
+    previous = assets.thread
+    assets.thread = threading.Thread(target=release.wait, daemon=True)
+    assets.thread.start()
+    try:
+        player = Player(100, 100)
+        assert player._animated_char is None, "Construction should not load the sheet"
+        assert player.rect.size == (SPRITE_FRAME_SIZE, SPRITE_FRAME_SIZE)
+        player.update(NoKeys(), [])
+        assert player.animated_char.rect is player.rect
+        assert player.image is player.animated_char.image
+    finally:
+        release.set()
+        assets.thread.join()
+        assets.thread = previous
+    print("✓ Player loads its sheet on first use and never draws a placeholder")
+    pygame.quit()
+
+if __name__ == "__main__":
+    print('='*60)
+    print('Testing Asset Manager')
+    print('='*60)
+    print()
+    
+    test_disk_cache_skips_decoding()
+    test_stale_cache_is_refreshed()
+    test_preload_shares_in_flight_load()
+    test_player_during_preload_draws_animated_frames()
+    
+    print()
+    print('='*60)
+    print('All asset manager tests passed!')
+    print('='*60)
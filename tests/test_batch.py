@@ -0,0 +1,82 @@
+"""
+Test the parallel batch runner and per-simulation parameter overrides
+"""
+import pygame
+import os
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+import constants
+from simulation import Simulation, DEFAULT_PARAMS
+from batch import run_job, run_batch, parameter_sweep, ScriptedPolicy
+
+
+def test_params_override_per_instance():
+    """Test that params change one simulation without touching the constants"""
+    pygame.init()
+    sim = Simulation(params={'spawn_interval': 500, 'enemy_speed': 4, 'player_health': 50})
+    default = Simulation()
+    
+    for generator in sim.game_map.generators:
+        assert generator.spawn_interval == 500
+        assert generator.enemy_speed == 4
+    assert sim.player.health == 50
+    sim.reset()
+    assert sim.player.health == 50, "Reset should keep the overridden health"
+    
+    assert constants.SPAWN_INTERVAL == DEFAULT_PARAMS['spawn_interval']
+    assert all(g.spawn_interval == constants.SPAWN_INTERVAL for g in default.game_map.generators)
+    
+    try:
+        Simulation(params={'spawn_rate': 1})
+    except ValueError:
+        print("✓ Parameters override one simulation only; unknown names are rejected")
+    else:
+        assert False, "Expected ValueError"
+    pygame.quit()
+
+
+def test_run_job_is_deterministic():
+    """Test that a job with the same seed produces the same result"""
+    job = {'params': {'spawn_interval': 800}, 'seed': 3, 'max_ticks': 600}
+    first = run_job(job)
+    second = run_job(job)
+    
+    ignore = {'ticks_per_sec'}
+    assert {k: v for k, v in first.items() if k not in ignore} == \
+           {k: v for k, v in second.items() if k not in ignore}
+    assert first['survival_time'] <= 10.0
+    assert first['damage_taken'] > 0, "Enemies should reach a randomly moving player"
+    print(f"✓ Same seed gives the same result ({first['kills']} kills, "
+          f"{first['damage_taken']} damage)")
+
+
+def test_run_batch_in_process_pool():
+    """Test that a sweep runs across worker processes and keeps job order"""
+    jobs = parameter_sweep({'enemy_speed': [1, 3]}, seeds=[0, 1],
+                           policy='scripted', max_ticks=120)
+    assert len(jobs) == 4
+    
+    results = run_batch(jobs, workers=2)
+    assert [r['params'] for r in results] == [job['params'] for job in jobs]
+    assert [r['seed'] for r in results] == [0, 1, 0, 1]
+    assert all(r['survival_time'] == 2.0 for r in results)
+    sim = Simulation()
+    assert ScriptedPolicy(0).act(sim)[0].bits != ScriptedPolicy(1).act(sim)[0].bits, \
+        "The seed picks where the scripted loop starts"
+    print(f"✓ {len(results)} jobs ran across 2 worker processes")
+
+
+if __name__ == "__main__":
+    print('='*60)
+    print('Testing Batch Runner')
+    print('='*60)
+    print()
+    
+    test_params_override_per_instance()
+    test_run_job_is_deterministic()
+    test_run_batch_in_process_pool()
+    
+    print()
+    print('='*60)
+    print('All batch tests passed!')
+    print('='*60)
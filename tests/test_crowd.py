@@ -0,0 +1,89 @@
+"""
+Test batched crowd separation
+"""
+import pygame
+import os
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+from constants import *
+from enemy import Enemy
+from game_map import GameMap
+from swarm import EnemySwarm
+from crowd import CrowdSeparation
+from simulation import Simulation
+
+
+def test_stacked_enemies_spread_out():
+    """Test that enemies spawned on one spot push apart until they no longer overlap much"""
+    pygame.init()
+    game_map = GameMap()
+    crowd = CrowdSeparation()
+    enemies = pygame.sprite.Group(Enemy(25 * TILE_SIZE + 2, 5 * TILE_SIZE + 2) for _ in range(12))
+    for _ in range(60):
+        crowd.apply(enemies, game_map)
+    positions = [sprite.rect.topleft for sprite in enemies]
+    assert len(set(positions)) == len(positions), "Every enemy left the shared spot"
+    
+    # Only pairs still overlapping by more than a few pixels count as stacked
+    sprites = enemies.sprites()
+    deep = sum(1 for i, a in enumerate(sprites) for b in sprites[i + 1:]
+               if abs(a.rect.x - b.rect.x) < 8 and abs(a.rect.y - b.rect.y) < 8)
+    assert deep == 0, f"{deep} pairs are still stacked"
+    print(f"✓ 12 stacked enemies spread out ({crowd.contacts} light contacts left)")
+    pygame.quit()
+
+
+def test_walls_block_pushes():
+    """Test that separation never pushes an enemy into a wall"""
+    pygame.init()
+    game_map = GameMap()
+    crowd = CrowdSeparation()
+    # A corner of the border walls, where half the pushes point into solid tiles
+    enemies = pygame.sprite.Group(Enemy(TILE_SIZE + 1, TILE_SIZE + 1) for _ in range(10))
+    for _ in range(60):
+        crowd.apply(enemies, game_map)
+        assert not any(game_map.rect_hits_solid(sprite.rect) for sprite in enemies)
+    assert len({sprite.rect.topleft for sprite in enemies}) > 1
+    print("✓ Pushes stop at walls")
+    pygame.quit()
+
+
+def test_swarm_and_simulation():
+    """Test separation on swarm slots and inside a running simulation"""
+    pygame.init()
+    game_map = GameMap()
+    crowd = CrowdSeparation()
+    swarm = EnemySwarm(capacity=4)
+    for _ in range(10):
+        swarm.spawn(25 * TILE_SIZE + 2, 5 * TILE_SIZE + 2)
+    swarm.kill([0])
+    dead_x = int(swarm.x[0])
+    for _ in range(30):
+        crowd.apply_swarm(swarm, game_map)
+    live = swarm.alive[:swarm.size].nonzero()[0]
+    assert len(set(zip(swarm.x[live].tolist(), swarm.y[live].tolist()))) == 9
+    assert swarm.x[0] == dead_x, "Dead slots are left alone"
+    
+    sim = Simulation(use_separation=True, params={'spawn_interval': 200})
+    for _ in range(300):
+        sim.tick()
+    assert sim.enemy_count() > 0
+    assert not any(sim.game_map.rect_hits_solid(enemy.rect) for enemy in sim.enemies)
+    print(f"✓ Swarm slots separate; simulation separation: {sim.crowd.stats()}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    print('='*60)
+    print('Testing Crowd Separation')
+    print('='*60)
+    print()
+    
+    test_stacked_enemies_spread_out()
+    test_walls_block_pushes()
+    test_swarm_and_simulation()
+    
+    print()
+    print('='*60)
+    print('All crowd separation tests passed!')
+    print('='*60)
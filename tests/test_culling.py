@@ -0,0 +1,71 @@
+"""
+Test viewport culling of enemies and projectiles
+"""
+import pygame
+import os
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+from game import Game
+from enemy import Enemy
+from projectile import Projectile
+from constants import *
+
+
+def test_offscreen_sprites_are_culled():
+    """Test that only sprites inside the camera view are drawn"""
+    pygame.init()
+    game = Game()
+    game.state = STATE_PLAYING
+    game.camera.update(game.player)
+    view = game.camera.camera
+    
+    game.enemies.add(Enemy(view.x + 50, view.y + 50))
+    game.enemies.add(Enemy(view.right + 200, view.y + 50))
+    game.enemies.add(Enemy(view.x + 50, view.bottom + 200))
+    game.projectiles.add(Projectile(view.centerx, view.centery, (1, 0)))
+    game.projectiles.add(Projectile(view.right + 100, view.bottom + 100, (1, 0)))
+    
+    game.draw()
+    assert game.sprites_drawn == 2, f"Expected 2 drawn, got {game.sprites_drawn}"
+    assert game.sprites_culled == 3, f"Expected 3 culled, got {game.sprites_culled}"
+    print(f"✓ Drew {game.sprites_drawn} sprites and culled {game.sprites_culled}")
+    pygame.quit()
+
+
+def test_culling_uses_enemy_hash_after_update():
+    """Test that culling through the spatial hash agrees with the rect test"""
+    pygame.init()
+    game = Game()
+    game.state = STATE_PLAYING
+    
+    # One row near the player and one far below the view
+    for tile_x in range(2, MAP_WIDTH - 2, 3):
+        game.enemies.add(Enemy(tile_x * TILE_SIZE, 8 * TILE_SIZE))
+        game.enemies.add(Enemy(tile_x * TILE_SIZE, 28 * TILE_SIZE))
+    game.update(0)
+    assert game.sim.enemy_hash_synced
+    
+    view = game.camera.camera
+    expected = sum(1 for enemy in game.enemies if view.colliderect(enemy.rect))
+    expected += sum(1 for projectile in game.projectiles if view.colliderect(projectile.rect))
+    game.draw()
+    assert game.sprites_drawn == expected
+    assert game.sprites_drawn > 0 and game.sprites_culled > 0
+    assert game.sprites_drawn + game.sprites_culled == len(game.enemies) + len(game.projectiles)
+    print(f"✓ Hash-based culling drew {game.sprites_drawn} of {len(game.enemies)} enemies")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    print('='*60)
+    print('Testing Viewport Culling')
+    print('='*60)
+    print()
+    
+    test_offscreen_sprites_are_culled()
+    test_culling_uses_enemy_hash_after_update()
+    
+    print()
+    print('='*60)
+    print('All culling tests passed!')
+    print('='*60)
@@ -0,0 +1,92 @@
+"""
+Test dirty-rectangle rendering
+"""
+import pygame
+import os
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+from constants import *
+from game import Game
+from enemy import Enemy
+
+
+def screen_bytes(game):
+    return pygame.image.tobytes(game.screen, 'RGB')
+
+
+def test_dirty_frames_match_full_redraws():
+    """Test that patched frames look exactly like full redraws while sprites move"""
+    pygame.init()
+    game = Game(dirty_rects=True)
+    game.state = STATE_PLAYING
+    game.camera.update(game.player)
+    game.draw()
+    assert game.full_redraws == 1
+    
+    # The player stands still, so only enemies, projectiles and the UI change
+    for tick in range(240):
+        if tick % 20 == 0:
+            game.shot_pending = True
+        game.tick()
+        game.draw()
+    assert game.full_redraws == 1 and game.dirty_redraws == 240
+    assert len(game.enemies) > 0 and len(game.dynamic_rects) > 2
+    
+    patched = screen_bytes(game)
+    game.needs_full_redraw = True
+    game.draw()
+    assert game.full_redraws == 2
+    assert screen_bytes(game) == patched, "Dirty-rect frame differs from a full redraw"
+    print(f"✓ {game.dirty_redraws} dirty-rect frames match a full redraw")
+    pygame.quit()
+
+
+def test_full_redraw_fallbacks():
+    """Test that camera scrolls, state changes and map changes redraw everything"""
+    pygame.init()
+    game = Game(dirty_rects=True)
+    game.state = STATE_PLAYING
+    game.draw()
+    
+    game.player.rect.x += 5 * TILE_SIZE
+    game.camera.update(game.player)
+    game.draw()
+    assert game.full_redraws == 2, "Camera scroll should redraw in full"
+    
+    game.state = STATE_PAUSED
+    game.draw()
+    assert game.full_redraws == 3
+    for _ in range(5):
+        game.draw()
+    assert game.full_redraws == 3 and game.dirty_redraws == 0, "Paused screen should not be redrawn"
+    
+    game.state = STATE_PLAYING
+    game.draw()
+    game.game_map.generators.sprites()[0].kill()
+    game.draw()
+    assert game.full_redraws == 5, "Map change should redraw in full"
+    
+    # A burst of sprites is redrawn in full on the frame it appears, not the one after
+    game.draw()
+    dirty = game.dirty_redraws
+    for offset in range(MAX_DIRTY_RECTS + 1):
+        game.enemies.add(Enemy(game.player.rect.x + offset % 40, game.player.rect.y + offset // 40))
+    game.draw()
+    assert game.full_redraws == 6 and game.dirty_redraws == dirty
+    print("✓ Full redraws on scroll, state, map changes and sprite bursts; static menus are skipped")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    print('='*60)
+    print('Testing Dirty-Rect Rendering')
+    print('='*60)
+    print()
+    
+    test_dirty_frames_match_full_redraws()
+    test_full_redraw_fallbacks()
+    
+    print()
+    print('='*60)
+    print('All dirty-rect tests passed!')
+    print('='*60)
@@ -0,0 +1,81 @@
+"""
+Test the vectorized Gym-style environment
+"""
+import pygame
+import os
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+import numpy as np
+from constants import *
+from env import VectorEnv, OBS_GENERATOR, MAX_OBS_ENEMIES
+from replay import SHOOT_BIT, KEY_BITS
+
+RIGHT = dict(KEY_BITS)[pygame.K_RIGHT]
+
+
+def test_reset_and_observations():
+    """Test batched observation shapes and seeded reproducibility"""
+    pygame.init()
+    env = VectorEnv(3)
+    obs = env.reset(seed=7)
+    assert obs['tiles'].shape == (3, MAP_HEIGHT, MAP_WIDTH)
+    assert obs['player'].shape == (3, 3)
+    assert obs['enemies'].shape == (3, MAX_OBS_ENEMIES, 2)
+    assert (obs['tiles'] == OBS_GENERATOR).sum(axis=(1, 2)).tolist() == [4, 4, 4]
+    assert (obs['tiles'][:, 0, :] == TILE_WALL).all()
+    assert (obs['player'][:, 2] == 1000).all()
+    
+    actions = np.full(3, RIGHT | SHOOT_BIT)
+    first = [env.step(actions)[0] for _ in range(200)][-1]
+    env.reset(seed=7)
+    second = [env.step(actions)[0] for _ in range(200)][-1]
+    for name in first:
+        assert np.array_equal(first[name], second[name]), name
+    assert first['enemy_count'].sum() > 0
+    print(f"✓ Observations batched and reproducible per seed "
+          f"(enemies {first['enemy_count'].tolist()})")
+    pygame.quit()
+
+
+def test_step_rewards_and_autoreset():
+    """Test that actions drive the player, kills are rewarded and episodes restart"""
+    pygame.init()
+    env = VectorEnv(2, max_ticks=50)
+    obs = env.reset(seed=0)
+    start_x = obs['player'][0, 0]
+    
+    # Instance 0 walks right; instance 1 stands still with a kill lined up
+    sim = env.sims[1]
+    enemy = sim.enemy_pool.acquire(sim.player.rect.centerx - TILE_SIZE // 2,
+                                   sim.player.rect.y - 3 * TILE_SIZE)
+    enemy.speed = 0
+    sim.enemies.add(enemy)
+    obs, rewards, terminated, truncated, infos = env.step([RIGHT, SHOOT_BIT])
+    assert obs['player'][0, 0] == start_x + PLAYER_SPEED
+    for _ in range(20):
+        obs, step_rewards, terminated, truncated, infos = env.step([RIGHT, 0])
+        rewards += step_rewards
+    assert infos[1]['kills'] == 1 and rewards[1] > 0
+    
+    for _ in range(29):
+        obs, rewards, terminated, truncated, infos = env.step([0, 0])
+    assert truncated.all() and not terminated.any()
+    assert (obs['player'][:, 0] == start_x).all(), "Truncated instances should be reset"
+    assert all(sim.ticks == 0 for sim in env.sims)
+    print("✓ Actions move the player, kills are rewarded and episodes auto-reset")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    print('='*60)
+    print('Testing Vectorized Environment')
+    print('='*60)
+    print()
+    
+    test_reset_and_observations()
+    test_step_rewards_and_autoreset()
+    
+    print()
+    print('='*60)
+    print('All environment tests passed!')
+    print('='*60)
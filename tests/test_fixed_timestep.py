@@ -0,0 +1,105 @@
+"""
+Test the fixed-timestep simulation loop and render interpolation
+"""
+import pygame
+import os
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+from game import Game
+from enemy import Enemy
+from constants import *
+
+
+def test_advance_runs_fixed_ticks():
+    """Test that elapsed time is converted into whole simulation ticks"""
+    pygame.init()
+    game = Game(tick_rate=50, max_catch_up=5)
+    game.state = STATE_PLAYING
+    
+    assert game.advance(10) == 0, "Less than one tick of time runs nothing"
+    assert game.advance(10) == 1
+    assert game.sim_time == 20
+    assert game.advance(45) == 2
+    assert game.sim_time == 60
+    assert abs(game.interpolation_alpha() - 0.25) < 1e-9
+    print("✓ Elapsed time runs whole fixed ticks")
+    pygame.quit()
+
+
+def test_catch_up_is_capped():
+    """Test that a long stall runs at most max_catch_up ticks and drops the rest"""
+    pygame.init()
+    game = Game(tick_rate=100, max_catch_up=3)
+    game.state = STATE_PLAYING
+    
+    assert game.advance(1005) == 3
+    assert game.sim_time == 30
+    assert game.dropped_time == 970
+    assert game.accumulator == 5
+    print("✓ Catch-up is capped and the backlog dropped")
+    pygame.quit()
+
+
+def test_simulation_clock_pauses():
+    """Test that the simulation clock only advances while playing"""
+    pygame.init()
+    game = Game(tick_rate=100)
+    game.state = STATE_PAUSED
+    game.advance(500)
+    assert game.sim_time == 0
+    assert game.interpolation_alpha() == 1.0
+    print("✓ Simulation clock stops while paused")
+    pygame.quit()
+
+
+def test_render_interpolates_between_ticks():
+    """Test that moving sprites are drawn between their last two positions"""
+    pygame.init()
+    game = Game()
+    game.state = STATE_PLAYING
+    enemy = Enemy(game.player.rect.x + 200, game.player.rect.y)
+    game.enemies.add(enemy)
+    
+    before = enemy.rect.topleft
+    game.update(game.sim_time)
+    after = enemy.rect.topleft
+    assert before != after
+    
+    view = game.camera.camera
+    assert game.render_position(enemy, view, 1.0) == (after[0] - view.x, after[1] - view.y)
+    assert game.render_position(enemy, view, 0.0) == (before[0] - view.x, before[1] - view.y)
+    halfway = game.render_position(enemy, view, 0.5)
+    assert halfway[0] == round((before[0] + after[0]) / 2) - view.x
+    game.draw(0.5)
+    print("✓ Rendering interpolates between ticks")
+    pygame.quit()
+
+
+def test_camera_starts_on_player():
+    """Test that a new or reset game does not interpolate the view in from the map origin"""
+    pygame.init()
+    game = Game()
+    for _ in range(2):
+        assert game.camera.camera.size == (SCREEN_WIDTH, SCREEN_HEIGHT)
+        assert game.camera.view(0.0) == game.camera.camera
+        game.reset_game()
+    print("✓ Camera starts on the player after start and reset")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    print('='*60)
+    print('Testing Fixed Timestep')
+    print('='*60)
+    print()
+    
+    test_advance_runs_fixed_ticks()
+    test_catch_up_is_capped()
+    test_simulation_clock_pauses()
+    test_render_interpolates_between_ticks()
+    test_camera_starts_on_player()
+    
+    print()
+    print('='*60)
+    print('All fixed timestep tests passed!')
+    print('='*60)
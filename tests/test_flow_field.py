@@ -0,0 +1,89 @@
+"""
+Test flow field pathfinding
+"""
+import pygame
+import os
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+from constants import *
+from game_map import GameMap
+from enemy import Enemy
+from flow_field import FlowField, UNREACHABLE
+from wall import Wall
+from helpers import Target
+
+
+def test_flow_field_distances():
+    """Test BFS distances and next steps around walls"""
+    pygame.init()
+    game_map = GameMap()
+    field = FlowField(game_map)
+    target = Target.on_tile(15, 15)
+    
+    assert field.update(target), "First update should compute the field"
+    assert field.distance_at(15 * TILE_SIZE, 15 * TILE_SIZE) == 0
+    assert field.distance_at(16 * TILE_SIZE, 15 * TILE_SIZE) == 1
+    assert field.distance_at(0, 0) == UNREACHABLE, "Walls are never reachable"
+    
+    # Directly above the wall at y=10 the path has to go around it
+    assert field.distance_at(15 * TILE_SIZE, 9 * TILE_SIZE) > 6
+    step = field.next_step(15 * TILE_SIZE + 16, 9 * TILE_SIZE + 16)
+    assert step is not None and step[1] == 9 * TILE_SIZE + 16, "Should step sideways around the wall"
+    print("✓ Flow field distances route around walls")
+    pygame.quit()
+
+
+def test_flow_field_recomputes_only_when_needed():
+    """Test that the field is searched again only when the target changes tile"""
+    pygame.init()
+    game_map = GameMap()
+    field = FlowField(game_map)
+    target = Target.on_tile(15, 15)
+    
+    field.update(target)
+    target.rect.x += 1
+    assert not field.update(target), "Moving within a tile should not recompute"
+    target.rect.x += TILE_SIZE
+    assert field.update(target), "Entering a new tile should recompute"
+    
+    game_map.walls.add(Wall(7, 7))
+    assert field.update(target), "Changing the map should update the field"
+    assert field.recomputes == 2 and field.repairs == 1, "Map changes are repaired in place"
+    print("✓ Flow field recomputes only when the target changes tile")
+    pygame.quit()
+
+
+def test_enemy_follows_flow_field_around_wall():
+    """Test that an enemy behind a wall reaches the target with the flow field"""
+    pygame.init()
+    game_map = GameMap()
+    field = FlowField(game_map)
+    target = Target.on_tile(15, 15)
+    enemy = Enemy(15 * TILE_SIZE + 2, 5 * TILE_SIZE + 2)
+    
+    reached = False
+    for _ in range(1000):
+        field.update(target)
+        enemy.update(target, game_map.walls, game_map, field)
+        if enemy.rect.colliderect(target.rect):
+            reached = True
+            break
+    assert reached, f"Enemy should reach the target, stuck at {enemy.rect}"
+    print("✓ Enemy follows the flow field around walls")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    print('='*60)
+    print('Testing Flow Field')
+    print('='*60)
+    print()
+    
+    test_flow_field_distances()
+    test_flow_field_recomputes_only_when_needed()
+    test_enemy_follows_flow_field_around_wall()
+    
+    print()
+    print('='*60)
+    print('All flow field tests passed!')
+    print('='*60)
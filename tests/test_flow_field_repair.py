@@ -0,0 +1,136 @@
+"""
+Test incremental flow field repair after map changes
+"""
+import pygame
+import os
+import random
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+from constants import *
+from game_map import GameMap
+from flow_field import FlowField, UNREACHABLE
+from helpers import Target
+
+
+def assert_matches_full_search(field):
+    """Check a field against one searched from scratch on the same map"""
+    fresh = FlowField(field.game_map)
+    fresh.target_tile = field.target_tile
+    fresh.recompute()
+    assert field.distances == fresh.distances, "Repaired distances differ from a full search"
+    width = field.game_map.width
+    for index, distance in enumerate(field.distances):
+        step = field.next_tiles[index]
+        if distance > 0:
+            assert abs(step - index) in (1, width) and field.distances[step] == distance - 1
+        else:
+            assert step == UNREACHABLE
+
+
+def test_repairs_match_full_search():
+    """Test that random wall changes are repaired to exactly the full-search distances"""
+    pygame.init()
+    rng = random.Random(7)
+    game_map = GameMap()
+    field = FlowField(game_map, repair_budget=None)
+    target = Target.on_tile(15, 15)
+    field.update(target)
+    for _ in range(300):
+        tile_x = rng.randrange(1, game_map.width - 1)
+        tile_y = rng.randrange(1, game_map.height - 1)
+        if (tile_x, tile_y) == field.target_tile:
+            continue
+        solid = game_map.is_solid(tile_x, tile_y)
+        game_map.set_tile(tile_x, tile_y, TILE_FLOOR if solid else TILE_WALL)
+        if rng.random() < 0.5:
+            field.update(target)
+            assert_matches_full_search(field)
+    field.update(target)
+    assert_matches_full_search(field)
+    assert field.recomputes == 1 and field.repairs > 0
+    print(f"✓ {field.repairs} wall changes repaired to match a full search")
+    pygame.quit()
+
+
+def test_budgeted_repair_catches_up():
+    """Test that repairs spread over updates stay within budget and end at the full search"""
+    pygame.init()
+    rng = random.Random(3)
+    game_map = GameMap()
+    field = FlowField(game_map, repair_budget=8)
+    target = Target.on_tile(15, 15)
+    field.update(target)
+    spread = 0
+    for _ in range(100):
+        tile_x = rng.randrange(1, game_map.width - 1)
+        tile_y = rng.randrange(1, game_map.height - 1)
+        if (tile_x, tile_y) == field.target_tile:
+            continue
+        solid = game_map.is_solid(tile_x, tile_y)
+        game_map.set_tile(tile_x, tile_y, TILE_FLOOR if solid else TILE_WALL)
+        field.update(target)
+        assert field.cells_touched <= 8
+        spread += field.stats()['repairing']
+    while field.stats()['repairing']:
+        field.update(target)
+    assert_matches_full_search(field)
+    assert spread > 0 and field.recomputes == 1
+    print(f"✓ Budgeted repairs carried over {spread} times and caught up with a full search")
+    pygame.quit()
+
+
+def test_generator_changes_cost_nothing():
+    """Test that destroying a generator, which never blocks the field, touches no tiles"""
+    pygame.init()
+    game_map = GameMap()
+    field = FlowField(game_map)
+    target = Target.on_tile(15, 15)
+    field.update(target)
+    
+    game_map.generators.sprites()[0].kill()
+    assert not field.update(target)
+    assert field.cells_touched == 0 and field.repairs == 0 and field.recomputes == 1
+    
+    game_map.set_tile(18, 17, TILE_WALL)
+    assert field.update(target)
+    stats = field.stats()
+    assert stats['repairs'] == 1 and 0 < stats['cells_touched'] < 10
+    print(f"✓ Generator changes are free, a wall near the target touched {stats['cells_touched']} tiles")
+    pygame.quit()
+
+
+def test_budgeted_rebuild_keeps_old_field():
+    """Test that a budgeted search for a new target swaps in only once complete"""
+    pygame.init()
+    game_map = GameMap()
+    field = FlowField(game_map, rebuild_budget=200)
+    field.update(Target.on_tile(15, 15))
+    old_distances = field.distances
+    
+    target = Target.on_tile(16, 15)
+    slices = 0
+    while not field.update(target):
+        assert field.target_tile == (15, 15) and field.distances is old_distances
+        assert field.cells_touched <= 200
+        slices += 1
+    assert slices > 0 and field.target_tile == (16, 15)
+    assert_matches_full_search(field)
+    print(f"✓ Budgeted rebuild swapped in after {slices + 1} updates")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    print('='*60)
+    print('Testing Flow Field Repair')
+    print('='*60)
+    print()
+    
+    test_repairs_match_full_search()
+    test_budgeted_repair_catches_up()
+    test_generator_changes_cost_nothing()
+    test_budgeted_rebuild_keeps_old_field()
+    
+    print()
+    print('='*60)
+    print('All flow field repair tests passed!')
+    print('='*60)
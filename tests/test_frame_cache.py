@@ -0,0 +1,74 @@
+"""
+Test the shared sprite sheet cache of AnimatedCharacter
+"""
+import pygame
+import os
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+from entities.character import AnimatedCharacter
+from assets import assets
+from constants import *
+
+SHEET = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                     'resources', 'sprites', 'character-spritesheet.png')
+
+
+def test_characters_share_subsurface_frames():
+    """Test that further characters reuse one decoded sheet without copying pixels"""
+    pygame.init()
+    pygame.display.set_mode((800, 600))
+    AnimatedCharacter.clear_frame_cache()
+    
+    loads = []
+    original_load = assets.load_sheet
+    assets.load_sheet = lambda *args: loads.append(args) or original_load(*args)
+    try:
+        first = AnimatedCharacter(0, 0, SHEET)
+        second = AnimatedCharacter(100, 100, SHEET)
+        third = AnimatedCharacter(0, 0, os.path.relpath(SHEET))
+    finally:
+        del assets.load_sheet
+    
+    assert len(loads) == 1, "The sheet should be loaded and sliced once"
+    assert second.animations is first.animations and third.sprite_sheet is first.sprite_sheet
+    for frames in first.animations.values():
+        assert len(frames) == AnimatedCharacter.FRAMES_PER_ROW
+        assert all(frame.get_parent() is first.sprite_sheet for frame in frames)
+    
+    # Each character still animates independently
+    second.set_direction(1, 0)
+    second.update_animation()
+    assert first.current_direction == AnimatedCharacter.DIRECTION_DOWN
+    assert first.rect.topleft == (0, 0) and second.rect.topleft == (100, 100)
+    print("✓ Characters share one sheet and subsurface frames")
+    pygame.quit()
+
+
+def test_headless_sheet_converted_later():
+    """Test that a sheet cached without a display is converted once one exists"""
+    pygame.init()
+    AnimatedCharacter.clear_frame_cache()
+    headless = AnimatedCharacter(0, 0, SHEET)
+    
+    pygame.display.set_mode((800, 600))
+    displayed = AnimatedCharacter(0, 0, SHEET)
+    assert displayed.sprite_sheet is not headless.sprite_sheet
+    assert AnimatedCharacter(0, 0, SHEET).sprite_sheet is displayed.sprite_sheet
+    assert displayed.animations[AnimatedCharacter.DIRECTION_UP][0].get_size() == (64, 64)
+    print("✓ Headless sheet converted once a display exists")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    print('='*60)
+    print('Testing Sprite Sheet Cache')
+    print('='*60)
+    print()
+    
+    test_characters_share_subsurface_frames()
+    test_headless_sheet_converted_later()
+    
+    print()
+    print('='*60)
+    print('All sprite sheet cache tests passed!')
+    print('='*60)
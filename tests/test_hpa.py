@@ -0,0 +1,145 @@
+"""
+Test hierarchical pathfinding on large maps
+"""
+import pygame
+import os
+import random
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+from constants import *
+from game_map import GameMap
+from enemy import Enemy
+from hpa import HierarchicalPathfinder, astar
+from simulation import Simulation
+from helpers import Target
+
+
+def scattered_map(size, seed):
+    """Build an open map with random single-tile walls"""
+    rng = random.Random(seed)
+    game_map = GameMap(size, size)
+    game_map.tiles[:] = bytes(TILE_WALL if value < 40 else TILE_FLOOR
+                              for value in rng.randbytes(size * size))
+    return game_map
+
+
+def walk(route, start, game_map):
+    """Follow a route tile by tile, checking each step; returns the final tile and length"""
+    index = start
+    length = 0
+    while True:
+        step = route.next_tile(index)
+        if step is None:
+            return index, length
+        assert abs(step - index) in (1, game_map.width), "Routes move one tile at a time"
+        assert game_map.tiles[step] != TILE_WALL, "Routes never enter walls"
+        index = step
+        length += 1
+
+
+def test_routes_reach_goal_nearly_optimally():
+    """Test that refined routes reach the goal within a few percent of A*"""
+    pygame.init()
+    rng = random.Random(3)
+    game_map = scattered_map(160, 1)
+    pathfinder = HierarchicalPathfinder(game_map, 16)
+    floor = [index for index, tile in enumerate(game_map.tiles) if tile != TILE_WALL]
+    hpa_length = astar_length = 0
+    for _ in range(40):
+        start, goal = rng.choice(floor), rng.choice(floor)
+        path = astar(game_map, start, goal)
+        route = pathfinder.find_route(start, goal)
+        if path is None:
+            assert route is None
+            continue
+        end, length = walk(route, start, game_map)
+        assert end == goal
+        hpa_length += length
+        astar_length += len(path) - 1
+    assert astar_length <= hpa_length < astar_length * 1.1
+    print(f"✓ Routes reach their goals, {hpa_length / astar_length:.3f}x the A* length")
+    pygame.quit()
+
+
+def test_route_cache_and_map_changes():
+    """Test that routes are cached per cluster pair and dropped when a wall blocks them"""
+    pygame.init()
+    game_map = GameMap(64, 64)
+    pathfinder = HierarchicalPathfinder(game_map, 16)
+    start = 5 * 64 + 5
+    goal = 58 * 64 + 58
+    pathfinder.find_route(start, goal)
+    pathfinder.find_route(start + 1, goal - 1)
+    assert pathfinder.cache_hits == 1, "A second query between the same clusters should hit the cache"
+    
+    # Destroying a generator notifies the map but changes no passability
+    game_map.generators.sprites()[0].kill()
+    pathfinder.find_route(start, goal)
+    assert pathfinder.cache_hits == 2 and not pathfinder.dirty_clusters
+    
+    # A wall in a cluster the route stays clear of keeps it too
+    game_map.set_tile(55, 5, TILE_WALL)
+    pathfinder.find_route(start, goal)
+    assert pathfinder.cache_hits == 3
+    
+    # Wall off the goal's cluster except for one gap
+    for x in range(64):
+        if x != 40:
+            game_map.set_tile(x, 48, TILE_WALL)
+    route = pathfinder.find_route(start, goal)
+    assert pathfinder.cache_hits == 3, "Walls across the route should drop it from the cache"
+    end, length = walk(route, start, game_map)
+    assert end == goal and length == len(astar(game_map, start, goal)) - 1
+    print("✓ Routes are cached per cluster pair and replanned after the map changes")
+    pygame.quit()
+
+
+def test_enemy_follows_route_around_wall():
+    """Test that an enemy behind a wall reaches the target along its route"""
+    pygame.init()
+    game_map = GameMap()
+    pathfinder = HierarchicalPathfinder(game_map, 8)
+    target = Target.on_tile(15, 15)
+    enemy = Enemy(15 * TILE_SIZE + 2, 5 * TILE_SIZE + 2)
+    
+    reached = False
+    for _ in range(1000):
+        enemy.update(target, game_map.walls, game_map, pathfinder=pathfinder)
+        if enemy.rect.colliderect(target.rect):
+            reached = True
+            break
+    assert reached, f"Enemy should reach the target, stuck at {enemy.rect}"
+    assert enemy.route is not None
+    print("✓ Enemy follows its hierarchical route around walls")
+    pygame.quit()
+
+
+def test_simulation_builds_flow_field_only_when_used():
+    """Test that routes alone leave out the flow field, which would queue map changes forever"""
+    pygame.init()
+    sim = Simulation(use_hpa=True, params={'spawn_interval': 200})
+    assert sim.flow_field is None
+    for _ in range(120):
+        sim.tick()
+    assert sim.enemy_count() > 0
+    assert Simulation(use_hpa=True, use_swarm=True).flow_field is not None
+    assert Simulation().flow_field is not None
+    print("✓ The flow field is only built for the swarm or without routes")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    print('='*60)
+    print('Testing Hierarchical Pathfinding')
+    print('='*60)
+    print()
+    
+    test_routes_reach_goal_nearly_optimally()
+    test_route_cache_and_map_changes()
+    test_enemy_follows_route_around_wall()
+    test_simulation_builds_flow_field_only_when_used()
+    
+    print()
+    print('='*60)
+    print('All hierarchical pathfinding tests passed!')
+    print('='*60)
@@ -0,0 +1,83 @@
+"""
+Test the cached HUD
+"""
+import pygame
+import os
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+from constants import *
+from hud import Hud, TEXT_CACHE_SIZE
+from game import Game
+
+
+def test_hud_recomposes_only_on_change():
+    """Test that text is rendered and composed only when a value changes"""
+    pygame.init()
+    game = Game()
+    game.state = STATE_PLAYING
+    hud = game.hud
+    font = hud.font
+    
+    for _ in range(10):
+        game.draw()
+    assert hud.compositions == 1
+    assert hud.font is font
+    
+    game.player.take_damage(10)
+    game.draw()
+    game.draw()
+    assert hud.compositions == 2
+    assert len(hud.widgets['health'].cache) == 2
+    
+    # Going back to a seen value reuses its cached text
+    cached = hud.widgets['health'].cache[1000]
+    game.player.health = 1000
+    game.draw()
+    assert hud.compositions == 3 and hud.widgets['health'].render(font) is cached
+    print(f"✓ HUD composed {hud.compositions} times over 13 frames")
+    pygame.quit()
+
+
+def test_widgets_compose_into_one_surface():
+    """Test that several widgets share one surface matching direct rendering"""
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    hud = Hud()
+    hud.add_widget('health', "Health", (10, 10))
+    hud.add_widget('kills', "Kills", (10, 40), YELLOW)
+    hud.set('health', 500)
+    hud.draw(screen)
+    assert hud.rect.height < 30, "Widgets without a value are not shown"
+    
+    hud.set('kills', 3)
+    screen.fill(BLACK)
+    rect = hud.draw(screen)
+    assert rect.topleft == (10, 10) and rect.bottom > 40
+    composed = pygame.image.tobytes(screen, 'RGB')
+    
+    screen.fill(BLACK)
+    screen.blit(hud.font.render("Health: 500", True, WHITE), (10, 10))
+    screen.blit(hud.font.render("Kills: 3", True, YELLOW), (10, 40))
+    assert pygame.image.tobytes(screen, 'RGB') == composed
+    
+    for value in range(TEXT_CACHE_SIZE * 2):
+        hud.set('kills', value)
+        hud.draw(screen)
+    assert len(hud.widgets['kills'].cache) == TEXT_CACHE_SIZE
+    print("✓ Widgets compose into one surface and the text cache stays bounded")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    print('='*60)
+    print('Testing HUD')
+    print('='*60)
+    print()
+    
+    test_hud_recomposes_only_on_change()
+    test_widgets_compose_into_one_surface()
+    
+    print()
+    print('='*60)
+    print('All HUD tests passed!')
+    print('='*60)
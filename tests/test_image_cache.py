@@ -0,0 +1,80 @@
+"""
+Test the shared image cache
+"""
+import pygame
+import os
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+import image_cache
+from constants import *
+from wall import Wall
+from enemy import Enemy
+from generator import Generator
+
+
+def test_sprites_share_surfaces():
+    """Test that identical sprites share one surface and different kinds do not"""
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    image_cache.clear()
+    
+    walls = [Wall(x, 0) for x in range(10)]
+    assert all(wall.image is walls[0].image for wall in walls)
+    assert walls[0].image.get_at((0, 0))[:3] == GRAY
+    assert Generator(1, 1).image is not walls[0].image
+    assert Enemy(0, 0).image.get_size() == (TILE_SIZE - 4, TILE_SIZE - 4)
+    print("✓ Sprites of one kind share a surface")
+    pygame.quit()
+
+
+def test_surfaces_converted_once_display_exists():
+    """Test that a surface cached before the display is converted afterwards"""
+    pygame.init()
+    image_cache.clear()
+    early = image_cache.get_surface('test', (4, 4), BLUE)
+    
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    converted = image_cache.get_surface('test', (4, 4), BLUE)
+    assert converted is not early
+    assert converted.get_bitsize() == screen.get_bitsize()
+    assert image_cache.get_surface('test', (4, 4), BLUE) is converted
+    print("✓ Cached surfaces are converted to the display format")
+    pygame.quit()
+
+
+def test_memory_report():
+    """Test that the memory report counts requests against shared surfaces"""
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    image_cache.clear()
+    for x in range(50):
+        Wall(x, 0)
+    Enemy(0, 0)
+    
+    report = image_cache.memory_report()
+    assert report['wall']['requests'] == 50
+    assert report['wall']['surfaces'] == 1
+    assert report['wall']['unshared_bytes'] == 50 * report['wall']['shared_bytes']
+    assert report['total']['requests'] == 51
+    
+    # Requests are cumulative, so a wall that is gone still counts
+    Wall(0, 1)
+    assert image_cache.memory_report()['wall']['requests'] == 51
+    print("✓ Memory report shows shared vs. unshared bytes")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    print('='*60)
+    print('Testing Image Cache')
+    print('='*60)
+    print()
+    
+    test_sprites_share_surfaces()
+    test_surfaces_converted_once_display_exists()
+    test_memory_report()
+    
+    print()
+    print('='*60)
+    print('All image cache tests passed!')
+    print('='*60)
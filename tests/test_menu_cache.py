@@ -0,0 +1,85 @@
+"""
+Test cached menu surfaces and the frozen menu background
+"""
+import pygame
+import os
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+from constants import *
+from menu import Menu
+from game import Game
+
+
+def test_menu_surfaces_are_cached():
+    """Test that the overlay and texts are reused until the menu state or size changes"""
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    menu = Menu(screen)
+    menu.draw(is_paused=True)
+    overlay = menu.overlay
+    texts = menu.texts[(True, False, 0)]
+    
+    menu.draw(is_paused=True)
+    menu.draw(is_game_over=True)
+    assert menu.overlay is overlay and menu.texts[(True, False, 0)] is texts
+    assert len(menu.texts) == 2
+    
+    # The selected option is drawn in another color, so it renders new texts
+    menu.selected_index = 1
+    menu.draw(is_paused=True)
+    assert menu.texts[(True, False, 1)] is not texts and len(menu.texts) == 3
+    menu.freeze_background = True
+    menu.freeze(is_paused=True)
+    assert menu.draw_frozen(is_paused=True)
+    menu.selected_index = 0
+    assert not menu.draw_frozen(is_paused=True)
+    
+    menu.screen = pygame.Surface((400, 300))
+    menu.draw(is_paused=True)
+    assert menu.overlay.get_size() == (400, 300) and len(menu.texts) == 1
+    print("✓ Menu overlay and texts cached per state and screen size")
+    pygame.quit()
+
+
+def test_frozen_pause_screen():
+    """Test that a frozen pause screen is one blit and matches a normal redraw"""
+    pygame.init()
+    game = Game(freeze_menu=True)
+    game.state = STATE_PLAYING
+    for _ in range(120):
+        game.tick()
+    game.state = STATE_PAUSED
+    
+    game.draw(1.0)
+    expected = pygame.image.tobytes(game.screen, 'RGB')
+    redraws = game.full_redraws
+    for _ in range(5):
+        game.draw(1.0)
+    assert game.full_redraws == redraws, "Frozen frames should not redraw the scene"
+    assert pygame.image.tobytes(game.screen, 'RGB') == expected
+    
+    # Playing thaws the frame so the next pause shows the new scene
+    game.state = STATE_PLAYING
+    game.draw(1.0)
+    assert game.menu.frozen is None
+    game.tick()
+    game.state = STATE_PAUSED
+    game.draw(1.0)
+    assert game.full_redraws == redraws + 2
+    print("✓ Frozen pause screen costs one blit and thaws on resume")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    print('='*60)
+    print('Testing Menu Caching')
+    print('='*60)
+    print()
+    
+    test_menu_surfaces_are_cached()
+    test_frozen_pause_screen()
+    
+    print()
+    print('='*60)
+    print('All menu caching tests passed!')
+    print('='*60)
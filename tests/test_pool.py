@@ -0,0 +1,94 @@
+"""
+Test object pooling of enemies and projectiles
+"""
+import pygame
+import os
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+from constants import *
+from game import Game
+from enemy import Enemy
+from projectile import Projectile
+from pool import SpritePool
+
+
+def test_pool_recycles_killed_sprites():
+    """Test that killed sprites are reset and handed out again"""
+    pygame.init()
+    pool = SpritePool(Projectile)
+    projectiles = pygame.sprite.Group()
+    
+    first = pool.acquire(10, 10, (1, 0))
+    first.hit_generators.add('generator')
+    projectiles.add(first)
+    first.kill()
+    first.kill()  # Killing twice must not release twice
+    assert pool.stats()['free'] == 1
+    
+    second = pool.acquire(50, 60, (0, -1))
+    assert second is first, "Pool should hand back the killed projectile"
+    assert second.rect.center == (50, 60)
+    assert second.direction == (0, -1)
+    assert second.hit_generators == set()
+    assert not second.alive(), "Recycled sprites start outside every group"
+    
+    stats = pool.stats()
+    assert (stats['hits'], stats['misses'], stats['free']) == (1, 1, 0)
+    assert stats['hit_rate'] == 0.5
+    print("✓ Pool recycles killed sprites")
+    pygame.quit()
+
+
+def test_unpooled_sprites_are_unaffected():
+    """Test that sprites created directly never enter a pool"""
+    pygame.init()
+    enemies = pygame.sprite.Group()
+    enemy = Enemy(100, 100)
+    enemies.add(enemy)
+    enemy.kill()
+    assert enemy.pool is None
+    assert not enemy.alive()
+    print("✓ Directly created sprites are not pooled")
+    pygame.quit()
+
+
+def test_game_reuses_enemies_and_projectiles():
+    """Test that the game recycles enemies from generators and player shots"""
+    pygame.init()
+    game = Game()
+    game.state = STATE_PLAYING
+    
+    game.update(SPAWN_INTERVAL)
+    spawned = game.enemies.sprites()
+    assert len(spawned) == len(game.game_map.generators)
+    for enemy in spawned:
+        enemy.kill()
+    game.update(SPAWN_INTERVAL * 2)
+    assert set(game.enemies.sprites()) == set(spawned), "Respawned enemies should be recycled"
+    assert game.enemy_pool.stats()['hits'] == len(spawned)
+    
+    game.shoot(1000)
+    projectile = game.projectiles.sprites()[0]
+    game.reset_game()
+    assert len(game.enemies) == 0 and len(game.projectiles) == 0
+    game.shoot(1000)
+    assert game.projectiles.sprites() == [projectile]
+    assert game.projectile_pool.stats()['hits'] == 1
+    print("✓ Game recycles enemies and projectiles")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    print('='*60)
+    print('Testing Object Pools')
+    print('='*60)
+    print()
+    
+    test_pool_recycles_killed_sprites()
+    test_unpooled_sprites_are_unaffected()
+    test_game_reuses_enemies_and_projectiles()
+    
+    print()
+    print('='*60)
+    print('All pool tests passed!')
+    print('='*60)
@@ -0,0 +1,117 @@
+"""
+Test deterministic input recording and replay
+"""
+import pygame
+import os
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+from constants import *
+from simulation import Simulation
+from replay import InputRecorder, InputReplayer, ReplayKeys, KEY_BITS
+from game import Game
+
+MOVES = [pygame.K_RIGHT, pygame.K_DOWN, pygame.K_LEFT, pygame.K_UP, None]
+
+
+def world_state(sim):
+    """Summarize everything that should match between a run and its replay"""
+    return (sim.time, sim.player.health, sim.player.rect.topleft,
+            sorted(enemy.rect.topleft for enemy in sim.enemies),
+            sorted(projectile.rect.topleft for projectile in sim.projectiles),
+            sorted(generator.health for generator in sim.game_map.generators))
+
+
+def test_replay_reproduces_session():
+    """Test that replaying recorded input reproduces the exact game state"""
+    pygame.init()
+    sim = Simulation()
+    recorder = InputRecorder(sim.tick_rate, **sim.modes())
+    
+    for tick in range(600):
+        keys = ReplayKeys()
+        key = MOVES[(tick // 40) % len(MOVES)]
+        if key is not None:
+            keys = ReplayKeys(dict(KEY_BITS)[key])
+        shoot = tick % 7 == 0
+        if tick == 400:
+            sim.reset()
+            recorder.mark_reset()
+        recorder.record(keys, shoot)
+        sim.tick(keys, shoot)
+    
+    data = recorder.to_bytes()
+    assert len(data) < 700, "Recording should take about one byte per tick"
+    replayed = InputReplayer(data).play()
+    assert world_state(replayed) == world_state(sim)
+    print(f"✓ Replay of {len(recorder)} ticks matches the original session")
+    pygame.quit()
+
+
+def test_game_records_ticks():
+    """Test that the game logs one input byte per simulation tick"""
+    pygame.init()
+    game = Game()
+    game.state = STATE_PLAYING
+    recorder = game.start_recording()
+    
+    game.shot_pending = True
+    ticks = game.advance(game.tick_ms * 3 + 1)
+    assert ticks == 3
+    assert len(recorder) == 3
+    assert len(game.projectiles) == 1
+    
+    replayed = InputReplayer(recorder.to_bytes()).play()
+    assert world_state(replayed) == world_state(game.sim)
+    print("✓ Game records its ticks for replay")
+    pygame.quit()
+
+
+def test_replay_keeps_movement_modes():
+    """Test that recordings carry the modes that change enemy movement and check them on replay"""
+    pygame.init()
+    sim = Simulation(use_hpa=True, use_ai_lod=True, use_separation=True)
+    recorder = InputRecorder(sim.tick_rate, **sim.modes())
+    for tick in range(300):
+        keys = ReplayKeys(dict(KEY_BITS)[MOVES[(tick // 50) % 4]])
+        recorder.record(keys, tick % 9 == 0)
+        sim.tick(keys, tick % 9 == 0)
+    
+    replayer = InputReplayer(recorder.to_bytes())
+    assert replayer.modes == sim.modes()
+    replayed = replayer.play()
+    assert world_state(replayed) == world_state(sim) and len(sim.enemies) > 0
+    try:
+        replayer.play(Simulation(use_hpa=True))
+    except ValueError:
+        pass
+    else:
+        assert False, "Expected ValueError"
+    print(f"✓ Replay restores movement modes {sorted(k for k, v in replayer.modes.items() if v)}")
+    pygame.quit()
+
+
+def test_rejects_foreign_data():
+    """Test that loading something that is not a recording fails clearly"""
+    try:
+        InputReplayer(b'NOPE' + bytes(20))
+    except ValueError:
+        print("✓ Foreign data is rejected")
+    else:
+        assert False, "Expected ValueError"
+
+
+if __name__ == "__main__":
+    print('='*60)
+    print('Testing Input Replay')
+    print('='*60)
+    print()
+    
+    test_replay_reproduces_session()
+    test_game_records_ticks()
+    test_replay_keeps_movement_modes()
+    test_rejects_foreign_data()
+    
+    print()
+    print('='*60)
+    print('All replay tests passed!')
+    print('='*60)
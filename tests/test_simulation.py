@@ -0,0 +1,83 @@
+"""
+Test the headless simulation core
+"""
+import pygame
+import os
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+from constants import *
+from simulation import Simulation
+from game import Game
+
+
+class KeyState:
+    """Helper class to simulate key presses in tests"""
+    def __init__(self, active_key):
+        self.active_key = active_key
+    def __getitem__(self, key):
+        return key == self.active_key
+
+
+def test_simulation_runs_without_display():
+    """Test that the core steps the game rules with no display mode set"""
+    pygame.init()
+    sim = Simulation()
+    start_x = sim.player.rect.x
+    
+    ticks_to_spawn = int(SPAWN_INTERVAL / sim.tick_ms) + 1
+    for _ in range(ticks_to_spawn):
+        sim.tick(KeyState(pygame.K_RIGHT))
+    
+    assert pygame.display.get_surface() is None, "Simulation must not open a display"
+    assert sim.ticks == ticks_to_spawn
+    assert sim.player.rect.x > start_x, "Player should move from key input"
+    assert len(sim.enemies) == len(sim.game_map.generators), "Generators should have spawned"
+    print(f"✓ Simulation ran {sim.ticks} ticks headless")
+    pygame.quit()
+
+
+def test_simulation_shooting_and_death():
+    """Test shooting cooldown and the player death signal"""
+    pygame.init()
+    sim = Simulation()
+    sim.player.health = 10
+    sim.enemies.add(sim.enemy_pool.acquire(sim.player.rect.x, sim.player.rect.y))
+    assert sim.tick() is True
+    assert sim.player.health == 0
+    
+    sim.tick(shoot=True)
+    sim.tick(shoot=True)
+    assert len(sim.projectiles) == 1, "Cooldown should block the second shot"
+    
+    sim.reset()
+    assert sim.player.health == 1000
+    assert len(sim.enemies) == 0 and len(sim.projectiles) == 0
+    print("✓ Simulation handles shooting, death and reset")
+    pygame.quit()
+
+
+def test_game_wraps_simulation():
+    """Test that Game exposes the simulation state it renders"""
+    pygame.init()
+    game = Game()
+    assert game.player is game.sim.player
+    assert game.enemies is game.sim.enemies
+    assert game.game_map is game.sim.game_map
+    print("✓ Game is a shell over the simulation")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    print('='*60)
+    print('Testing Simulation Core')
+    print('='*60)
+    print()
+    
+    test_simulation_runs_without_display()
+    test_simulation_shooting_and_death()
+    test_game_wraps_simulation()
+    
+    print()
+    print('='*60)
+    print('All simulation tests passed!')
+    print('='*60)
@@ -0,0 +1,107 @@
+"""
+Test compact snapshot and restore of simulation state
+"""
+import pygame
+import os
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+from constants import *
+from simulation import Simulation
+from replay import ReplayKeys, KEY_BITS
+
+MOVES = [bit for _, bit in KEY_BITS]
+
+
+def play(sim, first_tick, last_tick):
+    """Drive a simulation with a fixed input script"""
+    keys = ReplayKeys()
+    for tick in range(first_tick, last_tick):
+        keys.bits = MOVES[(tick // 40) % len(MOVES)]
+        sim.tick(keys, shoot=tick % 7 == 0)
+
+
+def test_restore_continues_identically():
+    """Test that a restored simulation plays on exactly like the original"""
+    pygame.init()
+    # Fast spawning fills the map, so some enemies are in the AI scheduler's distant tier
+    params = {'spawn_interval': 100, 'player_health': 10 ** 9}
+    for mode in ('use_swarm', 'use_ai_lod', None):
+        modes = {mode: True} if mode else {}
+        original = Simulation(params=params, **modes)
+        play(original, 0, 400)
+        data = original.snapshot()
+        assert b'Surface' not in data
+        
+        restored = Simulation(params=params, **modes)
+        restored.restore(data)
+        assert restored.snapshot() == data
+        
+        play(original, 400, 900)
+        play(restored, 400, 900)
+        assert original.snapshot() == restored.snapshot()
+        assert original.enemy_count() > 0
+        print(f"✓ Restored {mode or 'sprite'} simulation matches the original ({len(data)} bytes)")
+    pygame.quit()
+
+
+def test_rollback_restores_generators_and_projectiles():
+    """Test rolling back over a destroyed generator and a projectile's hits"""
+    pygame.init()
+    sim = Simulation()
+    generator = sim.game_map.generators.sprites()[0]
+    generator.health = 2
+    projectile = sim.projectile_pool.acquire(0, 0, (1, 0))
+    projectile.hit_generators.add(generator)
+    sim.projectiles.add(projectile)
+    sim.last_shot_time = 1234
+    data = sim.snapshot()
+    
+    generator.take_damage()
+    generator.take_damage()
+    projectile.kill()
+    assert generator not in sim.game_map.generators
+    
+    sim.restore(data)
+    restored = sim.game_map.generators.sprites()[0]
+    assert len(sim.game_map.generators) == 4
+    assert restored.rect.topleft == generator.rect.topleft and restored.health == 2
+    assert len(sim.projectiles) == 1
+    restored_projectile = sim.projectiles.sprites()[0]
+    assert restored_projectile.direction == (1, 0)
+    assert restored_projectile.hit_generators == {restored}
+    assert sim.last_shot_time == 1234
+    print("✓ Destroyed generator and projectile hits are restored")
+    pygame.quit()
+
+
+def test_rejects_mismatched_snapshot():
+    """Test that foreign data and mismatched movement modes are rejected"""
+    pygame.init()
+    data = Simulation().snapshot()
+    mismatched = [Simulation(**{mode: True}) for mode in
+                  ('use_swarm', 'use_hpa', 'use_ai_lod', 'use_separation')]
+    for target, bad in [(sim, data) for sim in mismatched] + [(Simulation(), b'PGRC' + data[4:])]:
+        try:
+            target.restore(bad)
+        except ValueError:
+            pass
+        else:
+            assert False, "Expected ValueError"
+    print("✓ Mismatched snapshots are rejected")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    print('='*60)
+    print('Testing Snapshots')
+    print('='*60)
+    print()
+    
+    test_restore_continues_identically()
+    test_rollback_restores_generators_and_projectiles()
+    test_rejects_mismatched_snapshot()
+    
+    print()
+    print('='*60)
+    print('All snapshot tests passed!')
+    print('='*60)
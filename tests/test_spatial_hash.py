@@ -0,0 +1,94 @@
+"""
+Test the spatial hash broadphase
+"""
+import pygame
+import random
+import os
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+from constants import *
+from enemy import Enemy
+from generator import Generator
+from projectile import Projectile
+from spatial_hash import SpatialHash
+
+
+def test_spatial_hash_matches_spritecollide():
+    """Test that hash queries find exactly what spritecollide finds"""
+    pygame.init()
+    rng = random.Random(7)
+    enemies = pygame.sprite.Group()
+    for _ in range(300):
+        enemies.add(Enemy(rng.randrange(1000), rng.randrange(1000)))
+    
+    enemy_hash = SpatialHash()
+    enemy_hash.rebuild(enemies)
+    assert len(enemy_hash) == 300
+    
+    probe = Projectile(0, 0, (1, 0))
+    for _ in range(200):
+        probe.rect.center = (rng.randrange(1000), rng.randrange(1000))
+        expected = set(pygame.sprite.spritecollide(probe, enemies, False))
+        assert set(enemy_hash.spritecollide(probe)) == expected
+    print("✓ Spatial hash matches spritecollide")
+    pygame.quit()
+
+
+def test_spatial_hash_skips_killed_sprites():
+    """Test that sprites killed after the rebuild are ignored"""
+    pygame.init()
+    enemies = pygame.sprite.Group()
+    enemy = Enemy(100, 100)
+    enemies.add(enemy)
+    enemy_hash = SpatialHash()
+    enemy_hash.rebuild(enemies)
+    
+    probe = Projectile(enemy.rect.centerx, enemy.rect.centery, (1, 0))
+    assert enemy_hash.spritecollide(probe, True) == [enemy]
+    assert not enemy.alive()
+    assert enemy_hash.spritecollide(probe) == []
+    print("✓ Spatial hash ignores killed sprites")
+    pygame.quit()
+
+
+def test_projectile_uses_spatial_hash():
+    """Test that projectiles damage generators and kill enemies through a hash"""
+    pygame.init()
+    generator = Generator(10, 10)
+    generators = pygame.sprite.Group(generator)
+    generator_hash = SpatialHash()
+    generator_hash.rebuild(generators)
+    
+    projectile = Projectile(generator.rect.centerx - 10, generator.rect.centery, (1, 0))
+    projectiles = pygame.sprite.Group(projectile)
+    projectile.update(pygame.sprite.Group(), SpatialHash(), generator_hash)
+    assert generator.health == 2
+    assert not projectile.alive()
+    
+    enemy = Enemy(300, 300)
+    enemies = pygame.sprite.Group(enemy)
+    enemy_hash = SpatialHash()
+    enemy_hash.rebuild(enemies)
+    projectile = Projectile(enemy.rect.centerx - 10, enemy.rect.centery, (1, 0))
+    projectiles.add(projectile)
+    projectile.update(pygame.sprite.Group(), enemy_hash, SpatialHash())
+    assert not enemy.alive()
+    assert not projectile.alive()
+    print("✓ Projectiles collide through spatial hashes")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    print('='*60)
+    print('Testing Spatial Hash')
+    print('='*60)
+    print()
+    
+    test_spatial_hash_matches_spritecollide()
+    test_spatial_hash_skips_killed_sprites()
+    test_projectile_uses_spatial_hash()
+    
+    print()
+    print('='*60)
+    print('All spatial hash tests passed!')
+    print('='*60)
@@ -0,0 +1,140 @@
+"""
+Test the event-driven generator spawn scheduler
+"""
+import pygame
+import os
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+from constants import *
+from game_map import GameMap
+from generator import Generator
+from spawn_scheduler import SpawnScheduler
+from simulation import Simulation
+from game import Game
+
+
+def run_ticks(game_map, update, ticks=300):
+    """Step a map's generators for a number of ticks; returns who spawned on each"""
+    enemies = pygame.sprite.Group()
+    tick_ms = 1000 / SIM_TICK_RATE
+    log = []
+    for tick in range(1, ticks + 1):
+        before = {generator: generator.last_spawn_time for generator in game_map.generators}
+        update(tick * tick_ms, enemies)
+        log.append([generator.rect.topleft for generator in game_map.generators
+                    if generator.last_spawn_time != before[generator]])
+    return log, [enemy.rect.topleft for enemy in enemies]
+
+
+def test_matches_loop_over_every_generator():
+    """Test that the heap spawns exactly what a loop over all generators would, in order"""
+    pygame.init()
+    maps = [GameMap(), GameMap()]
+    for game_map in maps:
+        for index, generator in enumerate(game_map.generators):
+            generator.spawn_interval = 250 + 170 * index
+            generator.last_spawn_time = -40 * index
+    
+    def loop(current_time, enemies):
+        for generator in maps[0].generators:
+            generator.update(current_time, enemies)
+    
+    scheduler = SpawnScheduler(maps[1])
+    expected = run_ticks(maps[0], loop)
+    actual = run_ticks(maps[1], scheduler.update)
+    assert actual == expected
+    assert sum(map(len, actual[0])) > 40
+    assert any(len(spawns) > 1 for spawns in actual[0]), "Some ticks spawn from several generators"
+    print(f"✓ Same {len(actual[1])} spawns as the per-tick loop, in the same order")
+    pygame.quit()
+
+
+def test_destroyed_added_and_retimed_generators():
+    """Test lazy removal, generators placed later and per-generator intervals"""
+    pygame.init()
+    game_map = GameMap()
+    scheduler = SpawnScheduler(game_map)
+    enemies = pygame.sprite.Group()
+    first, second = game_map.generators.sprites()[:2]
+    first.kill()
+    assert first in scheduler.entries, "Removal waits until the entry comes up"
+    scheduler.set_interval(second, 100)
+    placed = Generator(10, 5)
+    placed.last_spawn_time = 500
+    game_map.generators.add(placed)
+    
+    scheduler.update(SPAWN_INTERVAL, enemies)
+    assert first not in scheduler.entries and scheduler.spawned == 3
+    assert placed.last_spawn_time == 500, "A newly placed generator keeps its own timer"
+    spawned = {}
+    for current_time in range(SPAWN_INTERVAL + 10, 2 * SPAWN_INTERVAL + 500, 10):
+        scheduler.update(current_time, enemies)
+        for generator in game_map.generators:
+            if generator.last_spawn_time == current_time:
+                spawned[generator] = spawned.get(generator, 0) + 1
+    assert spawned[second] >= SPAWN_INTERVAL // 100 and spawned[placed] == 1
+    print(f"✓ Destroyed generators dropped lazily, new ones scheduled: {scheduler.stats()}")
+    pygame.quit()
+
+
+def test_pause_and_resume():
+    """Test that nothing spawns while paused and due times move by the paused span"""
+    pygame.init()
+    sim = Simulation()
+    scheduler = sim.spawn_scheduler
+    generator = sim.game_map.generators.sprites()[0]
+    due = generator.next_spawn_time()
+    scheduler.pause(100)
+    assert scheduler.update(due + 5000, sim.enemies) == 0 and len(sim.enemies) == 0
+    scheduler.resume(1100)
+    assert generator.next_spawn_time() == due + 1000
+    assert scheduler.update(due + 999, sim.enemies) == 0
+    assert scheduler.update(due + 1000, sim.enemies) == len(sim.game_map.generators)
+    
+    # Restored snapshots reschedule from the generators' own timers
+    state = sim.snapshot()
+    for _ in range(SIM_TICK_RATE * 3):
+        sim.tick()
+    sim.restore(state)
+    assert all(entry[0] == entry[3].next_spawn_time() for entry in scheduler.entries.values())
+    print("✓ Spawns hold while paused and resume on the shifted schedule")
+    pygame.quit()
+
+
+def test_game_pause_keeps_schedule():
+    """Test that pausing the game stops its clock, so generators spawn on the same schedule"""
+    pygame.init()
+    game = Game()
+    game.set_state(STATE_PLAYING)
+    game.advance(game.tick_ms * 10)
+    generator = game.sim.game_map.generators.sprites()[0]
+    due = generator.next_spawn_time()
+    
+    game.set_state(STATE_PAUSED)
+    assert game.sim.spawn_scheduler.paused
+    game.advance(SPAWN_INTERVAL * 3)
+    assert game.sim.enemy_count() == 0
+    game.set_state(STATE_PLAYING)
+    assert not game.sim.spawn_scheduler.paused and generator.next_spawn_time() == due
+    while game.sim_time < due:
+        game.advance(game.tick_ms)
+    assert generator.last_spawn_time == game.sim_time and game.sim.enemy_count() > 0
+    print(f"✓ Game pause holds spawns and keeps the schedule (due at {due:.0f} ms)")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    print('='*60)
+    print('Testing Spawn Scheduler')
+    print('='*60)
+    print()
+    
+    test_matches_loop_over_every_generator()
+    test_destroyed_added_and_retimed_generators()
+    test_pause_and_resume()
+    test_game_pause_keeps_schedule()
+    
+    print()
+    print('='*60)
+    print('All spawn scheduler tests passed!')
+    print('='*60)
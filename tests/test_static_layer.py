@@ -0,0 +1,92 @@
+"""
+Test the cached static map layer
+"""
+import pygame
+import os
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+from constants import *
+from game_map import GameMap
+from camera import Camera
+from static_layer import StaticLayer
+from wall import Wall
+from helpers import Target
+
+
+def draw_sprites_directly(screen, game_map, camera):
+    """Reference rendering: blit every wall and generator sprite"""
+    screen.fill(BLACK)
+    for wall in game_map.walls:
+        screen.blit(wall.image, camera.apply(wall))
+    for generator in game_map.generators:
+        screen.blit(generator.image, camera.apply(generator))
+
+
+def draw_static_layer(screen, layer, camera):
+    """Rendering through the cached static layer"""
+    screen.fill(BLACK)
+    layer.draw(screen, camera.camera)
+
+
+def test_static_layer_matches_sprite_rendering():
+    """Test that chunked rendering is pixel-identical to blitting sprites"""
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    game_map = GameMap()
+    layer = StaticLayer(game_map)
+    camera = Camera(MAP_WIDTH * TILE_SIZE, MAP_HEIGHT * TILE_SIZE)
+    expected = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    
+    for x, y in [(0, 0), (500, 400), (700, 300), (10000, 10000)]:
+        camera.update(Target(x, y, size=1))
+        draw_sprites_directly(expected, game_map, camera)
+        draw_static_layer(screen, layer, camera)
+        assert pygame.image.tobytes(screen, 'RGB') == pygame.image.tobytes(expected, 'RGB')
+    print("✓ Static layer matches per-sprite rendering")
+    pygame.quit()
+
+
+def test_static_layer_caches_and_invalidates():
+    """Test that chunks are rendered once and re-rendered only after map changes"""
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    game_map = GameMap()
+    layer = StaticLayer(game_map)
+    camera = Camera(MAP_WIDTH * TILE_SIZE, MAP_HEIGHT * TILE_SIZE)
+    camera.update(Target(0, 0, size=1))
+    
+    layer.draw(screen, camera.camera)
+    rendered = layer.chunks_rendered
+    assert rendered > 0
+    layer.draw(screen, camera.camera)
+    assert layer.chunks_rendered == rendered, "Unchanged map should not re-render chunks"
+    
+    # Destroying a generator invalidates its chunk only
+    generator = [g for g in game_map.generators if g.rect.topleft == (5 * TILE_SIZE, 5 * TILE_SIZE)][0]
+    for _ in range(generator.health):
+        generator.take_damage()
+    layer.draw(screen, camera.camera)
+    assert layer.chunks_rendered == rendered + 1
+    
+    # So does adding a wall
+    game_map.walls.add(Wall(7, 7))
+    layer.draw(screen, camera.camera)
+    assert layer.chunks_rendered == rendered + 2
+    assert screen.get_at((7 * TILE_SIZE + 1, 7 * TILE_SIZE + 1))[:3] == GRAY
+    print("✓ Static layer caches chunks until the map changes")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    print('='*60)
+    print('Testing Static Layer')
+    print('='*60)
+    print()
+    
+    test_static_layer_matches_sprite_rendering()
+    test_static_layer_caches_and_invalidates()
+    
+    print()
+    print('='*60)
+    print('All static layer tests passed!')
+    print('='*60)
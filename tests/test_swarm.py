@@ -0,0 +1,115 @@
+"""
+Test the NumPy-backed enemy swarm
+"""
+import pygame
+import random
+import os
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+from constants import *
+from game import Game
+from game_map import GameMap
+from enemy import Enemy
+from projectile import Projectile
+from flow_field import FlowField
+from swarm import EnemySwarm
+from helpers import Target
+
+
+def run_side_by_side(use_flow_field):
+    """Move sprite enemies and swarm enemies with the same rules and compare"""
+    game_map = GameMap()
+    field = FlowField(game_map) if use_flow_field else None
+    target = Target.on_tile(15, 15)
+    rng = random.Random(3)
+    floor = [(x, y) for y in range(game_map.height) for x in range(game_map.width)
+             if not game_map.is_solid(x, y)]
+    
+    sprites = []
+    swarm = EnemySwarm(capacity=4)
+    for _ in range(100):
+        tile_x, tile_y = rng.choice(floor)
+        x = tile_x * TILE_SIZE + rng.randrange(4)
+        y = tile_y * TILE_SIZE + rng.randrange(4)
+        sprites.append(Enemy(x, y))
+        swarm.spawn(x, y)
+    
+    for _ in range(200):
+        if field is not None:
+            field.update(target)
+        for enemy in sprites:
+            enemy.update(target, game_map.walls, game_map, field)
+        swarm.update(target, game_map, field)
+    
+    for slot, enemy in enumerate(sprites):
+        assert (swarm.x[slot], swarm.y[slot]) == enemy.rect.topleft, \
+            f"Slot {slot} at {(swarm.x[slot], swarm.y[slot])}, sprite at {enemy.rect.topleft}"
+
+
+def test_swarm_matches_enemy_rules():
+    """Test that batched movement matches Enemy.update exactly"""
+    pygame.init()
+    run_side_by_side(use_flow_field=False)
+    print("✓ Swarm matches greedy Enemy movement")
+    run_side_by_side(use_flow_field=True)
+    print("✓ Swarm matches flow field Enemy movement")
+    pygame.quit()
+
+
+def test_swarm_collisions_and_slot_reuse():
+    """Test projectile hits, player contact and slot recycling"""
+    pygame.init()
+    swarm = EnemySwarm()
+    first = swarm.spawn(100, 100)
+    swarm.spawn(300, 300)
+    assert len(swarm) == 2
+    
+    projectile = Projectile(110, 110, (1, 0))
+    projectiles = pygame.sprite.Group(projectile)
+    projectile.update(pygame.sprite.Group(), swarm)
+    assert not projectile.alive(), "Projectile should be destroyed by the enemy"
+    assert len(swarm) == 1
+    
+    assert swarm.spawn(50, 50) == first, "Dead slots should be reused"
+    
+    damage = swarm.collide_player(Target(290, 290))
+    assert damage == [10]
+    assert len(swarm) == 1
+    print("✓ Swarm collisions kill enemies and slots are reused")
+    pygame.quit()
+
+
+def test_game_with_swarm():
+    """Test that generators spawn into the swarm and contact damages the player"""
+    pygame.init()
+    game = Game(use_swarm=True)
+    game.state = STATE_PLAYING
+    game.update(SPAWN_INTERVAL)
+    assert len(game.swarm) == len(game.game_map.generators)
+    assert len(game.enemies) == 0
+    
+    game.swarm.spawn(game.player.rect.x, game.player.rect.y)
+    health = game.player.health
+    game.update(SPAWN_INTERVAL + 1)
+    assert game.player.health == health - 10
+    
+    game.draw()
+    assert game.sprites_drawn + game.sprites_culled == len(game.swarm) + len(game.projectiles)
+    print("✓ Game runs with the enemy swarm")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    print('='*60)
+    print('Testing Enemy Swarm')
+    print('='*60)
+    print()
+    
+    test_swarm_matches_enemy_rules()
+    test_swarm_collisions_and_slot_reuse()
+    test_game_with_swarm()
+    
+    print()
+    print('='*60)
+    print('All swarm tests passed!')
+    print('='*60)
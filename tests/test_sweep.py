@@ -0,0 +1,96 @@
+"""
+Test swept projectile collision and grid traversal
+"""
+import pygame
+import os
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+from constants import *
+from game_map import GameMap
+from enemy import Enemy
+from projectile import Projectile
+from spatial_hash import SpatialHash
+from sweep import traverse_grid, sweep_rect
+
+
+def test_traverse_grid():
+    """Test that the DDA visits each crossed cell once, in order"""
+    cells = [(x, y) for x, y, t in traverse_grid(5, 5, 100, 0, 32)]
+    assert cells == [(0, 0), (1, 0), (2, 0), (3, 0)]
+    
+    cells = list(traverse_grid(40, 40, -30, -30, 32))
+    assert [(x, y) for x, y, t in cells] in ([(1, 1), (0, 1), (0, 0)], [(1, 1), (1, 0), (0, 0)])
+    assert [t for x, y, t in cells] == sorted(t for x, y, t in cells)
+    
+    assert sweep_rect(pygame.Rect(0, 0, 8, 8), 100, 0, pygame.Rect(50, 0, 8, 8)) == 0.42
+    assert sweep_rect(pygame.Rect(0, 0, 8, 8), 100, 0, pygame.Rect(50, 10, 8, 8)) is None
+    print("✓ Grid traversal and swept rect tests")
+
+
+def test_fast_projectile_does_not_tunnel():
+    """Test that a projectile faster than a tile stops at walls and enemies on its path"""
+    pygame.init()
+    game_map = GameMap()
+    enemies = pygame.sprite.Group()
+    
+    # Interior wall at x = 20, rows 5-14; the projectile would jump clean over it
+    projectile = Projectile(18 * TILE_SIZE, 8 * TILE_SIZE + 16, (1, 0))
+    projectile.speed = 4 * TILE_SIZE
+    group = pygame.sprite.Group(projectile)
+    projectile.update(game_map.walls, enemies)
+    assert not projectile.alive(), "Projectile should stop at the wall"
+    assert projectile.rect.right <= 21 * TILE_SIZE
+    
+    # An enemy between start and end is hit even though the end position misses it
+    enemy = Enemy(23 * TILE_SIZE, 8 * TILE_SIZE + 2)
+    enemies.add(enemy)
+    index = SpatialHash()
+    index.rebuild(enemies)
+    projectile = Projectile(22 * TILE_SIZE, 8 * TILE_SIZE + 16, (1, 0))
+    projectile.speed = 5 * TILE_SIZE
+    group.add(projectile)
+    projectile.update(game_map.walls, index)
+    assert not projectile.alive() and not enemy.alive()
+    print("✓ Fast projectiles stop at walls and hit enemies along their path")
+    pygame.quit()
+
+
+def test_swarm_sweep_matches_sprites():
+    """Test that the swarm's vectorized sweep finds the same first hits as sprites"""
+    from swarm import EnemySwarm
+    pygame.init()
+    swarm = EnemySwarm()
+    sprites = pygame.sprite.Group()
+    for x, y in ((300, 100), (200, 104), (200, 104), (150, 300)):
+        swarm.spawn(x, y)
+        sprites.add(Enemy(x, y))
+    
+    index = SpatialHash()
+    index.rebuild(sprites)
+    rect = pygame.Rect(100, 110, 8, 8)
+    t, slots = swarm.sweep(rect, 400, 0)
+    sprite_t, hits = index.sweep(rect, 400, 0)
+    assert t == sprite_t and len(slots) == len(hits) == 2
+    assert sorted(hit.rect.topleft for hit in hits) == [(200, 104), (200, 104)]
+    
+    assert swarm.sweep(rect, 400, 0, until=0.2) == (None, [])
+    swarm.sweep(rect, 400, 0, dokill=True)
+    assert len(swarm) == 2
+    print("✓ Swarm sweep matches the sprite sweep")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    print('='*60)
+    print('Testing Swept Collision')
+    print('='*60)
+    print()
+    
+    test_traverse_grid()
+    test_fast_projectile_does_not_tunnel()
+    test_swarm_sweep_matches_sprites()
+    
+    print()
+    print('='*60)
+    print('All swept collision tests passed!')
+    print('='*60)
@@ -0,0 +1,133 @@
+"""
+Test the GameMap tile grid and grid-backed wall collision
+"""
+import pygame
+import os
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+from constants import *
+from game_map import GameMap
+from wall import Wall
+from enemy import Enemy
+from projectile import Projectile
+
+
+def test_tile_grid_matches_walls():
+    """Test that every wall sprite is mirrored in the tile grid"""
+    pygame.init()
+    game_map = GameMap()
+    
+    for wall in game_map.walls:
+        tile_x = wall.rect.x // TILE_SIZE
+        tile_y = wall.rect.y // TILE_SIZE
+        assert game_map.get_tile(tile_x, tile_y) == TILE_WALL
+        assert game_map.is_solid(tile_x, tile_y)
+    
+    wall_tiles = {(w.rect.x // TILE_SIZE, w.rect.y // TILE_SIZE) for w in game_map.walls}
+    assert sum(game_map.tiles) == len(wall_tiles)
+    
+    assert game_map.get_tile_at(0, 0) == 'wall'
+    assert game_map.get_tile_at(5 * TILE_SIZE + 3, 6 * TILE_SIZE + 3) == 'floor'
+    assert game_map.is_solid_at(20 * TILE_SIZE + 5, 7 * TILE_SIZE + 5)
+    assert not game_map.is_solid(-1, -1), "Tiles outside the map should not be solid"
+    print("✓ Tile grid matches wall sprites")
+    pygame.quit()
+
+
+def test_solid_tiles_in_rect():
+    """Test rect queries against the tile grid"""
+    pygame.init()
+    game_map = GameMap()
+    
+    # Straddles the horizontal wall at y=10 between x=10 and x=11
+    rect = pygame.Rect(10 * TILE_SIZE + 20, 10 * TILE_SIZE - 4, 28, 28)
+    assert game_map.solid_tiles_in_rect(rect) == [(10, 10), (11, 10)]
+    assert game_map.rect_hits_solid(rect)
+    
+    # Touching a wall edge is not an overlap, matching pygame's colliderect
+    rect = pygame.Rect(10 * TILE_SIZE - 28, 10 * TILE_SIZE, 28, 28)
+    assert game_map.solid_tiles_in_rect(rect) == []
+    assert not game_map.rect_hits_solid(rect)
+    print("✓ Rect queries find overlapping solid tiles")
+    pygame.quit()
+
+
+def test_grid_tracks_wall_changes():
+    """Test that adding and removing walls updates the grid"""
+    pygame.init()
+    game_map = GameMap()
+    
+    wall = Wall(7, 7)
+    game_map.walls.add(wall)
+    assert game_map.is_solid(7, 7)
+    wall.kill()
+    assert not game_map.is_solid(7, 7)
+    
+    # The corner tile has two overlapping border walls; removing one keeps it solid
+    corner = [w for w in game_map.walls if w.rect.topleft == (0, 0)]
+    corner[0].kill()
+    assert game_map.is_solid(0, 0)
+    print("✓ Tile grid tracks wall additions and removals")
+    pygame.quit()
+
+
+def test_grid_collision_matches_sprite_collision():
+    """Test that grid-backed collision agrees with spritecollideany"""
+    pygame.init()
+    game_map = GameMap()
+    plain_walls = pygame.sprite.Group(game_map.walls.sprites())
+    
+    enemy = Enemy(0, 0)
+    for y in range(0, MAP_HEIGHT * TILE_SIZE, 7):
+        for x in range(0, MAP_WIDTH * TILE_SIZE, 7):
+            enemy.rect.topleft = (x, y)
+            assert enemy.check_collision(game_map.walls) == enemy.check_collision(plain_walls)
+    
+    # One step to the right carries the projectile into the wall at (10, 10)
+    projectile = Projectile(10 * TILE_SIZE - 4, 10 * TILE_SIZE + 16, (1, 0))
+    projectiles = pygame.sprite.Group(projectile)
+    projectile.update(game_map.walls, pygame.sprite.Group())
+    assert not projectile.alive(), "Projectile should be destroyed by the wall"
+    print("✓ Grid collision matches sprite collision")
+    pygame.quit()
+
+
+def test_layout_fits_other_map_sizes():
+    """Test that walls, generators and projectile bounds follow the map's own size"""
+    pygame.init()
+    for width, height in ((200, 20), (12, 9), (80, 60)):
+        game_map = GameMap(width, height)
+        for wall in game_map.walls:
+            assert game_map.in_bounds(wall.rect.x // TILE_SIZE, wall.rect.y // TILE_SIZE)
+        for generator in game_map.generators:
+            tile_x, tile_y = generator.rect.x // TILE_SIZE, generator.rect.y // TILE_SIZE
+            assert 0 < tile_x < width - 1 and 0 < tile_y < height - 1
+            assert not game_map.is_solid(tile_x, tile_y)
+    
+    # A projectile past the default map width is still inside a wider map
+    game_map = GameMap(200, 20)
+    enemies = pygame.sprite.Group()
+    projectile = Projectile(60 * TILE_SIZE, 16 * TILE_SIZE + 16, (1, 0))
+    projectiles = pygame.sprite.Group(projectile)
+    projectile.update(game_map.walls, enemies)
+    assert projectile.alive(), "Projectile inside a 200-tile map must keep flying"
+    print("✓ Layout and projectile bounds follow the map size")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    print('='*60)
+    print('Testing Tile Grid')
+    print('='*60)
+    print()
+    
+    test_tile_grid_matches_walls()
+    test_solid_tiles_in_rect()
+    test_grid_tracks_wall_changes()
+    test_grid_collision_matches_sprite_collision()
+    test_layout_fits_other_map_sizes()
+    
+    print()
+    print('='*60)
+    print('All tile grid tests passed!')
+    print('='*60)
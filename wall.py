@@ -3,14 +3,47 @@ Wall tile class
 """
 import pygame
 from constants import *
+from image_cache import get_surface
 
 class Wall(pygame.sprite.Sprite):
     """A wall tile that blocks movement"""
     
     def __init__(self, x, y):
         super().__init__()
-        self.image = pygame.Surface((TILE_SIZE, TILE_SIZE))
-        self.image.fill(GRAY)
+        self.image = get_surface('wall', (TILE_SIZE, TILE_SIZE), GRAY)
         self.rect = self.image.get_rect()
         self.rect.x = x * TILE_SIZE
         self.rect.y = y * TILE_SIZE
+
+
+class WallGroup(pygame.sprite.Group):
+    """Sprite group of walls that mirrors its membership into a map's tile grid"""
+    
+    def __init__(self, game_map):
+        super().__init__()
+        self.game_map = game_map
+        self.by_tile = {}  # (tile_x, tile_y) -> walls on that tile
+    
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        tile = (sprite.rect.x // TILE_SIZE, sprite.rect.y // TILE_SIZE)
+        self.by_tile.setdefault(tile, []).append(sprite)
+        self.game_map.set_tile(tile[0], tile[1], TILE_WALL)
+    
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        tile = (sprite.rect.x // TILE_SIZE, sprite.rect.y // TILE_SIZE)
+        walls = self.by_tile[tile]
+        walls.remove(sprite)
+        # Border corners are built twice, so only clear the tile once no wall is left on it
+        if not walls:
+            del self.by_tile[tile]
+            self.game_map.set_tile(tile[0], tile[1], TILE_FLOOR)
+    
+    def walls_at(self, tile_x, tile_y):
+        """Get the wall sprites on a tile"""
+        return self.by_tile.get((tile_x, tile_y), ())
+    
+    def collides_rect(self, rect):
+        """Check if a rect overlaps any wall using the tile grid"""
+        return self.game_map.rect_hits_solid(rect)